@@ -34,6 +34,10 @@ class APIConfig(BaseSettings):
     # MLB Stats API (free, official)
     mlb_api_base_url: str = "https://statsapi.mlb.com/api/v1"
     mlb_api_timeout: int = 30
+    # Keep-alive connections kept per host; should cover concurrent fetch threads
+    mlb_api_pool_size: int = 16
+    # Requests AsyncMLBStatsAPIClient runs at once; keep <= mlb_api_pool_size
+    mlb_api_max_concurrency: int = 8
 
     # Weather API (Open-Meteo - free, no key required)
     weather_api_url: str = "https://api.open-meteo.com/v1/forecast"
@@ -68,6 +72,8 @@ class CacheConfig(BaseSettings):
     enable_cache: bool = True
     cache_ttl_hours: int = 24
     cache_backend: str = 'mongodb'
+    cache_stale_while_revalidate: bool = False
+    cache_process_lock: bool = False
 
 
 class AppConfig(BaseSettings):
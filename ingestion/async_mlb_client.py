@@ -0,0 +1,206 @@
+"""
+Asyncio front end for the MLB Stats API client.
+
+AsyncMLBStatsAPIClient has the same methods as MLBStatsAPIClient, as
+coroutines, so independent requests can be overlapped with
+asyncio.gather() instead of being made back to back. Each call runs the
+synchronous client method in a worker thread; an asyncio.Semaphore caps
+how many run at once (APIConfig.mlb_api_max_concurrency).
+
+Because the synchronous methods do the work, sync and async callers use
+the same APICache keys and entries, the same single-flight coalescing,
+and the same pooled keep-alive session (ingestion.http_session).
+
+Usage:
+    async with AsyncMLBStatsAPIClient() as client:
+        lineups, away, home = await asyncio.gather(
+            client.get_game_lineups(game_id),
+            client.get_team_record('NYY', 2025),
+            client.get_team_record('BOS', 2025),
+        )
+"""
+
+import asyncio
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import APIConfig
+from config.logging_config import get_logger
+from ingestion.mlb_api_client import MLBStatsAPIClient, get_mlb_client
+
+logger = get_logger(__name__)
+
+
+class AsyncMLBStatsAPIClient:
+    """Async wrapper around MLBStatsAPIClient with bounded concurrency."""
+
+    def __init__(
+        self,
+        client: Optional[MLBStatsAPIClient] = None,
+        config: Optional[APIConfig] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        """
+        Initialize async client.
+
+        Args:
+            client: Synchronous client to delegate to (default: the shared client)
+            config: API configuration (if None, uses global settings)
+            max_concurrency: Maximum requests in flight at once
+                             (default: config.mlb_api_max_concurrency)
+        """
+        if config is None:
+            from config.settings import get_settings
+            config = get_settings().api
+
+        self.config = config
+        self.client = client or get_mlb_client()
+        self.max_concurrency = max_concurrency or config.mlb_api_max_concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _call(self, method: Callable, *args, **kwargs) -> Any:
+        """Run a synchronous client method in a worker thread, within the concurrency limit."""
+        # Created lazily so the semaphore belongs to the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            return await asyncio.to_thread(method, *args, **kwargs)
+
+    async def get_schedule(
+        self,
+        team: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        team_id: Optional[int] = None
+    ) -> List[Dict]:
+        """See MLBStatsAPIClient.get_schedule."""
+        return await self._call(self.client.get_schedule, team=team, start_date=start_date,
+                                end_date=end_date, team_id=team_id)
+
+    async def get_schedule_context(
+        self,
+        team_abbr: str,
+        game_date: str,
+        weeks_before: int = 2,
+        weeks_after: int = 2
+    ) -> Dict[str, List[Dict]]:
+        """See MLBStatsAPIClient.get_schedule_context."""
+        return await self._call(self.client.get_schedule_context, team_abbr, game_date,
+                                weeks_before=weeks_before, weeks_after=weeks_after)
+
+    async def get_game(self, game_id: int) -> Optional[Dict]:
+        """See MLBStatsAPIClient.get_game."""
+        return await self._call(self.client.get_game, game_id)
+
+    async def get_game_boxscore(self, game_id: int) -> Optional[str]:
+        """See MLBStatsAPIClient.get_game_boxscore."""
+        return await self._call(self.client.get_game_boxscore, game_id)
+
+    async def get_head_to_head_record(
+        self,
+        team_abbr: str,
+        opponent_abbr: str,
+        season: int,
+        before_date: Optional[str] = None
+    ) -> Dict[str, int]:
+        """See MLBStatsAPIClient.get_head_to_head_record."""
+        return await self._call(self.client.get_head_to_head_record, team_abbr, opponent_abbr,
+                                season, before_date=before_date)
+
+    async def get_player_stats(
+        self,
+        player_id: int,
+        stat_type: str = 'season',
+        season: Optional[int] = None
+    ) -> Optional[Dict]:
+        """See MLBStatsAPIClient.get_player_stats."""
+        return await self._call(self.client.get_player_stats, player_id, stat_type=stat_type, season=season)
+
+    async def get_team_roster(self, team_id: int, season: Optional[int] = None) -> List[Dict]:
+        """See MLBStatsAPIClient.get_team_roster."""
+        return await self._call(self.client.get_team_roster, team_id, season=season)
+
+    async def get_standings(self, league: str = 'MLB', season: Optional[int] = None) -> str:
+        """See MLBStatsAPIClient.get_standings."""
+        return await self._call(self.client.get_standings, league=league, season=season)
+
+    async def get_team_record(self, team_abbr: str, season: Optional[int] = None) -> Optional[Dict[str, int]]:
+        """See MLBStatsAPIClient.get_team_record."""
+        return await self._call(self.client.get_team_record, team_abbr, season)
+
+    async def get_game_lineups(self, game_id: int) -> Optional[Dict[str, List[Dict]]]:
+        """See MLBStatsAPIClient.get_game_lineups."""
+        return await self._call(self.client.get_game_lineups, game_id)
+
+    async def get_game_bench_players(self, game_id: int) -> Optional[Dict[str, List[Dict]]]:
+        """See MLBStatsAPIClient.get_game_bench_players."""
+        return await self._call(self.client.get_game_bench_players, game_id)
+
+    async def get_bullpen_with_usage(
+        self,
+        game_id: int,
+        starter_id: Optional[int] = None,
+        days_back: int = 3
+    ) -> Optional[Dict[str, List[Dict]]]:
+        """See MLBStatsAPIClient.get_bullpen_with_usage."""
+        return await self._call(self.client.get_bullpen_with_usage, game_id,
+                                starter_id=starter_id, days_back=days_back)
+
+    async def get_team_injuries(self, team_abbr: str) -> List[Dict]:
+        """See MLBStatsAPIClient.get_team_injuries."""
+        return await self._call(self.client.get_team_injuries, team_abbr)
+
+    async def get_recent_transactions(self, date: str, days_back: int = 3) -> List[Dict]:
+        """See MLBStatsAPIClient.get_recent_transactions."""
+        return await self._call(self.client.get_recent_transactions, date, days_back=days_back)
+
+    async def get_league_leaders(self, season: int, limit: int = 5) -> Dict[str, List[Dict]]:
+        """See MLBStatsAPIClient.get_league_leaders."""
+        return await self._call(self.client.get_league_leaders, season, limit=limit)
+
+    async def search_players(self, search_term: str, sport_id: int = 1) -> List[Dict]:
+        """See MLBStatsAPIClient.search_players."""
+        return await self._call(self.client.search_players, search_term, sport_id=sport_id)
+
+    async def get_todays_games(self) -> List[Dict]:
+        """See MLBStatsAPIClient.get_todays_games."""
+        return await self._call(self.client.get_todays_games)
+
+    async def get_player_info(self, player_id: int) -> Optional[Dict[str, Any]]:
+        """See MLBStatsAPIClient.get_player_info."""
+        return await self._call(self.client.get_player_info, player_id)
+
+    async def get_pitcher_season_stats(self, player_id: int, season: int) -> Optional[Dict[str, Any]]:
+        """See MLBStatsAPIClient.get_pitcher_season_stats."""
+        return await self._call(self.client.get_pitcher_season_stats, player_id, season)
+
+    async def get_batter_season_stats(self, player_id: int, season: int) -> Optional[Dict[str, Any]]:
+        """See MLBStatsAPIClient.get_batter_season_stats."""
+        return await self._call(self.client.get_batter_season_stats, player_id, season)
+
+    async def get_pitcher_season_stats_bulk(
+        self,
+        player_ids: List[int],
+        season: int
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """See MLBStatsAPIClient.get_pitcher_season_stats_bulk."""
+        return await self._call(self.client.get_pitcher_season_stats_bulk, player_ids, season)
+
+    async def get_batter_season_stats_bulk(
+        self,
+        player_ids: List[int],
+        season: int
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """See MLBStatsAPIClient.get_batter_season_stats_bulk."""
+        return await self._call(self.client.get_batter_season_stats_bulk, player_ids, season)
+
+    async def close(self):
+        """Release the client (the shared session stays open, as with the sync client)."""
+        self._semaphore = None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
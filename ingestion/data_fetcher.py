@@ -7,10 +7,14 @@ and integrates with cache layer for efficient data management.
 
 from typing import Dict, Any, Optional, List
 from tqdm import tqdm
-from ingestion.mlb_api_client import MLBStatsAPIClient
+from ingestion.mlb_api_client import get_mlb_client
+from ingestion.pitch_arsenals import get_arsenal_store
 from ingestion.pybaseball_client import get_pitcher_stats, get_pitch_mix, get_batter_stats, get_batter_fangraphs_stats
 from ingestion.weather_client import WeatherClient
-from utils.team_data import get_team_full_name, get_team_logo_url, get_player_headshot_url
+from utils.team_data import (
+    get_team_full_name, get_team_logo_url, get_player_headshot_url,
+    get_team_short_name, get_team_division, get_division_teams
+)
 from utils.real_season_data import fetch_division_teams_data
 from utils.re24_calculator import get_batter_season_re24
 from config.logging_config import get_logger
@@ -18,62 +22,6 @@ from config.logging_config import get_logger
 logger = get_logger(__name__)
 
 
-def get_division_from_team(team_abbr: str) -> str:
-    """Get division name for a team."""
-    divisions = {
-        # AL East
-        'NYY': 'AL East', 'BOS': 'AL East', 'TB': 'AL East',
-        'TOR': 'AL East', 'BAL': 'AL East',
-
-        # AL Central
-        'CLE': 'AL Central', 'MIN': 'AL Central', 'CWS': 'AL Central',
-        'DET': 'AL Central', 'KC': 'AL Central',
-
-        # AL West
-        'HOU': 'AL West', 'TEX': 'AL West', 'SEA': 'AL West',
-        'LAA': 'AL West', 'OAK': 'AL West',
-
-        # NL East
-        'ATL': 'NL East', 'PHI': 'NL East', 'NYM': 'NL East',
-        'MIA': 'NL East', 'WSH': 'NL East',
-
-        # NL Central
-        'MIL': 'NL Central', 'STL': 'NL Central', 'CHC': 'NL Central',
-        'CIN': 'NL Central', 'PIT': 'NL Central',
-
-        # NL West
-        'LAD': 'NL West', 'SD': 'NL West', 'SF': 'NL West',
-        'COL': 'NL West', 'ARI': 'NL West',
-    }
-    return divisions.get(team_abbr, 'Unknown')
-
-
-def get_division_teams(division: str) -> list[str]:
-    """Get all teams in a division."""
-    division_teams = {
-        'AL East': ['NYY', 'BOS', 'TB', 'TOR', 'BAL'],
-        'AL Central': ['CLE', 'MIN', 'CWS', 'DET', 'KC'],
-        'AL West': ['HOU', 'TEX', 'SEA', 'LAA', 'OAK'],
-        'NL East': ['ATL', 'PHI', 'NYM', 'MIA', 'WSH'],
-        'NL Central': ['MIL', 'STL', 'CHC', 'CIN', 'PIT'],
-        'NL West': ['LAD', 'SD', 'SF', 'COL', 'ARI'],
-    }
-    return division_teams.get(division, [])
-
-
-def get_team_short_name(team_abbr: str) -> str:
-    """Get short team name (e.g., 'Yankees' instead of 'New York Yankees')."""
-    short_names = {
-        'NYY': 'Yankees', 'BOS': 'Red Sox', 'TB': 'Rays', 'TOR': 'Blue Jays', 'BAL': 'Orioles',
-        'CLE': 'Guardians', 'MIN': 'Twins', 'CWS': 'White Sox', 'DET': 'Tigers', 'KC': 'Royals',
-        'HOU': 'Astros', 'TEX': 'Rangers', 'SEA': 'Mariners', 'LAA': 'Angels', 'OAK': 'Athletics',
-        'ATL': 'Braves', 'PHI': 'Phillies', 'NYM': 'Mets', 'MIA': 'Marlins', 'WSH': 'Nationals',
-        'MIL': 'Brewers', 'STL': 'Cardinals', 'CHC': 'Cubs', 'CIN': 'Reds', 'PIT': 'Pirates',
-        'LAD': 'Dodgers', 'SD': 'Padres', 'SF': 'Giants', 'COL': 'Rockies', 'ARI': 'Diamondbacks',
-    }
-    return short_names.get(team_abbr, team_abbr)
-
-
 def format_game_date(date_str: str) -> str:
     """Format date as 'Thursday, September 25th, 2025'."""
     from datetime import datetime
@@ -134,15 +82,15 @@ def fetch_game_data(
         'home_team_logo': get_team_logo_url(home_team),
         'game_date': game_date,
         'game_date_formatted': format_game_date(game_date),
-        'away_division': get_division_from_team(away_team),
-        'home_division': get_division_from_team(home_team),
+        'away_division': get_team_division(away_team),
+        'home_division': get_team_division(home_team),
     }
 
     # 2. Fetch game details from MLB API
     logger.info("Fetching game details from MLB API...")
     game_id = None
     try:
-        client = MLBStatsAPIClient()
+        client = get_mlb_client()
         schedule = client.get_schedule(team=home_team, start_date=game_date, end_date=game_date)
 
         if schedule:
@@ -197,31 +145,36 @@ def fetch_game_data(
     if pitcher_ids:
         logger.info("Fetching pitcher stats from MLB API and pitch mix from Statcast...")
 
+        # Both starters in one request
+        starter_stats = client.get_pitcher_season_stats_bulk(
+            [pid for pid in (pitcher_ids.get('away'), pitcher_ids.get('home')) if pid], season
+        )
+
         if pitcher_ids.get('away'):
             # Get stats from MLB API
-            away_pitcher_stats = client.get_pitcher_season_stats(pitcher_ids['away'], season)
+            away_pitcher_stats = starter_stats.get(pitcher_ids['away'])
             if away_pitcher_stats:
                 data['away_pitcher'] = away_pitcher_stats
             else:
                 logger.warning(f"Failed to fetch away pitcher stats from MLB API")
 
-            # Get pitch mix from Statcast (using pitcher name if available)
+            # Get pitch mix from the season's Statcast arsenals
             if pitcher_names and pitcher_names.get('away'):
-                away_pitcher_pitches = get_pitch_mix(pitcher_names['away'], season)
+                away_pitcher_pitches = get_pitch_mix(pitcher_names['away'], season, pitcher_id=pitcher_ids['away'])
                 if away_pitcher_pitches:
                     data['away_pitcher_pitches'] = away_pitcher_pitches
 
         if pitcher_ids.get('home'):
             # Get stats from MLB API
-            home_pitcher_stats = client.get_pitcher_season_stats(pitcher_ids['home'], season)
+            home_pitcher_stats = starter_stats.get(pitcher_ids['home'])
             if home_pitcher_stats:
                 data['home_pitcher'] = home_pitcher_stats
             else:
                 logger.warning(f"Failed to fetch home pitcher stats from MLB API")
 
-            # Get pitch mix from Statcast (using pitcher name if available)
+            # Get pitch mix from the season's Statcast arsenals
             if pitcher_names and pitcher_names.get('home'):
-                home_pitcher_pitches = get_pitch_mix(pitcher_names['home'], season)
+                home_pitcher_pitches = get_pitch_mix(pitcher_names['home'], season, pitcher_id=pitcher_ids['home'])
                 if home_pitcher_pitches:
                     data['home_pitcher_pitches'] = home_pitcher_pitches
 
@@ -237,6 +190,22 @@ def fetch_game_data(
         except Exception as e:
             logger.warning(f"Could not fetch lineups automatically: {e}")
 
+    # 4a. Fetch season stats for every lineup and bench batter in bulk; the
+    # per-player lookups below are then served from the cache
+    batter_ids = []
+    if lineups:
+        batter_ids.extend(
+            batter.get('player_id') for side in ('away', 'home')
+            for batter in lineups.get(side) or [] if isinstance(batter, dict)
+        )
+    if game_id:
+        bench = client.get_game_bench_players(game_id) or {}
+        batter_ids.extend(player['player_id'] for side in ('away', 'home') for player in bench.get(side, []))
+    batter_ids = [pid for pid in batter_ids if pid]
+    if batter_ids:
+        logger.info(f"Fetching season stats for {len(set(batter_ids))} batters...")
+        client.get_batter_season_stats_bulk(batter_ids, season)
+
     # 5. Fetch lineup stats from MLB API (for each batter)
     if lineups:
         logger.info("Fetching lineup stats from MLB API...")
@@ -319,7 +288,7 @@ def fetch_game_data(
                 for batter in data[lineup_key]:
                     player_name = batter.get('name')
                     if player_name:
-                        fg_stats = get_batter_fangraphs_stats(player_name, season)
+                        fg_stats = get_batter_fangraphs_stats(player_name, season, batter.get('player_id'))
                         if fg_stats:
                             # Use FanGraphs oWAR and dWAR
                             batter['owar'] = fg_stats.get('owar', 0.0)
@@ -382,14 +351,20 @@ def fetch_game_data(
                 away_starter_id = pitcher_ids.get('away')
                 home_starter_id = pitcher_ids.get('home')
 
+                # Relievers' pitch mix, from the same season arsenals as the starters'
+                arsenals = get_arsenal_store().arsenals(season)
+
+                def with_arsenal(pitcher):
+                    return {**pitcher, 'pitch_mix': arsenals.get(pitcher['player_id']) if arsenals else []}
+
                 if bullpen_data.get('away'):
-                    away_bullpen = [p for p in bullpen_data['away'] if p['player_id'] != away_starter_id]
+                    away_bullpen = [with_arsenal(p) for p in bullpen_data['away'] if p['player_id'] != away_starter_id]
                     if away_bullpen:
                         data['away_bullpen'] = away_bullpen
                         logger.info(f"Retrieved {len(away_bullpen)} bullpen pitchers for {away_team}")
 
                 if bullpen_data.get('home'):
-                    home_bullpen = [p for p in bullpen_data['home'] if p['player_id'] != home_starter_id]
+                    home_bullpen = [with_arsenal(p) for p in bullpen_data['home'] if p['player_id'] != home_starter_id]
                     if home_bullpen:
                         data['home_bullpen'] = home_bullpen
                         logger.info(f"Retrieved {len(home_bullpen)} bullpen pitchers for {home_team}")
@@ -508,7 +483,7 @@ def fetch_game_data(
     # 8. Fetch head-to-head record for the season
     logger.info("Fetching head-to-head season record...")
     try:
-        client = MLBStatsAPIClient()
+        client = get_mlb_client()
         h2h_record = client.get_head_to_head_record(
             team_abbr=home_team,
             opponent_abbr=away_team,
@@ -0,0 +1,379 @@
+"""
+Store for MLB live game feeds, refreshed with diff patches.
+
+The live feed (statsapi.get('game', ...)) is 1-3 MB and holds everything
+the game previews need about one game: lineups, bench and bullpen all
+come from its boxscore. GameFeedStore downloads and parses each feed
+once and hands the same object to every reader, so those three lookups
+cost one request instead of three.
+
+Feeds are kept in a small in-memory LRU, and on disk (data/game_feeds)
+with the feed's timecode. When a feed is refreshed, later in the process
+or in a later run on game day, the store asks /feed/live/diffPatch for
+the changes since that timecode and applies them (JSON Patch), instead
+of downloading the whole feed again. It falls back to a full download
+when there is no stored feed, the API answers with a full feed, or a
+patch does not apply. changed() reports whether the last refresh moved
+anything, so callers can skip work when it didn't.
+
+In memory, feeds for games that aren't final are reused for
+FEED_MEMO_SECONDS; final feeds never change and are never refreshed.
+A stored feed is only a base for diff patches, so a final game's file is
+deleted (release()) once the lineups, bench and bullpen derived from it
+are cached.
+
+Usage:
+    store = get_game_feed_store()
+    feed = store.get(game_pk)
+    feed = store.get(game_pk, refresh=True)
+    if store.changed(game_pk):
+        ...
+"""
+
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import requests
+import statsapi
+
+from config.logging_config import get_logger
+from utils.atomic_io import atomic_write_json, content_checksum, quarantine_file
+
+logger = get_logger(__name__)
+
+# Feeds kept in memory (each is a few MB decoded)
+DEFAULT_MAX_FEEDS = 16
+
+# How long a feed for a game that isn't final is reused
+FEED_MEMO_SECONDS = 300
+
+# Changes to a live feed since a timecode (statsapi's game_diff endpoint
+# insists on an endTimecode, so it's called directly)
+DIFF_PATCH_URL = "https://statsapi.mlb.com/api/v1.1/game/{game_pk}/feed/live/diffPatch"
+
+
+def is_final_feed(feed: Dict) -> bool:
+    """Check whether a live feed is for a finished game."""
+    return feed.get('gameData', {}).get('status', {}).get('abstractGameState') == 'Final'
+
+
+def feed_timecode(feed: Dict) -> Optional[str]:
+    """The feed's timecode (e.g. '20240615_201530'), used as a diff base."""
+    return feed.get('metaData', {}).get('timeStamp')
+
+
+def _parse_pointer(path: str) -> List[str]:
+    """Split a JSON Pointer (RFC 6901) into unescaped tokens."""
+    if path == '':
+        return []
+    if not path.startswith('/'):
+        raise ValueError(f"Invalid JSON pointer: {path!r}")
+    return [token.replace('~1', '/').replace('~0', '~') for token in path[1:].split('/')]
+
+
+def _resolve(doc: Any, tokens: List[str]) -> Any:
+    """Follow pointer tokens from doc."""
+    for token in tokens:
+        doc = doc[int(token)] if isinstance(doc, list) else doc[token]
+    return doc
+
+
+def apply_json_patch(doc: Any, operations: List[Dict]) -> Any:
+    """
+    Apply JSON Patch (RFC 6902) operations to a document in place.
+
+    Args:
+        doc: Document to modify
+        operations: Patch operations ('add', 'remove', 'replace', 'move',
+                    'copy', 'test')
+
+    Returns:
+        The patched document (a new object if the root was replaced)
+
+    Raises:
+        ValueError: If an operation does not apply to the document
+    """
+    for operation in operations:
+        op = operation.get('op')
+        try:
+            tokens = _parse_pointer(operation['path'])
+
+            if op == 'test':
+                if _resolve(doc, tokens) != operation['value']:
+                    raise ValueError('test failed')
+                continue
+
+            if op in ('move', 'copy'):
+                source_tokens = _parse_pointer(operation['from'])
+                value = _resolve(doc, source_tokens)
+                if op == 'move':
+                    doc = apply_json_patch(doc, [{'op': 'remove', 'path': operation['from']}])
+                else:
+                    value = copy.deepcopy(value)
+                doc = apply_json_patch(doc, [{'op': 'add', 'path': operation['path'], 'value': value}])
+                continue
+
+            if not tokens:
+                # Whole-document operations
+                if op in ('add', 'replace'):
+                    doc = operation['value']
+                    continue
+                raise ValueError(f"cannot {op} the document root")
+
+            parent = _resolve(doc, tokens[:-1])
+            key = tokens[-1]
+
+            if isinstance(parent, list):
+                if op == 'add':
+                    index = len(parent) if key == '-' else int(key)
+                    if index > len(parent):
+                        raise IndexError(index)
+                    parent.insert(index, operation['value'])
+                elif op == 'remove':
+                    del parent[int(key)]
+                elif op == 'replace':
+                    parent[int(key)] = operation['value']
+                else:
+                    raise ValueError(f"unknown op {op!r}")
+            else:
+                if op == 'add':
+                    parent[key] = operation['value']
+                elif op == 'remove':
+                    del parent[key]
+                elif op == 'replace':
+                    if key not in parent:
+                        raise KeyError(key)
+                    parent[key] = operation['value']
+                else:
+                    raise ValueError(f"unknown op {op!r}")
+
+        except (KeyError, IndexError, TypeError, ValueError) as e:
+            raise ValueError(f"Patch {op} {operation.get('path')!r} failed: {e!r}") from e
+
+    return doc
+
+
+class GameFeedStore:
+    """Per-gamePk store of live game feeds, refreshed with diff patches."""
+
+    def __init__(
+        self,
+        feed_dir: str = "data/game_feeds",
+        max_feeds: int = DEFAULT_MAX_FEEDS,
+        memo_seconds: float = FEED_MEMO_SECONDS,
+        session: Optional[requests.Session] = None
+    ):
+        """
+        Initialize store.
+
+        Args:
+            feed_dir: Directory for feeds kept between runs
+            max_feeds: Maximum feeds kept in memory
+            memo_seconds: How long feeds for unfinished games are reused in memory
+            session: HTTP session for diff requests (default: the shared MLB session)
+        """
+        self.feed_dir = Path(feed_dir)
+        self.feed_dir.mkdir(parents=True, exist_ok=True)
+        self.max_feeds = max_feeds
+        self.memo_seconds = memo_seconds
+        self.session = session
+
+        # game_pk -> (fetched_at, feed, changed on last refresh)
+        self._feeds: "OrderedDict[int, Tuple[float, Dict, bool]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._fetch_locks: Dict[int, threading.Lock] = {}
+        self.counts = {'full_fetches': 0, 'patches': 0, 'unchanged': 0}
+
+    def _feed_path(self, game_pk: int) -> Path:
+        return self.feed_dir / f"{game_pk}.json"
+
+    def _lookup(self, game_pk: int) -> Optional[Dict]:
+        """Return a memoized feed that needs no refresh (caller holds self._lock)."""
+        entry = self._feeds.get(game_pk)
+        if entry is None:
+            return None
+        fetched_at, feed, _ = entry
+        if not is_final_feed(feed) and time.monotonic() - fetched_at > self.memo_seconds:
+            return None
+        self._feeds.move_to_end(game_pk)
+        return feed
+
+    def _remember(self, game_pk: int, feed: Dict, changed: bool) -> None:
+        with self._lock:
+            self._feeds[game_pk] = (time.monotonic(), feed, changed)
+            self._feeds.move_to_end(game_pk)
+            while len(self._feeds) > self.max_feeds:
+                self._feeds.popitem(last=False)
+
+    def _load(self, game_pk: int) -> Optional[Dict]:
+        """Load the feed kept from an earlier run, quarantining it if corrupt."""
+        path = self._feed_path(game_pk)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                stored = json.load(f)
+            if stored.get('_checksum') != content_checksum(stored['feed']):
+                raise ValueError('checksum mismatch')
+            return stored['feed']
+        except Exception as e:
+            quarantine_file(path, reason=str(e))
+            return None
+
+    def _save(self, game_pk: int, feed: Dict) -> None:
+        try:
+            atomic_write_json(self._feed_path(game_pk), {
+                'game_pk': game_pk,
+                'timecode': feed_timecode(feed),
+                'feed': feed,
+                '_checksum': content_checksum(feed)
+            }, indent=None)
+        except Exception as e:
+            logger.warning(f"Could not save live feed for game {game_pk}: {e}")
+
+    def _fetch_patches(self, game_pk: int, timecode: str) -> Any:
+        """Ask for changes since a timecode: a list of patches, or a full feed."""
+        if self.session is None:
+            from ingestion.http_session import get_mlb_session
+            self.session = get_mlb_session()
+        response = self.session.get(DIFF_PATCH_URL.format(game_pk=game_pk), params={'startTimecode': timecode})
+        response.raise_for_status()
+        return response.json()
+
+    def _update(self, game_pk: int) -> Optional[Dict]:
+        """Bring a game's feed up to date, patching the stored copy when possible."""
+        with self._lock:
+            entry = self._feeds.get(game_pk)
+        base = entry[1] if entry else self._load(game_pk)
+
+        if base is not None and is_final_feed(base):
+            # Nothing changes after the final out
+            self._remember(game_pk, base, changed=False)
+            return base
+
+        feed = None
+        changed = True
+        timecode = feed_timecode(base) if base is not None else None
+        if timecode:
+            try:
+                patches = self._fetch_patches(game_pk, timecode)
+                if isinstance(patches, dict):
+                    # Too far behind to patch: the API sent the whole feed
+                    feed = patches
+                    changed = feed_timecode(feed) != timecode
+                    self.counts['full_fetches'] += 1
+                elif not patches:
+                    feed, changed = base, False
+                    self.counts['unchanged'] += 1
+                else:
+                    # Readers may hold the stored feed; patch a copy
+                    feed = copy.deepcopy(base)
+                    for patch in patches:
+                        feed = apply_json_patch(feed, patch.get('diff', []))
+                    self.counts['patches'] += 1
+                    logger.info(f"Applied {len(patches)} diff patches to game {game_pk} since {timecode}")
+            except Exception as e:
+                logger.warning(f"Diff refresh failed for game {game_pk}, fetching full feed: {e}")
+                feed = None
+
+        if feed is None:
+            try:
+                feed = statsapi.get('game', {'gamePk': game_pk})
+            except Exception as e:
+                logger.error(f"Failed to get live feed for game {game_pk}: {e}", exc_info=True)
+                return None
+            changed = timecode is None or feed_timecode(feed) != timecode
+            self.counts['full_fetches'] += 1
+
+        self._remember(game_pk, feed, changed)
+        if changed:
+            self._save(game_pk, feed)
+        return feed
+
+    def get(self, game_pk: int, refresh: bool = False) -> Optional[Dict]:
+        """
+        Get a game's live feed.
+
+        The returned dict is shared with other readers and must not be
+        modified.
+
+        Args:
+            game_pk: MLB game PK
+            refresh: Check for changes even if the in-memory copy is recent
+
+        Returns:
+            Live feed dict, or None on failure
+        """
+        with self._lock:
+            feed = None if refresh else self._lookup(game_pk)
+            if feed is not None:
+                return feed
+            fetch_lock = self._fetch_locks.setdefault(game_pk, threading.Lock())
+
+        # One refresh per game at a time; concurrent readers wait for it
+        with fetch_lock:
+            if not refresh:
+                with self._lock:
+                    feed = self._lookup(game_pk)
+                if feed is not None:
+                    return feed
+            return self._update(game_pk)
+
+    def changed(self, game_pk: int) -> bool:
+        """
+        Whether the last refresh of a game's feed changed it.
+
+        True for a game whose feed was downloaded for the first time;
+        False for a final feed kept from an earlier run.
+        """
+        with self._lock:
+            entry = self._feeds.get(game_pk)
+        return entry is None or entry[2]
+
+    def release(self, game_pk: int) -> bool:
+        """
+        Delete the stored copy of a final feed (the feed stays in memory).
+
+        Args:
+            game_pk: MLB game PK
+
+        Returns:
+            True if a file was deleted; feeds not known to be final are kept
+        """
+        with self._lock:
+            entry = self._feeds.get(game_pk)
+        if entry is None or not is_final_feed(entry[1]):
+            return False
+        path = self._feed_path(game_pk)
+        if not path.exists():
+            return False
+        path.unlink(missing_ok=True)
+        logger.debug(f"Released stored live feed for final game {game_pk}")
+        return True
+
+    def invalidate(self, game_pk: int) -> None:
+        """Drop a game's feed from memory and disk."""
+        with self._lock:
+            self._feeds.pop(game_pk, None)
+        self._feed_path(game_pk).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Drop all feeds held in memory."""
+        with self._lock:
+            self._feeds.clear()
+
+
+# Global store instance
+_store: Optional[GameFeedStore] = None
+
+
+def get_game_feed_store() -> GameFeedStore:
+    """Get or create the global game feed store."""
+    global _store
+    if _store is None:
+        _store = GameFeedStore()
+    return _store
@@ -0,0 +1,155 @@
+"""
+Shared, pooled HTTP session for the MLB Stats API.
+
+The statsapi library calls module-level requests.get() for every request,
+which opens (and tears down) a new TCP+TLS connection each time. This
+module keeps one keep-alive requests.Session per process, with a
+connection pool sized from APIConfig.mlb_api_pool_size and the
+APIConfig.mlb_api_timeout applied to every request. It also routes
+statsapi through that session, so statsapi.get/schedule/standings_data
+and MLBStatsAPIClient's direct calls all reuse the same connections.
+
+Usage:
+    session = get_mlb_session()
+    ...
+    print(connection_stats())  # {'new_connections': 2, 'reused_connections': 48, ...}
+"""
+
+import threading
+from typing import Any, Dict, Optional
+import requests
+from requests.adapters import HTTPAdapter
+import statsapi
+
+from config.settings import APIConfig
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+USER_AGENT = 'baseball-stats/1.0'
+
+
+class TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to every request."""
+
+    def __init__(self, timeout: float):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+class StatsAPITransport:
+    """
+    Stands in for the `requests` module inside statsapi.
+
+    statsapi only uses requests.get(); it is sent through the shared
+    session. Anything else falls through to the real module.
+    """
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.session.get(url, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(requests, name)
+
+
+# Process-wide session (created on first use)
+_session: Optional[TimeoutSession] = None
+_session_lock = threading.Lock()
+
+
+def create_mlb_session(config: APIConfig) -> TimeoutSession:
+    """
+    Create a keep-alive session with a connection pool.
+
+    Args:
+        config: API configuration (pool size and timeout)
+
+    Returns:
+        Configured session
+    """
+    session = TimeoutSession(timeout=config.mlb_api_timeout)
+    session.headers.update({'User-Agent': USER_AGENT})
+
+    # pool_maxsize bounds idle keep-alive connections per host; it should be
+    # at least the number of threads issuing requests concurrently
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=config.mlb_api_pool_size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_mlb_session(config: Optional[APIConfig] = None) -> TimeoutSession:
+    """
+    Get or create the shared MLB Stats API session.
+
+    The first call also routes the statsapi library through the session.
+
+    Args:
+        config: API configuration, used only when creating the session
+                (default: global settings)
+
+    Returns:
+        Shared session
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            if config is None:
+                from config.settings import get_settings
+                config = get_settings().api
+
+            _session = create_mlb_session(config)
+            statsapi.requests = StatsAPITransport(_session)
+            logger.info(
+                f"MLB API session created (pool size: {config.mlb_api_pool_size}, "
+                f"timeout: {config.mlb_api_timeout}s)"
+            )
+        return _session
+
+
+def close_mlb_session() -> None:
+    """Close the shared session and restore statsapi's default transport."""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+            statsapi.requests = requests
+
+
+def connection_stats(session: Optional[requests.Session] = None) -> Dict[str, int]:
+    """
+    Count new vs reused TCP connections made through a session.
+
+    Based on urllib3's per-host pool counters: every request either opens
+    a new connection or reuses a pooled keep-alive one.
+
+    Args:
+        session: Session to inspect (default: the shared MLB session)
+
+    Returns:
+        Dict with 'requests', 'new_connections' and 'reused_connections'
+    """
+    session = session or _session
+    stats = {'requests': 0, 'new_connections': 0, 'reused_connections': 0}
+    if session is None:
+        return stats
+
+    for adapter in set(session.adapters.values()):
+        pools = adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            stats['requests'] += pool.num_requests
+            stats['new_connections'] += pool.num_connections
+
+    stats['reused_connections'] = max(stats['requests'] - stats['new_connections'], 0)
+    return stats
@@ -6,21 +6,54 @@ retry logic and caching support.
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 import statsapi
-import requests
 
 from config.settings import APIConfig, get_settings
 from config.logging_config import get_logger
-from utils.api_cache import get_api_cache
+from ingestion.game_feed import get_game_feed_store, is_final_feed
+from ingestion.season_schedule import get_season_schedule
+from ingestion.http_session import get_mlb_session
+from utils.api_cache import FINAL_GAME_STATUSES, get_api_cache
+from utils.team_data import get_player_headshot_url, get_team_abbr, get_team_abbr_by_name, get_team_id
 
 logger = get_logger(__name__)
 
 # Get shared cache instance
 _cache = get_api_cache()
 
+# Players per /people request (IDs go in the query string)
+PEOPLE_BATCH_SIZE = 50
+
+
+# Serializes updates to the per-game lists of cached bullpen params
+_bullpen_params_lock = threading.Lock()
+
+
+def _feed_entries(game_id: int) -> List[Tuple[str, Dict]]:
+    """
+    Cache entries (endpoint, params) derived from a game's live feed.
+
+    Bullpens are cached per starter_id and days_back, so every param set
+    cached for the game is listed (see _record_bullpen_params()).
+    """
+    bullpen_params = _cache.peek('mlb', 'game_bullpen_params', {'game_id': game_id}) or []
+    return [
+        ('game_lineups', {'game_id': game_id}),
+        ('game_bench', {'game_id': game_id}),
+    ] + [('game_bullpen', params) for params in bullpen_params]
+
+
+def _record_bullpen_params(game_id: int, cache_params: Dict) -> None:
+    """Add a bullpen param set to the game's list (kept for good; it is tiny)."""
+    with _bullpen_params_lock:
+        recorded = _cache.peek('mlb', 'game_bullpen_params', {'game_id': game_id}) or []
+        if cache_params not in recorded:
+            _cache.set('mlb', 'game_bullpen_params', {'game_id': game_id}, recorded + [cache_params], pin=True)
+
 
 class MLBStatsAPIClient:
     """
@@ -28,6 +61,10 @@ class MLBStatsAPIClient:
 
     Uses the statsapi library as a base with additional
     error handling and caching.
+
+    All requests (direct and through statsapi) share one pooled keep-alive
+    session (see ingestion.http_session), so a client can be reused for a
+    whole batch run; get_mlb_client() returns a shared instance.
     """
 
     def __init__(self, config: Optional[APIConfig] = None):
@@ -44,8 +81,8 @@ class MLBStatsAPIClient:
 
         self.config = config
         self.base_url = config.mlb_api_base_url
-        self.session = requests.Session()
-        self.session.headers.update({'User-Agent': 'baseball-stats/1.0'})
+        self.session = get_mlb_session(config)
+        self.feeds = get_game_feed_store()
 
     def get_schedule(
         self,
@@ -75,34 +112,37 @@ class MLBStatsAPIClient:
             if team and not team_id:
                 team_id = self._get_team_id(team)
 
-            # Check cache first
+            # Cached; concurrent callers for the same range share one fetch
             cache_params = {'team_id': team_id, 'start_date': start_date, 'end_date': end_date}
-            cached = _cache.get('mlb', 'schedule', cache_params)
-            if cached is not None:
-                logger.debug(f"Cache hit for schedule: team={team}")
-                return cached
-
-            # Use statsapi library
-            schedule = statsapi.schedule(
-                start_date=start_date,
-                end_date=end_date,
-                team=team_id if team_id else ''
+            return _cache.get_or_fetch(
+                'mlb', 'schedule', cache_params,
+                lambda: self._fetch_schedule(team_id, start_date, end_date)
             )
 
-            logger.info(
-                f"Retrieved {len(schedule)} games for team={team} "
-                f"from {start_date} to {end_date}"
-            )
-
-            # Cache the result
-            _cache.set('mlb', 'schedule', cache_params, schedule)
-
-            return schedule
-
         except Exception as e:
             logger.error(f"Failed to get schedule: {e}", exc_info=True)
             return []
 
+    def _fetch_schedule(
+        self,
+        team_id: Optional[int],
+        start_date: Optional[str],
+        end_date: Optional[str]
+    ) -> List[Dict]:
+        """Fetch a schedule from the API (uncached). Raises on failure."""
+        # Use statsapi library
+        schedule = statsapi.schedule(
+            start_date=start_date,
+            end_date=end_date,
+            team=team_id if team_id else ''
+        )
+
+        logger.info(
+            f"Retrieved {len(schedule)} games for team_id={team_id} "
+            f"from {start_date} to {end_date}"
+        )
+        return schedule
+
     def get_schedule_context(
         self,
         team_abbr: str,
@@ -113,8 +153,8 @@ class MLBStatsAPIClient:
         """
         Get schedule context for calendar display.
 
-        Fetches the full season schedule (cached) and extracts a window
-        around the game date for the calendar display.
+        Slices a window around the game date out of the season schedule
+        index for the calendar display.
 
         Args:
             team_abbr: Team abbreviation
@@ -129,54 +169,57 @@ class MLBStatsAPIClient:
             ref_date = datetime.strptime(game_date, '%Y-%m-%d')
             season = ref_date.year
 
-            # Fetch full season schedule (will be cached)
-            season_start = f"{season}-03-01"
-            season_end = f"{season}-11-15"
-            all_games = self.get_schedule(team=team_abbr, start_date=season_start, end_date=season_end)
+            # Build calendar centered on game date
+            # Find the Sunday of the week containing game_date (weeks start on Sunday)
+            # weekday() returns 0=Mon, 6=Sun, so Sunday is (weekday + 1) % 7 days ago
+            days_since_sunday = (ref_date.weekday() + 1) % 7
+            game_week_sunday = ref_date - timedelta(days=days_since_sunday)
+
+            # Calculate calendar start (weeks_before weeks before game week)
+            cal_start = game_week_sunday - timedelta(weeks=weeks_before)
+
+            # Calculate calendar end (weeks_after weeks after game week, ending on Saturday)
+            cal_end = game_week_sunday + timedelta(weeks=weeks_after + 1) - timedelta(days=1)
+
+            # Slice the team's games in the calendar window out of the
+            # season schedule index (one league-wide fetch per season)
+            team_id = get_team_id(team_abbr)
+            all_games = get_season_schedule(season, client=self).team_games(
+                team_id, cal_start.strftime('%Y-%m-%d'), cal_end.strftime('%Y-%m-%d')
+            )
 
             # Split into previous and upcoming relative to game_date
             previous = [g for g in all_games if g['game_date'] < game_date]
             upcoming = [g for g in all_games if g['game_date'] >= game_date]
 
-            # Team abbreviation mapping for opponent display
-            team_name_to_abbr = {
-                'Yankees': 'NYY', 'Red Sox': 'BOS', 'Rays': 'TB', 'Blue Jays': 'TOR', 'Orioles': 'BAL',
-                'Guardians': 'CLE', 'Twins': 'MIN', 'White Sox': 'CWS', 'Tigers': 'DET', 'Royals': 'KC',
-                'Astros': 'HOU', 'Rangers': 'TEX', 'Mariners': 'SEA', 'Angels': 'LAA', 'Athletics': 'OAK',
-                'Braves': 'ATL', 'Phillies': 'PHI', 'Mets': 'NYM', 'Marlins': 'MIA', 'Nationals': 'WSH',
-                'Brewers': 'MIL', 'Cardinals': 'STL', 'Cubs': 'CHC', 'Reds': 'CIN', 'Pirates': 'PIT',
-                'Dodgers': 'LAD', 'Padres': 'SD', 'Giants': 'SF', 'Rockies': 'COL', 'Diamondbacks': 'ARI'
-            }
+            try:
+                tz = ZoneInfo(get_settings().app.timezone)
+            except Exception:
+                tz = None
 
-            def get_opponent_abbr(team_full_name: str) -> str:
-                """Convert full team name to abbreviation."""
-                for name, abbr in team_name_to_abbr.items():
-                    if name in team_full_name:
-                        return abbr
-                # Fallback: last word, 3 chars
-                return team_full_name.split()[-1][:3].upper() if team_full_name else 'TBD'
+            def get_opponent_abbr(opponent_id: Optional[int], opponent_name: str) -> str:
+                """Resolve the opponent by team ID, then by exact name."""
+                abbr = get_team_abbr(opponent_id) or get_team_abbr_by_name(opponent_name)
+                if abbr:
+                    return abbr
+                # Fallback (e.g. All-Star teams): last word, 3 chars
+                return opponent_name.split()[-1][:3].upper() if opponent_name else 'TBD'
 
             # Transform data to add opponent_abbr, result, score for template
-            def transform_game(game: Dict, team_abbr: str) -> Dict:
+            def transform_game(game: Dict) -> Dict:
                 """Add template-friendly fields to game data."""
-                # Determine if team is home or away by checking the team abbreviation
-                # in home_name. Note: home_name is the full name like "New York Yankees"
-                home_abbr = get_opponent_abbr(game.get('home_name', ''))
-                is_home = (home_abbr == team_abbr)
+                is_home = game.get('home_id') == team_id
 
                 # Get opponent
                 if is_home:
-                    opponent_full = game.get('away_name', '')
+                    opponent_abbr = get_opponent_abbr(game.get('away_id'), game.get('away_name', ''))
                     team_score = game.get('home_score', 0)
                     opp_score = game.get('away_score', 0)
                 else:
-                    opponent_full = game.get('home_name', '')
+                    opponent_abbr = get_opponent_abbr(game.get('home_id'), game.get('home_name', ''))
                     team_score = game.get('away_score', 0)
                     opp_score = game.get('home_score', 0)
 
-                # Get proper opponent abbreviation
-                opponent_abbr = get_opponent_abbr(opponent_full)
-
                 # Use "vs" for home games, "@" for away games
                 if is_home:
                     opponent_abbr = 'vs ' + opponent_abbr
@@ -197,12 +240,11 @@ class MLBStatsAPIClient:
                 
                 # Extract game time for upcoming (convert to configured timezone)
                 game_time = 'TBD'
-                if game.get('game_datetime'):
+                if game.get('game_datetime') and tz:
                     try:
                         # Parse UTC datetime
                         dt = datetime.fromisoformat(game['game_datetime'].replace('Z', '+00:00'))
                         # Convert to configured timezone
-                        tz = ZoneInfo(get_settings().app.timezone)
                         dt_local = dt.astimezone(tz)
                         game_time = dt_local.strftime('%-I:%M %p').lstrip('0')
                     except:
@@ -216,8 +258,8 @@ class MLBStatsAPIClient:
                 
                 return game
 
-            previous = [transform_game(g, team_abbr) for g in previous]
-            upcoming = [transform_game(g, team_abbr) for g in upcoming]
+            previous = [transform_game(g) for g in previous]
+            upcoming = [transform_game(g) for g in upcoming]
 
             # Build a proper calendar with off days filled in
             def build_calendar_with_off_days(games: list, start_date: datetime, end_date: datetime) -> list:
@@ -247,18 +289,6 @@ class MLBStatsAPIClient:
                     current += timedelta(days=1)
                 return calendar
 
-            # Build calendar centered on game date
-            # Find the Sunday of the week containing game_date (weeks start on Sunday)
-            # weekday() returns 0=Mon, 6=Sun, so Sunday is (weekday + 1) % 7 days ago
-            days_since_sunday = (ref_date.weekday() + 1) % 7
-            game_week_sunday = ref_date - timedelta(days=days_since_sunday)
-
-            # Calculate calendar start (weeks_before weeks before game week)
-            cal_start = game_week_sunday - timedelta(weeks=weeks_before)
-
-            # Calculate calendar end (weeks_after weeks after game week, ending on Saturday)
-            cal_end = game_week_sunday + timedelta(weeks=weeks_after + 1) - timedelta(days=1)
-
             # Combine all games for the calendar
             all_transformed = previous + upcoming
 
@@ -285,6 +315,9 @@ class MLBStatsAPIClient:
         Args:
             game_id: MLB game PK (primary key)
 
+        The live feed comes from the shared GameFeedStore, so it is
+        fetched once per game and must not be modified.
+
         Returns:
             Game data dict or None on failure
 
@@ -292,14 +325,48 @@ class MLBStatsAPIClient:
             >>> client = MLBStatsAPIClient()
             >>> game = client.get_game(717159)
         """
-        try:
-            game_data = statsapi.get('game', {'gamePk': game_id})
-            logger.info(f"Retrieved game data for gamePk={game_id}")
-            return game_data
+        return self.feeds.get(game_id)
 
-        except Exception as e:
-            logger.error(f"Failed to get game {game_id}: {e}", exc_info=True)
+    def refresh_game_feed(self, game_id: int) -> bool:
+        """
+        Check a game's live feed for changes since it was last fetched.
+
+        Uses diff patches against the feed kept from the previous run. When
+        the feed changed, the cached lineups, bench and bullpen derived from
+        it are dropped so the next lookups re-read it.
+
+        Args:
+            game_id: MLB game PK
+
+        Returns:
+            True if the feed changed (or was fetched for the first time)
+        """
+        if self.feeds.get(game_id, refresh=True) is None:
+            return False
+
+        changed = self.feeds.changed(game_id)
+        if changed:
+            for endpoint, params in _feed_entries(game_id):
+                _cache.invalidate('mlb', endpoint, params)
+        return changed
+
+    def _release_final_feed(self, game_id: int, game_data: Dict) -> None:
+        """Delete a final game's stored feed once the lineups, bench and a bullpen derived from it are cached."""
+        if not is_final_feed(game_data):
+            return
+        entries = _feed_entries(game_id)
+        if (all(_cache.has('mlb', endpoint, params) for endpoint, params in entries if endpoint != 'game_bullpen')
+                and any(_cache.has('mlb', endpoint, params) for endpoint, params in entries
+                        if endpoint == 'game_bullpen')):
+            self.feeds.release(game_id)
+
+    def _get_feed_with_boxscore(self, game_id: int) -> Optional[Dict]:
+        """Get a game's live feed from the shared store, or None if it has no boxscore."""
+        game_data = self.feeds.get(game_id)
+        if not game_data or 'liveData' not in game_data or 'boxscore' not in game_data['liveData']:
+            logger.warning(f"No boxscore data for game {game_id}")
             return None
+        return game_data
 
     def get_game_boxscore(self, game_id: int) -> Optional[str]:
         """
@@ -340,59 +407,9 @@ class MLBStatsAPIClient:
             Dict with 'wins' and 'losses' from team_abbr's perspective
         """
         try:
-            # Fetch full season schedule for the team (will be cached)
-            season_start = f"{season}-03-01"
-            season_end = f"{season}-11-15"
-            all_games = self.get_schedule(team=team_abbr, start_date=season_start, end_date=season_end)
-
-            # Team name to abbreviation mapping
-            team_name_to_abbr = {
-                'Yankees': 'NYY', 'Red Sox': 'BOS', 'Rays': 'TB', 'Blue Jays': 'TOR', 'Orioles': 'BAL',
-                'Guardians': 'CLE', 'Twins': 'MIN', 'White Sox': 'CWS', 'Tigers': 'DET', 'Royals': 'KC',
-                'Astros': 'HOU', 'Rangers': 'TEX', 'Mariners': 'SEA', 'Angels': 'LAA', 'Athletics': 'OAK',
-                'Braves': 'ATL', 'Phillies': 'PHI', 'Mets': 'NYM', 'Marlins': 'MIA', 'Nationals': 'WSH',
-                'Brewers': 'MIL', 'Cardinals': 'STL', 'Cubs': 'CHC', 'Reds': 'CIN', 'Pirates': 'PIT',
-                'Dodgers': 'LAD', 'Padres': 'SD', 'Giants': 'SF', 'Rockies': 'COL', 'Diamondbacks': 'ARI'
-            }
-
-            def get_abbr(team_full_name: str) -> str:
-                for name, abbr in team_name_to_abbr.items():
-                    if name in team_full_name:
-                        return abbr
-                return ''
-
-            wins = 0
-            losses = 0
-
-            for game in all_games:
-                # Skip if after cutoff date
-                if before_date and game.get('game_date', '') >= before_date:
-                    continue
-
-                # Check if this game is vs the opponent
-                home_abbr = get_abbr(game.get('home_name', ''))
-                away_abbr = get_abbr(game.get('away_name', ''))
-
-                if opponent_abbr not in (home_abbr, away_abbr):
-                    continue
-
-                # Skip if not final
-                if 'Final' not in game.get('status', ''):
-                    continue
-
-                # Determine if team won
-                is_home = (home_abbr == team_abbr)
-                if is_home:
-                    team_score = game.get('home_score', 0)
-                    opp_score = game.get('away_score', 0)
-                else:
-                    team_score = game.get('away_score', 0)
-                    opp_score = game.get('home_score', 0)
-
-                if team_score > opp_score:
-                    wins += 1
-                else:
-                    losses += 1
+            wins, losses = get_season_schedule(season, client=self).head_to_head(
+                get_team_id(team_abbr), get_team_id(opponent_abbr), before_date=before_date
+            )
 
             logger.info(f"Head-to-head {team_abbr} vs {opponent_abbr} ({season}): {wins}-{losses}")
             return {'wins': wins, 'losses': losses}
@@ -495,37 +512,37 @@ class MLBStatsAPIClient:
         if season is None:
             season = datetime.now().year
 
-        # Check cache first
         cache_params = {'team_abbr': team_abbr, 'season': season}
-        cached = _cache.get('mlb', 'team_record', cache_params)
-        if cached is not None:
-            return cached
-
         try:
-            team_id = self._get_team_id(team_abbr)
-            if not team_id:
-                return None
-
-            # Get standings data (both AL and NL)
-            for league_id in ['103', '104']:  # AL=103, NL=104
-                standings = statsapi.standings_data(leagueId=league_id, season=season)
-
-                # Search through all divisions
-                for division_data in standings.values():
-                    for team in division_data['teams']:
-                        if team.get('team_id') == team_id:
-                            logger.info(f"Found record for {team_abbr}: {team['w']}-{team['l']}")
-                            result = {'wins': team['w'], 'losses': team['l']}
-                            _cache.set('mlb', 'team_record', cache_params, result)
-                            return result
-
-            logger.warning(f"Team {team_abbr} not found in standings")
-            return None
+            return _cache.get_or_fetch(
+                'mlb', 'team_record', cache_params,
+                lambda: self._fetch_team_record(team_abbr, season)
+            )
 
         except Exception as e:
             logger.error(f"Failed to get team record for {team_abbr}: {e}", exc_info=True)
             return None
 
+    def _fetch_team_record(self, team_abbr: str, season: int) -> Optional[Dict[str, int]]:
+        """Fetch a team's record from the standings (uncached). Raises on failure."""
+        team_id = self._get_team_id(team_abbr)
+        if not team_id:
+            return None
+
+        # Get standings data (both AL and NL)
+        for league_id in ['103', '104']:  # AL=103, NL=104
+            standings = statsapi.standings_data(leagueId=league_id, season=season)
+
+            # Search through all divisions
+            for division_data in standings.values():
+                for team in division_data['teams']:
+                    if team.get('team_id') == team_id:
+                        logger.info(f"Found record for {team_abbr}: {team['w']}-{team['l']}")
+                        return {'wins': team['w'], 'losses': team['l']}
+
+        logger.warning(f"Team {team_abbr} not found in standings")
+        return None
+
     def get_game_lineups(self, game_id: int) -> Optional[Dict[str, List[Dict]]]:
         """
         Get batting lineups for both teams from game data.
@@ -544,10 +561,8 @@ class MLBStatsAPIClient:
             return cached
 
         try:
-            game_data = statsapi.get('game', {'gamePk': game_id})
-
-            if 'liveData' not in game_data or 'boxscore' not in game_data['liveData']:
-                logger.warning(f"No boxscore data for game {game_id}")
+            game_data = self._get_feed_with_boxscore(game_id)
+            if game_data is None:
                 return None
 
             boxscore = game_data['liveData']['boxscore']
@@ -577,7 +592,9 @@ class MLBStatsAPIClient:
                         })
 
             logger.info(f"Retrieved lineups for game {game_id}: {len(lineups['away'])} away, {len(lineups['home'])} home")
-            _cache.set('mlb', 'game_lineups', cache_params, lineups)
+            # Lineups of a finished game never change
+            _cache.set('mlb', 'game_lineups', cache_params, lineups, pin=is_final_feed(game_data))
+            self._release_final_feed(game_id, game_data)
             return lineups
 
         except Exception as e:
@@ -595,11 +612,15 @@ class MLBStatsAPIClient:
             Dict with 'away' and 'home' bench player lists, or None on failure
             Each bench player contains: name, position, player_id, number
         """
-        try:
-            game_data = statsapi.get('game', {'gamePk': game_id})
+        # Check cache first
+        cache_params = {'game_id': game_id}
+        cached = _cache.get('mlb', 'game_bench', cache_params)
+        if cached is not None:
+            return cached
 
-            if 'liveData' not in game_data or 'boxscore' not in game_data['liveData']:
-                logger.warning(f"No boxscore data for game {game_id}")
+        try:
+            game_data = self._get_feed_with_boxscore(game_id)
+            if game_data is None:
                 return None
 
             boxscore = game_data['liveData']['boxscore']
@@ -631,6 +652,8 @@ class MLBStatsAPIClient:
                     })
 
             logger.info(f"Retrieved bench for game {game_id}: {len(bench['away'])} away, {len(bench['home'])} home")
+            _cache.set('mlb', 'game_bench', cache_params, bench, pin=is_final_feed(game_data))
+            self._release_final_feed(game_id, game_data)
             return bench
 
         except Exception as e:
@@ -655,13 +678,15 @@ class MLBStatsAPIClient:
             Dict with 'away' and 'home' bullpen lists, or None on failure
             Each pitcher contains: name, number, recent_games (list of pitch counts)
         """
-        try:
-            from datetime import datetime, timedelta
-
-            game_data = statsapi.get('game', {'gamePk': game_id})
+        # Check cache first
+        cache_params = {'game_id': game_id, 'starter_id': starter_id, 'days_back': days_back}
+        cached = _cache.get('mlb', 'game_bullpen', cache_params)
+        if cached is not None:
+            return cached
 
-            if 'liveData' not in game_data or 'boxscore' not in game_data['liveData']:
-                logger.warning(f"No boxscore data for game {game_id}")
+        try:
+            game_data = self._get_feed_with_boxscore(game_id)
+            if game_data is None:
                 return None
 
             # Get game date
@@ -674,6 +699,7 @@ class MLBStatsAPIClient:
 
             boxscore = game_data['liveData']['boxscore']
             bullpen = {'away': [], 'home': []}
+            team_pitch_counts = {}
 
             for team_type in ['away', 'home']:
                 if team_type not in boxscore['teams']:
@@ -683,6 +709,10 @@ class MLBStatsAPIClient:
                 team_id = team_data.get('team', {}).get('id')
                 players = team_data.get('players', {})
 
+                # One pass over the team's recent boxscores covers every pitcher
+                if team_id not in team_pitch_counts:
+                    team_pitch_counts[team_id] = self.get_team_pitch_counts(team_id, game_date, days_back)
+
                 # Get all pitchers (excluding starter if provided)
                 for player_key, player in players.items():
                     position = player.get('position', {}).get('abbreviation', '')
@@ -696,13 +726,7 @@ class MLBStatsAPIClient:
                     if starter_id and player_id == starter_id:
                         continue
 
-                    # Get recent pitch counts for this pitcher
-                    recent_games = self._get_recent_pitch_counts(
-                        player_id,
-                        team_id,
-                        game_date,
-                        days_back
-                    )
+                    recent_games = team_pitch_counts[team_id].get(player_id, [])
 
                     bullpen[team_type].append({
                         'name': person.get('fullName', 'Unknown'),
@@ -719,78 +743,82 @@ class MLBStatsAPIClient:
                 )
 
             logger.info(f"Retrieved bullpen for game {game_id}: {len(bullpen['away'])} away, {len(bullpen['home'])} home")
+            # Usage in the days before a finished game never changes
+            _record_bullpen_params(game_id, cache_params)
+            _cache.set('mlb', 'game_bullpen', cache_params, bullpen, pin=is_final_feed(game_data))
+            self._release_final_feed(game_id, game_data)
             return bullpen
 
         except Exception as e:
             logger.error(f"Failed to get bullpen for game {game_id}: {e}", exc_info=True)
             return None
 
-    def _get_recent_pitch_counts(
+    def get_team_pitch_counts(
         self,
-        player_id: int,
         team_id: int,
         game_date: datetime,
         days_back: int
-    ) -> List[Dict]:
+    ) -> Dict[int, List[Dict]]:
         """
-        Get pitch counts for a pitcher's recent games.
+        Get pitch counts for every pitcher on a team over the days before a game.
+
+        Each game in the window is read once from its boxscore (cached, and
+        pinned once the game is final), instead of once per pitcher.
+
+        Args:
+            team_id: MLB team ID
+            game_date: Date of the upcoming game
+            days_back: Number of days to look back
 
         Returns:
-            List of dicts with 'date', 'pitches' for last N days
+            Dict of player ID -> list of dicts with 'date', 'pitches' and
+            'game_id', for games in which the pitcher threw a pitch
         """
-        try:
-            # Calculate date range
-            start_date = (game_date - timedelta(days=days_back)).strftime('%Y-%m-%d')
-            end_date = (game_date - timedelta(days=1)).strftime('%Y-%m-%d')
-
-            # Get team's schedule for this period
-            # We need to check all games the team played to see if this pitcher appeared
-            schedule = statsapi.schedule(
-                start_date=start_date,
-                end_date=end_date,
-                team=team_id
-            )
+        start_date = (game_date - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        end_date = (game_date - timedelta(days=1)).strftime('%Y-%m-%d')
+
+        usage: Dict[int, List[Dict]] = {}
+        for game in self.get_schedule(team_id=team_id, start_date=start_date, end_date=end_date):
+            game_id = game['game_id']
+            final = game.get('status') in FINAL_GAME_STATUSES
+            boxscore = self._get_boxscore(game_id, final)
+            if not boxscore:
+                continue
+
+            for team_data in boxscore.get('teams', {}).values():
+                if team_data.get('team', {}).get('id') != team_id:
+                    continue
+                for player in team_data.get('players', {}).values():
+                    pitches = int(player.get('stats', {}).get('pitching', {}).get('numberOfPitches', 0) or 0)
+                    if pitches > 0:
+                        usage.setdefault(player['person']['id'], []).append({
+                            'date': game['game_date'],
+                            'pitches': pitches,
+                            'game_id': game_id
+                        })
 
-            recent_usage = []
+        return usage
 
-            for game in schedule:
-                game_id = game['game_id']
-                game_dt = game['game_date']
-                
-                # Get boxscore for each game
-                # Note: This is expensive (N+1 queries), but necessary for accurate pitch counts
-                # Optimization: Could cache boxscores if we run this often
-                try:
-                    game_data = statsapi.get('game', {'gamePk': game_id})
-                    if 'liveData' not in game_data or 'boxscore' not in game_data['liveData']:
-                        continue
-                        
-                    boxscore = game_data['liveData']['boxscore']
-                    
-                    # Find player in boxscore
-                    for team_type in ['away', 'home']:
-                        team_data = boxscore['teams'][team_type]
-                        players = team_data.get('players', {})
-                        
-                        player_key = f'ID{player_id}'
-                        if player_key in players:
-                            player_stats = players[player_key].get('stats', {}).get('pitching', {})
-                            pitches = int(player_stats.get('numberOfPitches', 0))
-                            
-                            if pitches > 0:
-                                recent_usage.append({
-                                    'date': game_dt,
-                                    'pitches': pitches,
-                                    'game_id': game_id
-                                })
-                except Exception:
-                    continue
+    def _get_boxscore(self, game_id: int, final: bool = False) -> Optional[Dict]:
+        """
+        Get a game's boxscore JSON (cached; pinned when the game is final).
 
-            return recent_usage
+        Args:
+            game_id: MLB game PK
+            final: Whether the game is over, so its boxscore can't change
 
+        Returns:
+            Boxscore dict or None on failure
+        """
+        try:
+            return _cache.get_or_fetch(
+                'mlb', 'game_boxscore', {'game_id': game_id},
+                lambda: statsapi.get('game_boxscore', {'gamePk': game_id}),
+                pin=final
+            )
         except Exception as e:
-            logger.error(f"Error getting recent pitch counts for {player_id}: {e}")
-            return []
+            logger.error(f"Error getting boxscore for game {game_id}: {e}")
+            return None
 
     def get_team_injuries(self, team_abbr: str) -> List[Dict]:
         """
@@ -922,142 +950,114 @@ class MLBStatsAPIClient:
         Returns:
             Dict with 'batting' and 'pitching' leader lists
         """
-        # Check cache first
         cache_params = {'season': season, 'limit': limit}
-        cached = _cache.get('mlb', 'league_leaders', cache_params)
-        if cached is not None:
-            return cached
-
         try:
-            leaders = {'batting': [], 'pitching': []}
-            
-            # Team ID mapping
-            team_id_to_abbr = {
-                147: 'NYY', 111: 'BOS', 139: 'TB', 141: 'TOR', 110: 'BAL',
-                114: 'CLE', 142: 'MIN', 145: 'CWS', 116: 'DET', 118: 'KC',
-                117: 'HOU', 140: 'TEX', 136: 'SEA', 108: 'LAA', 133: 'OAK',
-                144: 'ATL', 143: 'PHI', 121: 'NYM', 146: 'MIA', 120: 'WSH',
-                158: 'MIL', 138: 'STL', 112: 'CHC', 113: 'CIN', 134: 'PIT',
-                119: 'LAD', 135: 'SD', 137: 'SF', 115: 'COL', 109: 'ARI'
+            return _cache.get_or_fetch(
+                'mlb', 'league_leaders', cache_params,
+                lambda: self._fetch_league_leaders(season, limit)
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to get league leaders: {e}", exc_info=True)
+            return {'batting': [], 'pitching': []}
+
+    def _fetch_league_leaders(self, season: int, limit: int) -> Dict[str, List[Dict]]:
+        """Fetch league leaders from the API (uncached). Raises on failure."""
+        leaders = {'batting': [], 'pitching': []}
+
+        url = f"{self.base_url}/stats/leaders"
+
+        # Batting (OPS, HR, AVG)
+        params = {
+            'leaderCategories': 'onBasePlusSlugging,homeRuns,battingAverage',
+            'season': season,
+            'limit': limit,
+            'sportId': 1,
+            'statGroup': 'hitting'
+        }
+
+        resp = self.session.get(url, params=params).json()
+
+        # Collect all player IDs
+        batter_ids = set()
+        pitcher_ids = set()
+
+        # Helper to extract IDs from response
+        def extract_ids(resp_json, category_list):
+            ids = set()
+            if 'leagueLeaders' in resp_json:
+                for cat in resp_json['leagueLeaders']:
+                    if cat['leaderCategory'] in category_list:
+                        for player in cat['leaders']:
+                            ids.add(player.get('person', {}).get('id'))
+            return ids
+
+        # Batting IDs
+        batter_ids = extract_ids(resp, ['onBasePlusSlugging', 'homeRuns', 'battingAverage'])
+
+        # Pitching IDs (need to fetch pitching leaders first to get IDs)
+        # Pitching (ERA, K, WHIP)
+        params['leaderCategories'] = 'earnedRunAverage,strikeouts,whip'
+        params['statGroup'] = 'pitching'
+        pitching_resp = self.session.get(url, params=params).json()
+        pitcher_ids = extract_ids(pitching_resp, ['earnedRunAverage', 'strikeouts', 'whip'])
+
+        # Batch fetch stats for batters
+        b_lookup = {}
+        for pid, person in self._fetch_people_stats(list(batter_ids), 'hitting', season).items():
+            stats = self._season_stat_line(person)
+            b_lookup[pid] = {
+                'OPS': stats.get('ops', '-'),
+                'HR': stats.get('homeRuns', '-'),
+                'AVG': stats.get('avg', '-')
             }
 
-            url = f"{self.base_url}/stats/leaders"
-            
-            # Batting (OPS, HR, AVG)
-            params = {
-                'leaderCategories': 'onBasePlusSlugging,homeRuns,battingAverage',
-                'season': season,
-                'limit': limit,
-                'sportId': 1,
-                'statGroup': 'hitting'
+        # Batch fetch stats for pitchers
+        p_lookup = {}
+        for pid, person in self._fetch_people_stats(list(pitcher_ids), 'pitching', season).items():
+            stats = self._season_stat_line(person)
+            p_lookup[pid] = {
+                'ERA': stats.get('era', '-'),
+                'K': stats.get('strikeOuts', '-'),
+                'WHIP': stats.get('whip', '-')
             }
-            
-            resp = self.session.get(url, params=params).json()
-            
-            # Collect all player IDs
-            batter_ids = set()
-            pitcher_ids = set()
-            
-            # Helper to extract IDs from response
-            def extract_ids(resp_json, category_list):
-                ids = set()
-                if 'leagueLeaders' in resp_json:
-                    for cat in resp_json['leagueLeaders']:
-                        if cat['leaderCategory'] in category_list:
-                            for player in cat['leaders']:
-                                ids.add(player.get('person', {}).get('id'))
-                return ids
-
-            # Batting IDs
-            batter_ids = extract_ids(resp, ['onBasePlusSlugging', 'homeRuns', 'battingAverage'])
-            
-            # Pitching IDs (need to fetch pitching leaders first to get IDs)
-            # Pitching (ERA, K, WHIP)
-            params['leaderCategories'] = 'earnedRunAverage,strikeouts,whip'
-            params['statGroup'] = 'pitching'
-            pitching_resp = self.session.get(url, params=params).json()
-            pitcher_ids = extract_ids(pitching_resp, ['earnedRunAverage', 'strikeouts', 'whip'])
-            
-            # Batch fetch stats for batters
-            if batter_ids:
-                b_ids_str = ",".join(str(i) for i in batter_ids)
-                b_stats = self.session.get(f"{self.base_url}/people", params={
-                    'personIds': b_ids_str,
-                    'hydrate': 'stats(group=[hitting],type=[season],season=2025)' # Hardcoded 2025 for now based on context, but should use season arg
-                }).json()
-                
-                # Create a lookup dict
-                b_lookup = {}
-                if 'people' in b_stats:
-                    for p in b_stats['people']:
-                        pid = p['id']
-                        stats = p.get('stats', [{}])[0].get('splits', [{}])[0].get('stat', {})
-                        b_lookup[pid] = {
-                            'OPS': stats.get('ops', '-'),
-                            'HR': stats.get('homeRuns', '-'),
-                            'AVG': stats.get('avg', '-')
-                        }
-            
-            # Batch fetch stats for pitchers
-            if pitcher_ids:
-                p_ids_str = ",".join(str(i) for i in pitcher_ids)
-                p_stats = self.session.get(f"{self.base_url}/people", params={
-                    'personIds': p_ids_str,
-                    'hydrate': 'stats(group=[pitching],type=[season],season=2025)'
-                }).json()
-                
-                p_lookup = {}
-                if 'people' in p_stats:
-                    for p in p_stats['people']:
-                        pid = p['id']
-                        stats = p.get('stats', [{}])[0].get('splits', [{}])[0].get('stat', {})
-                        p_lookup[pid] = {
-                            'ERA': stats.get('era', '-'),
-                            'K': stats.get('strikeOuts', '-'),
-                            'WHIP': stats.get('whip', '-')
-                        }
-
-            # Build final list using OPS leaders as base
-            if 'leagueLeaders' in resp:
-                ops_leaders = next((c for c in resp['leagueLeaders'] if c['leaderCategory'] == 'onBasePlusSlugging'), None)
-                if ops_leaders:
-                    for player in ops_leaders['leaders']:
-                        pid = player.get('person', {}).get('id')
-                        tid = player.get('team', {}).get('id')
-                        # Use hydrated stats if available, else fall back to leader value (which is just OPS)
-                        stats = b_lookup.get(pid, {})
-                        leaders['batting'].append({
-                            'rank': player.get('rank'),
-                            'name': player.get('person', {}).get('fullName'),
-                            'team': team_id_to_abbr.get(tid, 'MLB'),
-                            'OPS': stats.get('OPS', player.get('value')),
-                            'HR': stats.get('HR', '-'),
-                            'AVG': stats.get('AVG', '-')
-                        })
 
-            # Build final list using ERA leaders as base
-            if 'leagueLeaders' in pitching_resp:
-                era_leaders = next((c for c in pitching_resp['leagueLeaders'] if c['leaderCategory'] == 'earnedRunAverage'), None)
-                if era_leaders:
-                    for player in era_leaders['leaders']:
-                        pid = player.get('person', {}).get('id')
-                        tid = player.get('team', {}).get('id')
-                        stats = p_lookup.get(pid, {})
-                        leaders['pitching'].append({
-                            'rank': player.get('rank'),
-                            'name': player.get('person', {}).get('fullName'),
-                            'team': team_id_to_abbr.get(tid, 'MLB'),
-                            'ERA': stats.get('ERA', player.get('value')),
-                            'K': stats.get('K', '-'),
-                            'WHIP': stats.get('WHIP', '-')
-                        })
+        # Build final list using OPS leaders as base
+        if 'leagueLeaders' in resp:
+            ops_leaders = next((c for c in resp['leagueLeaders'] if c['leaderCategory'] == 'onBasePlusSlugging'), None)
+            if ops_leaders:
+                for player in ops_leaders['leaders']:
+                    pid = player.get('person', {}).get('id')
+                    tid = player.get('team', {}).get('id')
+                    # Use hydrated stats if available, else fall back to leader value (which is just OPS)
+                    stats = b_lookup.get(pid, {})
+                    leaders['batting'].append({
+                        'rank': player.get('rank'),
+                        'name': player.get('person', {}).get('fullName'),
+                        'team': get_team_abbr(tid) or 'MLB',
+                        'OPS': stats.get('OPS', player.get('value')),
+                        'HR': stats.get('HR', '-'),
+                        'AVG': stats.get('AVG', '-')
+                    })
 
-            _cache.set('mlb', 'league_leaders', cache_params, leaders)
-            return leaders
+        # Build final list using ERA leaders as base
+        if 'leagueLeaders' in pitching_resp:
+            era_leaders = next((c for c in pitching_resp['leagueLeaders'] if c['leaderCategory'] == 'earnedRunAverage'), None)
+            if era_leaders:
+                for player in era_leaders['leaders']:
+                    pid = player.get('person', {}).get('id')
+                    tid = player.get('team', {}).get('id')
+                    stats = p_lookup.get(pid, {})
+                    leaders['pitching'].append({
+                        'rank': player.get('rank'),
+                        'name': player.get('person', {}).get('fullName'),
+                        'team': get_team_abbr(tid) or 'MLB',
+                        'ERA': stats.get('ERA', player.get('value')),
+                        'K': stats.get('K', '-'),
+                        'WHIP': stats.get('WHIP', '-')
+                    })
 
-        except Exception as e:
-            logger.error(f"Failed to get league leaders: {e}", exc_info=True)
-            return {'batting': [], 'pitching': []}
+        return leaders
 
     def search_players(self, search_term: str, sport_id: int = 1) -> List[Dict]:
         """
@@ -1125,6 +1125,9 @@ class MLBStatsAPIClient:
         """
         Get pitcher season stats from MLB API.
 
+        One /people request with the season stats hydrated (see
+        get_pitcher_season_stats_bulk() for many players at once).
+
         Args:
             player_id: MLB player ID
             season: Season year
@@ -1132,70 +1135,15 @@ class MLBStatsAPIClient:
         Returns:
             Dict with formatted pitcher stats or None
         """
-        # Check cache first
-        cache_params = {'player_id': player_id, 'season': season}
-        cached = _cache.get('mlb', 'pitcher_stats', cache_params)
-        if cached is not None:
-            return cached
-
-        try:
-            # Use statsapi.player_stats() which properly handles stats fetching
-            stats_text = statsapi.player_stats(player_id, 'pitching', 'season')
-
-            # Parse the text output (statsapi returns formatted text)
-            # Extract stats from the text
-            stats_dict = {}
-            for line in stats_text.split('\n'):
-                if ': ' in line:
-                    key, value = line.split(': ', 1)
-                    stats_dict[key.strip()] = value.strip()
-
-            # Get player info for name, number, etc.
-            player_info = self.get_player_info(player_id)
-            person_data = statsapi.get('person', {'personId': player_id})
-            person = person_data['people'][0] if person_data.get('people') else {}
-
-            # Convert stats to our format
-            wins = int(stats_dict.get('wins', 0))
-            losses = int(stats_dict.get('losses', 0))
-            era = float(stats_dict.get('era', 0))
-            ip = float(stats_dict.get('inningsPitched', 0))
-            whip = float(stats_dict.get('whip', 0))
-
-            # Calculate rate stats
-            k9 = float(stats_dict.get('strikeoutsPer9Inn', 0))
-            bb9 = float(stats_dict.get('walksPer9Inn', 0))
-            hr9 = float(stats_dict.get('homeRunsPer9', 0))
-
-            result = {
-                'name': person.get('fullName', player_info.get('name', '') if player_info else ''),
-                'hand': person.get('pitchHand', {}).get('code', 'R'),
-                'number': int(player_info.get('number', 0)) if player_info else 0,
-                'headshot_url': f"https://img.mlbstatic.com/mlb-photos/image/upload/d_people:generic:headshot:67:current.png/w_213,q_auto:best/v1/people/{player_id}/headshot/67/current",
-                'WAR': 0.0,  # Not in basic stats, would need advanced endpoint
-                'wins': wins,
-                'losses': losses,
-                'ERA': era,
-                'IP': ip,
-                'K/9': k9,
-                'BB/9': bb9,
-                'HR/9': hr9,
-                'WHIP': whip,
-                'GB%': 45.0  # Not in basic stats
-            }
-
-            # Cache the result
-            _cache.set('mlb', 'pitcher_stats', cache_params, result)
-            return result
-
-        except Exception as e:
-            logger.error(f"Error getting pitcher stats for {player_id}: {e}", exc_info=True)
-            return None
+        return self.get_pitcher_season_stats_bulk([player_id], season).get(player_id)
 
     def get_batter_season_stats(self, player_id: int, season: int) -> Optional[Dict[str, Any]]:
         """
         Get batter season stats from MLB API.
 
+        One /people request with the season stats hydrated (see
+        get_batter_season_stats_bulk() for many players at once).
+
         Args:
             player_id: MLB player ID
             season: Season year
@@ -1203,62 +1151,179 @@ class MLBStatsAPIClient:
         Returns:
             Dict with formatted batter stats or None
         """
-        # Check cache first
-        cache_params = {'player_id': player_id, 'season': season}
-        cached = _cache.get('mlb', 'batter_stats', cache_params)
-        if cached is not None:
-            return cached
+        return self.get_batter_season_stats_bulk([player_id], season).get(player_id)
 
-        try:
-            # Use statsapi.player_stats() which properly handles stats fetching
-            stats_text = statsapi.player_stats(player_id, 'hitting', 'season')
-
-            # Parse the text output
-            stats_dict = {}
-            for line in stats_text.split('\n'):
-                if ': ' in line:
-                    key, value = line.split(': ', 1)
-                    stats_dict[key.strip()] = value.strip()
-
-            # Get player info
-            person_data = statsapi.get('person', {'personId': player_id})
-            person = person_data['people'][0] if person_data.get('people') else {}
-
-            # Extract stats
-            avg = float(stats_dict.get('avg', 0))
-            obp = float(stats_dict.get('obp', 0))
-            slg = float(stats_dict.get('slg', 0))
-            slash = f".{int(avg*1000):03d}/.{int(obp*1000):03d}/.{int(slg*1000):03d}"
-
-            # Calculate OPS
-            ops = obp + slg
-
-            # OPS+ (if available, otherwise estimate from OPS)
-            ops_plus = 100  # Default, would need league average to calculate
-
-            result = {
-                'name': person.get('fullName', ''),
-                'player_id': player_id,
-                'age': person.get('currentAge', 0),
-                'war': 0.0,  # Not in basic stats
-                'slash': slash,
-                'ops': ops,
-                'ops_plus': ops_plus,
-                'hr': int(stats_dict.get('homeRuns', 0)),
-                'rbi': int(stats_dict.get('rbi', 0)),
-                'tb': int(stats_dict.get('totalBases', 0)),
-                'sb': int(stats_dict.get('stolenBases', 0)),
-                'owar': 0.0,
-                'dwar': 0.0
-            }
+    def get_batter_season_stats_bulk(
+        self,
+        player_ids: List[int],
+        season: int
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Get season stats for many batters in as few requests as possible.
 
-            # Cache the result
-            _cache.set('mlb', 'batter_stats', cache_params, result)
-            return result
+        Cached players are served from the cache; the rest are fetched with
+        /people?personIds=...&hydrate=stats(...) (PEOPLE_BATCH_SIZE per
+        request) and stored under the same per-player cache entries that
+        get_batter_season_stats() reads.
+
+        Args:
+            player_ids: MLB player IDs
+            season: Season year
+
+        Returns:
+            Dict of player ID -> formatted batter stats (None if not found)
+        """
+        return self._season_stats_bulk('batter_stats', 'hitting', self._build_batter_stats, player_ids, season)
+
+    def get_pitcher_season_stats_bulk(
+        self,
+        player_ids: List[int],
+        season: int
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """
+        Get season stats for many pitchers in as few requests as possible.
+
+        See get_batter_season_stats_bulk(); results share the per-player
+        cache entries of get_pitcher_season_stats().
+
+        Args:
+            player_ids: MLB player IDs
+            season: Season year
+
+        Returns:
+            Dict of player ID -> formatted pitcher stats (None if not found)
+        """
+        return self._season_stats_bulk('pitcher_stats', 'pitching', self._build_pitcher_stats, player_ids, season)
+
+    def _season_stats_bulk(
+        self,
+        endpoint: str,
+        group: str,
+        build: Callable[[Dict, int], Dict[str, Any]],
+        player_ids: List[int],
+        season: int
+    ) -> Dict[int, Optional[Dict[str, Any]]]:
+        """Serve cached players, bulk-fetch the rest and fan them out into per-player entries."""
+        results = {}
+        missing = []
+        for player_id in dict.fromkeys(player_ids):
+            cached = _cache.get('mlb', endpoint, {'player_id': player_id, 'season': season})
+            if cached is not None:
+                results[player_id] = cached
+            else:
+                missing.append(player_id)
+
+        if not missing:
+            return results
 
+        try:
+            people = self._fetch_people_stats(missing, group, season)
         except Exception as e:
-            logger.error(f"Error getting batter stats for {player_id}: {e}", exc_info=True)
-            return None
+            logger.error(f"Error bulk fetching {group} stats for {len(missing)} players: {e}", exc_info=True)
+            people = {}
+
+        for player_id in missing:
+            person = people.get(player_id)
+            if person is None:
+                results[player_id] = None
+                continue
+            result = build(person, player_id)
+            _cache.set('mlb', endpoint, {'player_id': player_id, 'season': season}, result)
+            results[player_id] = result
+
+        logger.info(f"Fetched {group} stats for {len(people)}/{len(missing)} players ({len(results) - len(missing)} cached)")
+        return results
+
+    def _fetch_people_stats(self, player_ids: List[int], group: str, season: int) -> Dict[int, Dict]:
+        """
+        Fetch people with season stats hydrated, PEOPLE_BATCH_SIZE per request.
+
+        Args:
+            player_ids: MLB player IDs
+            group: Stat group ('hitting' or 'pitching')
+            season: Season year
+
+        Returns:
+            Dict of player ID -> /people entry (raises on request failure)
+        """
+        people = {}
+        for start in range(0, len(player_ids), PEOPLE_BATCH_SIZE):
+            batch = player_ids[start:start + PEOPLE_BATCH_SIZE]
+            response = self.session.get(f"{self.base_url}/people", params={
+                'personIds': ','.join(str(player_id) for player_id in batch),
+                'hydrate': f'stats(group=[{group}],type=[season],season={season})'
+            })
+            response.raise_for_status()
+            for person in response.json().get('people', []):
+                people[person['id']] = person
+        return people
+
+    @staticmethod
+    def _season_stat_line(person: Dict) -> Dict:
+        """
+        Season stat line from a hydrated /people entry.
+
+        Players who changed teams have one split per team; the split
+        without a team is their combined line.
+        """
+        for stat_group in person.get('stats', []):
+            splits = stat_group.get('splits', [])
+            if splits:
+                combined = next((split for split in splits if 'team' not in split), splits[0])
+                return combined.get('stat', {})
+        return {}
+
+    @staticmethod
+    def _number(value: Any) -> float:
+        """Parse an API stat value; placeholders like '-.--' become 0."""
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return 0.0
+
+    def _build_batter_stats(self, person: Dict, player_id: int) -> Dict[str, Any]:
+        """Format a hydrated /people entry as batter season stats."""
+        stats = self._season_stat_line(person)
+        avg = self._number(stats.get('avg'))
+        obp = self._number(stats.get('obp'))
+        slg = self._number(stats.get('slg'))
+
+        return {
+            'name': person.get('fullName', ''),
+            'player_id': player_id,
+            'age': person.get('currentAge', 0),
+            'war': 0.0,  # Not in basic stats
+            'slash': f".{int(avg*1000):03d}/.{int(obp*1000):03d}/.{int(slg*1000):03d}",
+            'ops': obp + slg,
+            'ops_plus': 100,  # Default, would need league average to calculate
+            'hr': int(stats.get('homeRuns', 0)),
+            'rbi': int(stats.get('rbi', 0)),
+            'tb': int(stats.get('totalBases', 0)),
+            'sb': int(stats.get('stolenBases', 0)),
+            'owar': 0.0,
+            'dwar': 0.0
+        }
+
+    def _build_pitcher_stats(self, person: Dict, player_id: int) -> Dict[str, Any]:
+        """Format a hydrated /people entry as pitcher season stats."""
+        stats = self._season_stat_line(person)
+
+        return {
+            'name': person.get('fullName', ''),
+            'hand': person.get('pitchHand', {}).get('code', 'R'),
+            'number': int(self._number(person.get('primaryNumber'))),
+            'headshot_url': get_player_headshot_url(player_id),
+            'WAR': 0.0,  # Not in basic stats, would need advanced endpoint
+            'wins': int(stats.get('wins', 0)),
+            'losses': int(stats.get('losses', 0)),
+            'ERA': self._number(stats.get('era')),
+            'IP': self._number(stats.get('inningsPitched')),
+            'K/9': self._number(stats.get('strikeoutsPer9Inn')),
+            'BB/9': self._number(stats.get('walksPer9Inn')),
+            'HR/9': self._number(stats.get('homeRunsPer9')),
+            'WHIP': self._number(stats.get('whip')),
+            'GB%': 45.0  # Not in basic stats
+        }
 
     def _get_team_id(self, team_abbr: str) -> Optional[int]:
         """
@@ -1270,33 +1335,16 @@ class MLBStatsAPIClient:
         Returns:
             Team ID or None if not found
         """
-        # Common team abbreviation to ID mapping
-        team_map = {
-            'NYY': 147, 'BOS': 111, 'TB': 139, 'TOR': 141, 'BAL': 110,
-            'CLE': 114, 'MIN': 142, 'CWS': 145, 'DET': 116, 'KC': 118,
-            'HOU': 117, 'TEX': 140, 'SEA': 136, 'LAA': 108, 'OAK': 133,
-            'ATL': 144, 'PHI': 143, 'NYM': 121, 'MIA': 146, 'WSH': 120,
-            'MIL': 158, 'STL': 138, 'CHC': 112, 'CIN': 113, 'PIT': 134,
-            'LAD': 119, 'SD': 135, 'SF': 137, 'COL': 115, 'ARI': 109
-        }
-
-        # Normalize abbreviation
-        team_abbr = team_abbr.upper()
-
-        # Handle common variations
-        if team_abbr == 'CHW':
-            team_abbr = 'CWS'
-        elif team_abbr == 'KCR':
-            team_abbr = 'KC'
-        elif team_abbr == 'WSN':
-            team_abbr = 'WSH'
-
-        return team_map.get(team_abbr)
+        return get_team_id(team_abbr) or None
 
     def close(self):
-        """Close the HTTP session."""
-        if self.session:
-            self.session.close()
+        """
+        Release the client.
+
+        The pooled session is shared with other clients and statsapi, so it
+        stays open; use ingestion.http_session.close_mlb_session() at exit.
+        """
+        self.session = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -1305,3 +1353,15 @@ class MLBStatsAPIClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+# Shared client instance
+_client: Optional[MLBStatsAPIClient] = None
+
+
+def get_mlb_client() -> MLBStatsAPIClient:
+    """Get or create the shared MLB Stats API client."""
+    global _client
+    if _client is None:
+        _client = MLBStatsAPIClient()
+    return _client
@@ -0,0 +1,333 @@
+"""
+League-wide pitch arsenals, aggregated once per season and day.
+
+Pitch mix used to be computed per probable starter: a scan of that
+pitcher's season of pitches, cached by name. PitchArsenals holds
+the pitch mix of every pitcher in a season instead, built by one
+aggregate_pitch_mix() pass over the league's pitches in the Statcast
+warehouse and keyed by MLBAM ID, so a pitcher's arsenal (starter or
+reliever) is a dict lookup.
+
+The aggregated table is stored in the API cache for each date it covers
+through (Parquet, a few thousand rows), so it is rebuilt at most once a
+day; past seasons are pinned. Tables only cover the warehouse's settled
+dates (see statcast_warehouse.settled_through), since pitches for the
+provisional days can still arrive. Only regular season and postseason games
+count; spring training would skew the mix.
+
+Tables are built by batch jobs (the slate prefetch planner); per-game
+lookups read a built table and come back empty until there is one,
+rather than backfilling the warehouse in the middle of a preview.
+
+Usage:
+    store = get_arsenal_store()
+    store.arsenals(2025, build=True)
+    arsenals = store.arsenals(2025)
+    mix = arsenals.get(543037)
+    mix = store.pitch_mix(543037, 2025)
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+import pandas as pd
+import pyarrow.dataset as ds
+
+from config.logging_config import get_logger
+from ingestion.season_schedule import SEASON_END, SEASON_START
+from ingestion.statcast_warehouse import StatcastWarehouse, get_statcast_warehouse, settled_through
+from utils.api_cache import APICache, get_api_cache
+
+logger = get_logger(__name__)
+
+# Game types the arsenals cover: regular season and postseason rounds
+ARSENAL_GAME_TYPES = ['R', 'F', 'D', 'L', 'W']
+
+# Warehouse columns read for the aggregation
+ARSENAL_COLUMNS = [
+    'pitcher', 'pitch_type', 'description', 'release_speed', 'release_spin_rate',
+    'delta_run_exp', 'stand', 'balls', 'strikes',
+]
+
+# Pitch descriptions counted as swings, and as swings and misses
+SWING_DESCRIPTIONS = ['swinging_strike', 'swinging_strike_blocked', 'foul', 'hit_into_play']
+WHIFF_DESCRIPTIONS = ['swinging_strike', 'swinging_strike_blocked']
+
+# Pitch mix splits: extra grouping columns on top of the pitch type
+PITCH_MIX_SPLITS = {
+    'overall': [],
+    'count': ['balls', 'strikes'],
+    'stand': ['stand'],
+}
+
+
+def aggregate_pitch_mix(pitches: pd.DataFrame, keys: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+    """
+    Aggregate Statcast pitches into pitch mix tables.
+
+    One groupby over the pitches builds sums and counts per pitch type at
+    the finest split (count and batter handedness); the overall, per-count
+    and per-handedness tables are then rolled up from those sums, so a
+    league-wide frame is aggregated in a single pass.
+
+    Args:
+        pitches: Statcast pitches (pitch_type, description, release_speed,
+                 release_spin_rate, delta_run_exp, stand, balls, strikes)
+        keys: Columns identifying whose mix it is (default: ['pitcher'];
+              [] for a frame holding one pitcher)
+
+    Returns:
+        Dict of split name (see PITCH_MIX_SPLITS) -> DataFrame with the
+        keys, split columns, pitch_type, pitches, usage (% of the group's
+        pitches), velocity, spin, whiff (% of swings) and rv_100, sorted
+        by usage within each group
+    """
+    keys = ['pitcher'] if keys is None else list(keys)
+    split_columns = ['stand', 'balls', 'strikes']
+
+    def column(name: str) -> pd.Series:
+        return pitches[name] if name in pitches.columns else pd.Series(float('nan'), index=pitches.index)
+
+    description = column('description')
+    velocity, spin, run_value = column('release_speed'), column('release_spin_rate'), column('delta_run_exp')
+    frame = pd.DataFrame({
+        **{name: column(name) for name in keys + split_columns},
+        'pitch_type': column('pitch_type').replace('', None),
+        'pitches': 1,
+        'swings': description.isin(SWING_DESCRIPTIONS),
+        'whiffs': description.isin(WHIFF_DESCRIPTIONS),
+        'velocity_sum': velocity, 'velocity_n': velocity.notna(),
+        'spin_sum': spin, 'spin_n': spin.notna(),
+        'rv_sum': run_value, 'rv_n': run_value.notna(),
+    })
+
+    # The single pass over pitches; unknown pitch types still count
+    # towards usage totals
+    fine = frame.groupby(keys + split_columns + ['pitch_type'], dropna=False).sum(min_count=1).reset_index()
+
+    tables = {}
+    for split, columns in PITCH_MIX_SPLITS.items():
+        group = keys + columns
+        table = fine.groupby(group + ['pitch_type'], dropna=False).sum(numeric_only=True, min_count=1).reset_index()
+        totals = table.groupby(group, dropna=False)['pitches'].transform('sum') if group else table['pitches'].sum()
+        table['usage'] = table['pitches'] / totals * 100
+        table['velocity'] = table['velocity_sum'] / table['velocity_n']
+        table['spin'] = table['spin_sum'] / table['spin_n']
+        table['whiff'] = (table['whiffs'] / table['swings'] * 100).where(table['swings'] > 0, 0.0)
+        table['rv_100'] = table['rv_sum'] / table['rv_n'] * 100
+
+        table = table[table['pitch_type'].notna()]
+        table = table.sort_values(group + ['usage'], ascending=[True] * len(group) + [False], ignore_index=True)
+        tables[split] = table[group + ['pitch_type', 'pitches', 'usage', 'velocity', 'spin', 'whiff', 'rv_100']]
+
+    return tables
+
+
+def get_pitch_name(pitch_code: str) -> str:
+    """Convert pitch type code to readable name."""
+    pitch_names = {
+        'FF': '4-Seam FB',
+        'SI': 'Sinker',
+        'FC': 'Cutter',
+        'SL': 'Slider',
+        'CU': 'Curveball',
+        'CH': 'Changeup',
+        'FS': 'Splitter',
+        'KN': 'Knuckleball',
+        'SC': 'Screwball',
+        'FO': 'Forkball',
+        'EP': 'Eephus',
+        'FA': 'Fastball',
+        'ST': 'Sweeper',
+        'SV': 'Slurve'
+    }
+    return pitch_names.get(pitch_code, pitch_code)
+
+
+def pitch_mix_records(mix: pd.DataFrame) -> List[Dict[str, Any]]:
+    """
+    Format pitch mix rows as the previews show them.
+
+    Args:
+        mix: Rows of an aggregate_pitch_mix() table, in display order
+
+    Returns:
+        List of pitch dicts with name, usage, velocity, spin, whiff, rv_100
+    """
+    return [
+        {
+            'name': get_pitch_name(row.pitch_type),
+            'usage': float(row.usage),
+            'velocity': float(row.velocity) if pd.notna(row.velocity) else 0,
+            'spin': int(row.spin) if pd.notna(row.spin) else 0,
+            'whiff': float(row.whiff),
+            'rv_100': float(row.rv_100) if pd.notna(row.rv_100) else 0
+        }
+        for row in mix.itertuples(index=False)
+    ]
+
+
+class PitchArsenals:
+    """Pitch mix of every pitcher in a season, keyed by MLBAM ID."""
+
+    def __init__(self, season: int, through_date: str, mix: pd.DataFrame):
+        """
+        Index an aggregated season table.
+
+        Args:
+            season: Season year
+            through_date: Last date the table covers (YYYY-MM-DD)
+            mix: aggregate_pitch_mix() 'overall' table keyed by pitcher
+        """
+        self.season = season
+        self.through_date = through_date
+
+        # Rows are sorted by pitcher, then usage
+        self._by_pitcher: Dict[int, List[Dict[str, Any]]] = {}
+        if not mix.empty:
+            for pitcher_id, rows in mix.groupby('pitcher', sort=False):
+                self._by_pitcher[int(pitcher_id)] = pitch_mix_records(rows)
+
+    def __len__(self) -> int:
+        return len(self._by_pitcher)
+
+    def __contains__(self, pitcher_id: int) -> bool:
+        return int(pitcher_id) in self._by_pitcher
+
+    def get(self, pitcher_id: int) -> List[Dict[str, Any]]:
+        """
+        Get a pitcher's pitch mix.
+
+        Args:
+            pitcher_id: MLBAM player ID
+
+        Returns:
+            List of pitch dicts sorted by usage (empty if the pitcher hasn't pitched)
+        """
+        return [dict(pitch) for pitch in self._by_pitcher.get(int(pitcher_id), [])]
+
+
+class ArsenalStore:
+    """Per-season league-wide pitch arsenals, rebuilt daily from the warehouse."""
+
+    def __init__(self, warehouse: Optional[StatcastWarehouse] = None, cache: Optional[APICache] = None):
+        """
+        Initialize store.
+
+        Args:
+            warehouse: Statcast warehouse to aggregate (default: the shared one)
+            cache: API cache for aggregated tables (default: the shared cache)
+        """
+        self._warehouse = warehouse
+        self.cache = cache or get_api_cache()
+
+        # season -> arsenals
+        self._arsenals: Dict[int, PitchArsenals] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def warehouse(self) -> StatcastWarehouse:
+        if self._warehouse is None:
+            self._warehouse = get_statcast_warehouse()
+        return self._warehouse
+
+    def _build(self, season: int, through_date: str, ingest: bool) -> pd.DataFrame:
+        """Aggregate every pitcher's season in one pass over the warehouse."""
+        logger.info(f"Building {season} pitch arsenals through {through_date}")
+        pitches = self.warehouse.query(
+            f"{season}-{SEASON_START}", through_date,
+            where=ds.field('game_type').isin(ARSENAL_GAME_TYPES),
+            columns=ARSENAL_COLUMNS,
+            ingest=ingest
+        )
+        if pitches.empty:
+            return pd.DataFrame(columns=['pitcher', 'pitch_type', 'pitches', 'usage',
+                                         'velocity', 'spin', 'whiff', 'rv_100'])
+
+        mix = aggregate_pitch_mix(pitches, keys=['pitcher'])['overall']
+        logger.info(f"Aggregated {len(pitches)} pitches into {mix['pitcher'].nunique()} arsenals")
+        return mix
+
+    def arsenals(self, season: int, through_date: Optional[str] = None, build: bool = False) -> Optional[PitchArsenals]:
+        """
+        Get every pitcher's arsenal for a season.
+
+        Without build, a table that isn't cached is only aggregated when
+        the warehouse already holds every date it covers; a cold warehouse
+        is never backfilled from here, since that takes minutes. Batch jobs
+        (the slate prefetch) pass build=True to ingest and aggregate.
+
+        Args:
+            season: Season year
+            through_date: Last date to include (YYYY-MM-DD; default and
+                          latest: the last settled warehouse date, or the
+                          end of a past season)
+            build: Ingest missing warehouse dates and aggregate the table
+                   if it isn't cached
+
+        Returns:
+            PitchArsenals, or None if the table isn't built yet or the
+            pitches could not be read
+        """
+        # Provisional warehouse days can still gain pitches, so tables are
+        # only built, cached and held through settled dates
+        settled = settled_through()
+        through_date = min(through_date or settled, settled, f"{season}-{SEASON_END}")
+
+        with self._lock:
+            held = self._arsenals.get(season)
+            if held is not None and held.through_date == through_date:
+                return held
+
+            params = {'season': season, 'through_date': through_date}
+            try:
+                if build or self.warehouse.covers(f"{season}-{SEASON_START}", through_date):
+                    mix = self.cache.get_or_fetch(
+                        'statcast', 'arsenals', params,
+                        lambda: self._build(season, through_date, ingest=build)
+                    )
+                else:
+                    mix = self.cache.get('statcast', 'arsenals', params)
+                    if mix is None:
+                        logger.warning(f"{season} pitch arsenals through {through_date} aren't built yet "
+                                       f"(the slate prefetch builds them)")
+            except Exception as e:
+                logger.error(f"Error building {season} pitch arsenals: {e}", exc_info=True)
+                return None
+            if mix is None:
+                return None
+
+            arsenals = PitchArsenals(season, through_date, mix)
+            self._arsenals[season] = arsenals
+            return arsenals
+
+    def pitch_mix(self, pitcher_id: int, season: int, through_date: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get one pitcher's pitch mix from the season arsenals (never builds them).
+
+        Args:
+            pitcher_id: MLBAM player ID
+            season: Season year
+            through_date: Last date to include (see arsenals())
+
+        Returns:
+            List of pitch dicts sorted by usage (empty if none)
+        """
+        arsenals = self.arsenals(season, through_date)
+        return arsenals.get(pitcher_id) if arsenals else []
+
+    def clear(self) -> None:
+        """Drop arsenals held in memory (cached tables are kept)."""
+        with self._lock:
+            self._arsenals.clear()
+
+
+# Global store instance
+_store: Optional[ArsenalStore] = None
+
+
+def get_arsenal_store() -> ArsenalStore:
+    """Get or create the global arsenal store."""
+    global _store
+    if _store is None:
+        _store = ArsenalStore()
+    return _store
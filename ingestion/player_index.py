@@ -0,0 +1,202 @@
+"""
+Name index over season stats tables (Baseball Reference, FanGraphs).
+
+Player lookups in the pybaseball season tables used to normalize every
+name in the table and run two substring scans per call, once per lineup
+batter. PlayerIndex normalizes the table's names once and maps them to
+row positions (and MLBAM IDs to rows when the table has them), so a
+lookup is a dict hit. Indexes are built once per table and season and
+reused.
+
+Lookups try, in order: the MLBAM ID, the exact normalized full name, and
+first + last name (ignoring middle names and Jr./Sr./II suffixes). When a
+name matches more than one player (there are two Will Smiths) and there
+is no ID to tell them apart, the lookup returns nothing rather than
+whichever row comes first.
+
+Usage:
+    index = get_player_index('fangraphs_batting', 2025, lambda: batting_stats(2025))
+    row = index.row('Aaron Judge', player_id=592450)
+"""
+
+import re
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Tuple
+import pandas as pd
+
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Columns holding MLBAM player IDs, by source (Baseball Reference: mlbID)
+MLBAM_ID_COLUMNS = ('mlbID', 'xMLBAMID', 'key_mlbam')
+
+# Columns identifying a player when the table has no MLBAM IDs (FanGraphs)
+PLAYER_ID_COLUMNS = MLBAM_ID_COLUMNS + ('IDfg',)
+
+# Name suffixes ignored by the first + last name match
+NAME_SUFFIXES = {'jr', 'sr', 'ii', 'iii', 'iv'}
+
+# How long a built index is reused (the season tables change daily)
+INDEX_MEMO_SECONDS = 3600
+
+_PUNCTUATION = re.compile(r"[^\w\s-]")
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize player name by removing accents/diacritics.
+
+    Converts: "Rodríguez" -> "Rodriguez", "José" -> "Jose"
+
+    Args:
+        name: Player name with possible accents
+
+    Returns:
+        Name with accents removed (ASCII)
+    """
+    # Normalize to NFD (decomposed form), then filter out combining characters
+    nfd = unicodedata.normalize('NFD', name)
+    ascii_name = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
+    return ascii_name
+
+
+def name_key(name: str) -> str:
+    """Lookup key for a name: no accents or punctuation, lowercase, single spaces."""
+    return ' '.join(_PUNCTUATION.sub('', normalize_name(name)).lower().split())
+
+
+def first_last_key(key: str) -> str:
+    """First and last name of a name key, without middle names or suffixes."""
+    parts = key.split()
+    while len(parts) > 2 and parts[-1] in NAME_SUFFIXES:
+        parts.pop()
+    return f"{parts[0]} {parts[-1]}" if len(parts) >= 2 else key
+
+
+class PlayerIndex:
+    """Name and MLBAM ID index over a season stats table."""
+
+    def __init__(self, df: pd.DataFrame, name_column: str = 'Name'):
+        """
+        Build the index.
+
+        Args:
+            df: Season stats table (one row per player)
+            name_column: Column holding player names
+        """
+        self.df = df
+        self.id_column = next((c for c in MLBAM_ID_COLUMNS if c in df.columns), None)
+        identity_column = next((c for c in PLAYER_ID_COLUMNS if c in df.columns), None)
+        self._identity = list(df[identity_column]) if identity_column else None
+
+        self._by_name: Dict[str, List[int]] = defaultdict(list)
+        self._by_first_last: Dict[str, List[int]] = defaultdict(list)
+        for position, name in enumerate(df[name_column].fillna('').astype(str)):
+            key = name_key(name)
+            if key:
+                self._by_name[key].append(position)
+                self._by_first_last[first_last_key(key)].append(position)
+
+        self._by_id: Dict[int, int] = {}
+        if self.id_column:
+            ids = pd.to_numeric(df[self.id_column], errors='coerce')
+            for position, player_id in enumerate(ids):
+                if pd.notna(player_id):
+                    self._by_id.setdefault(int(player_id), position)
+
+    def __len__(self) -> int:
+        return len(self.df)
+
+    def _single_player(self, positions: List[int]) -> Optional[int]:
+        """The row for a match, or None if it names more than one player."""
+        if len(positions) == 1:
+            return positions[0]
+        if self._identity is not None and len({self._identity[p] for p in positions}) == 1:
+            return positions[0]
+        return None
+
+    def find(self, name: str, player_id: Optional[int] = None) -> Optional[int]:
+        """
+        Find a player's row position.
+
+        Args:
+            name: Player name (e.g., "Aaron Judge")
+            player_id: MLBAM player ID, used first when the table has IDs
+
+        Returns:
+            Row position, or None if not found or ambiguous
+        """
+        if player_id is not None and self.id_column:
+            position = self._by_id.get(int(player_id))
+            if position is not None:
+                return position
+
+        key = name_key(name)
+        if not key:
+            return None
+
+        for index, lookup in ((self._by_name, key), (self._by_first_last, first_last_key(key))):
+            positions = index.get(lookup)
+            if positions:
+                position = self._single_player(positions)
+                if position is None:
+                    logger.warning(f"'{name}' matches {len(positions)} players; pass a player ID to choose")
+                return position
+        return None
+
+    def row(self, name: str, player_id: Optional[int] = None) -> Optional[pd.Series]:
+        """
+        Find a player's row.
+
+        Args:
+            name: Player name
+            player_id: MLBAM player ID
+
+        Returns:
+            The table row, or None if not found or ambiguous
+        """
+        position = self.find(name, player_id)
+        return None if position is None else self.df.iloc[position]
+
+
+# Built indexes: (table, season) -> (built_at, index)
+_indexes: Dict[Tuple[str, int], Tuple[float, PlayerIndex]] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_player_index(table: str, season: int, load: Callable[[], Optional[pd.DataFrame]]) -> Optional[PlayerIndex]:
+    """
+    Get the index for a season table, building it on first use.
+
+    Args:
+        table: Table name (e.g., 'bref_pitching', 'fangraphs_batting')
+        season: Season year
+        load: Returns the table (called only when the index is built)
+
+    Returns:
+        PlayerIndex, or None if the table could not be loaded
+    """
+    with _indexes_lock:
+        entry = _indexes.get((table, season))
+        if entry is not None and time.monotonic() - entry[0] < INDEX_MEMO_SECONDS:
+            return entry[1]
+
+    df = load()
+    if df is None or df.empty:
+        return None
+
+    index = PlayerIndex(df)
+    logger.debug(f"Built {table} {season} player index: {len(index)} rows")
+    with _indexes_lock:
+        _indexes[(table, season)] = (time.monotonic(), index)
+    return index
+
+
+def clear_player_indexes() -> None:
+    """Drop built indexes (rebuilt from the tables on next use)."""
+    with _indexes_lock:
+        _indexes.clear()
@@ -0,0 +1,282 @@
+"""
+Prefetch planner: warm the API cache for a full day's slate.
+
+Enumerates every game on a date, builds the union of requests the game
+previews need, drops duplicates (the season schedule, league leaders,
+transactions and the FanGraphs season table are shared by many games),
+and runs what's left with bounded concurrency.
+
+Requests run in two phases, because some depend on earlier results:
+
+    Phase 1: season schedule, records, injuries, lineups, bench, bullpen
+             usage, probable pitcher lookups, league-wide tables and
+             Statcast pitches (the local warehouse)
+    Phase 2: season stats for all probable starters and for all lineup
+             and bench batters (one bulk request each; need pitcher IDs
+             and lineups), league-wide pitch arsenals and RE24 (read the
+             warehouse), schedule context and head-to-head (read the
+             phase 1 season schedule)
+
+Usage:
+    planner = PrefetchPlanner('2025-09-25', max_workers=8)
+    report = planner.run()
+    print(report['planned'], report['cached'], report['fetched'])
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+import statsapi
+
+from ingestion.mlb_api_client import MLBStatsAPIClient, get_mlb_client
+from ingestion.pitch_arsenals import get_arsenal_store
+from ingestion.pybaseball_client import get_fangraphs_batting_stats
+from ingestion.season_schedule import get_season_schedule
+from ingestion.statcast_warehouse import get_statcast_warehouse
+from utils.api_cache import cached, get_api_cache
+from utils.re24_calculator import get_batter_season_re24
+from utils.team_data import get_team_abbr
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Default number of requests in flight at once
+DEFAULT_MAX_WORKERS = 8
+
+
+@cached('mlb', 'player_lookup')
+def lookup_player_id(name: str) -> Optional[int]:
+    """Look up a player's MLB ID by full name (cached)."""
+    results = statsapi.lookup_player(name)
+    return results[0]['id'] if results else None
+
+
+class PrefetchTask:
+    """
+    One deduplicated request: a key identifying it and the call that makes it.
+
+    Two tasks with the same key make the same request (and fill the same
+    cache entry), so only the first one planned is run.
+    """
+
+    def __init__(self, key: tuple, func: Callable, *args, **kwargs):
+        self.key = key
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.result: Any = None
+        self.outcome: Optional[str] = None  # 'cached', 'fetched' or 'failed'
+
+        # For work that bypasses the API cache: tells from the result
+        # whether the task fetched anything
+        self.fetched: Optional[Callable[[Any], bool]] = None
+
+    @property
+    def label(self) -> str:
+        return ':'.join(str(part) for part in self.key)
+
+    def run(self) -> Any:
+        return self.func(*self.args, **self.kwargs)
+
+
+class PrefetchPlanner:
+    """Plans and runs the deduplicated set of requests for a date's games."""
+
+    def __init__(
+        self,
+        game_date: str,
+        client: Optional[MLBStatsAPIClient] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS
+    ):
+        """
+        Initialize planner.
+
+        Args:
+            game_date: Slate date (YYYY-MM-DD)
+            client: MLB API client (default: the shared client)
+            max_workers: Maximum requests in flight at once
+        """
+        self.game_date = game_date
+        self.season = int(game_date.split('-')[0])
+        self.client = client or get_mlb_client()
+        # Client methods and the @cached helpers all write through the
+        # global cache, so that is the one to count hits and misses on
+        self.cache = get_api_cache()
+        self.max_workers = max_workers
+
+        self.games: List[Dict] = []
+        self._tasks: Dict[tuple, PrefetchTask] = {}
+        self._requested = 0
+        self._counts = {'cached': 0, 'fetched': 0, 'failed': 0}
+        self._lock = threading.Lock()
+
+    def _add(self, phase: List[PrefetchTask], key: tuple, func: Callable, *args, **kwargs) -> PrefetchTask:
+        """Add a task to a phase unless an identical one is already planned."""
+        self._requested += 1
+        task = self._tasks.get(key)
+        if task is None:
+            task = self._tasks[key] = PrefetchTask(key, func, *args, **kwargs)
+            phase.append(task)
+        return task
+
+    def _slate_teams(self) -> List[str]:
+        teams = []
+        for game in self.games:
+            for side in ('away_id', 'home_id'):
+                abbr = get_team_abbr(game.get(side))
+                if abbr and abbr not in teams:
+                    teams.append(abbr)
+        return teams
+
+    def plan_phase_one(self) -> List[PrefetchTask]:
+        """Plan requests that only need the day's schedule."""
+        phase: List[PrefetchTask] = []
+        teams = self._slate_teams()
+
+        # One league-wide season schedule feeds schedule context,
+        # head-to-head and the division race charts for every team
+        self._add(phase, ('season_schedule', self.season), get_season_schedule, self.season, client=self.client)
+
+        for team in teams:
+            self._add(phase, ('team_record', team, self.season), self.client.get_team_record, team, self.season)
+            self._add(phase, ('team_injuries', team), self.client.get_team_injuries, team)
+
+        for game in self.games:
+            game_id = game.get('game_id')
+            self._add(phase, ('game_lineups', game_id), self.client.get_game_lineups, game_id)
+            self._add(phase, ('game_bench', game_id), self.client.get_game_bench_players, game_id)
+            self._add(phase, ('game_bullpen', game_id), self.client.get_bullpen_with_usage,
+                      game_id, starter_id=None, days_back=3)
+
+            for side in ('away', 'home'):
+                name = (game.get(f'{side}_probable_pitcher') or '').strip()
+                if name:
+                    self._add(phase, ('player_lookup', name), lookup_player_id, name)
+
+        # League-wide Statcast pitches through the day before the slate;
+        # pitch mix and RE24 in phase 2 are local scans of them
+        season_start = f"{self.season}-03-01"
+        warehouse_task = self._add(phase, ('statcast_warehouse', season_start, self.game_date),
+                                   get_statcast_warehouse().ensure, season_start, self.game_date)
+        # ensure() returns the number of dates it ingested
+        warehouse_task.fetched = lambda ingested: bool(ingested)
+
+        # Shared by every game on the slate
+        self._add(phase, ('transactions', self.game_date), self.client.get_recent_transactions, self.game_date)
+        self._add(phase, ('league_leaders', self.season), self.client.get_league_leaders, self.season)
+        self._add(phase, ('fangraphs_batting', self.season), get_fangraphs_batting_stats, self.season)
+
+        return phase
+
+    def plan_phase_two(self) -> List[PrefetchTask]:
+        """Plan requests that depend on phase 1 results."""
+        phase: List[PrefetchTask] = []
+
+        # Every probable starter's season stats in one bulk request
+        starter_ids = list(dict.fromkeys(
+            task.result for key, task in self._tasks.items() if key[0] == 'player_lookup' and task.result
+        ))
+        if starter_ids:
+            self._add(phase, ('pitcher_stats', tuple(starter_ids), self.season),
+                      self.client.get_pitcher_season_stats_bulk, starter_ids, self.season)
+
+        # Every pitcher's pitch mix (starters and bullpens) in one pass over
+        # the warehouse; the previews then look pitchers up by ID
+        self._add(phase, ('pitch_arsenals', self.season), get_arsenal_store().arsenals, self.season,
+                  build=True)
+
+        # Every lineup and bench batter on the slate, each once
+        batter_ids: List[int] = []
+        for game in self.games:
+            for key in (('game_lineups', game.get('game_id')), ('game_bench', game.get('game_id'))):
+                players = self._tasks[key].result or {}
+                for side in ('away', 'home'):
+                    batter_ids.extend(p['player_id'] for p in players.get(side, []))
+        batter_ids = list(dict.fromkeys(batter_ids))
+        if batter_ids:
+            self._add(phase, ('batter_stats', tuple(batter_ids), self.season),
+                      self.client.get_batter_season_stats_bulk, batter_ids, self.season)
+
+        for game in self.games:
+            game_id = game.get('game_id')
+            away = get_team_abbr(game.get('away_id'))
+            home = get_team_abbr(game.get('home_id'))
+
+            # RE24 only covers the starting lineups
+            lineups = self._tasks[('game_lineups', game_id)].result or {}
+            for side in ('away', 'home'):
+                for batter in lineups.get(side, []):
+                    self._add(phase, ('re24', batter['player_id'], self.season, self.game_date),
+                              get_batter_season_re24, batter['player_id'], self.season,
+                              end_date=self.game_date)
+
+            if home and away:
+                self._add(phase, ('schedule_context', home, self.game_date),
+                          self.client.get_schedule_context, home, self.game_date)
+                self._add(phase, ('head_to_head', home, away, self.season, self.game_date),
+                          self.client.get_head_to_head_record, home, away, self.season,
+                          before_date=self.game_date)
+
+        return phase
+
+    def _run_task(self, task: PrefetchTask) -> None:
+        """Run one task, recording whether it was served from the cache, fetched or failed."""
+        with self.cache.track() as counts:
+            task.result = task.run()
+
+        if task.fetched is not None:
+            outcome = 'fetched' if task.fetched(task.result) else 'cached'
+        elif counts.get('misses'):
+            # Any miss means at least one request went to the network; client
+            # methods log their errors and return None or {} instead of raising
+            empty = task.result is None or (isinstance(task.result, dict) and not task.result)
+            outcome = 'failed' if empty else 'fetched'
+        else:
+            outcome = 'cached'
+
+        task.outcome = outcome
+        if outcome == 'failed':
+            logger.warning(f"Prefetch {task.label} returned no data")
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def execute(self, tasks: List[PrefetchTask]) -> None:
+        """Run tasks with at most max_workers in flight."""
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='prefetch') as pool:
+            futures = {pool.submit(self._run_task, task): task for task in tasks}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    with self._lock:
+                        self._counts['failed'] += 1
+                    logger.warning(f"Prefetch {futures[future].label} failed: {e}")
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Plan and run both phases for the slate.
+
+        Returns:
+            Report dict with games, requested (before dedup), planned,
+            cached, fetched, failed and elapsed_sec
+        """
+        start = time.perf_counter()
+
+        self.games = self.client.get_schedule(start_date=self.game_date, end_date=self.game_date)
+        logger.info(f"Prefetching {len(self.games)} games on {self.game_date}")
+
+        for plan in (self.plan_phase_one, self.plan_phase_two):
+            tasks = plan()
+            logger.info(f"Running {len(tasks)} prefetch requests ({plan.__name__})")
+            self.execute(tasks)
+
+        report = {
+            'games': len(self.games),
+            'requested': self._requested,
+            'planned': len(self._tasks),
+            **self._counts,
+            'elapsed_sec': round(time.perf_counter() - start, 1)
+        }
+        logger.info(f"Prefetch complete: {report}")
+        return report
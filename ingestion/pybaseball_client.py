@@ -3,23 +3,20 @@ PyBaseball client for fetching real MLB stats from Baseball Reference and Baseba
 
 Data Sources:
 - Baseball Reference: Pitcher/batter traditional stats (ERA, AVG, WAR, etc.)
-- Baseball Savant (Statcast): Pitch-by-pitch data for pitch mix and advanced metrics
+- FanGraphs: Batting/pitching season tables (wRC+, Off/Def, FIP, etc.)
+- Baseball Savant (Statcast): Pitch-by-pitch data for pitch mix and advanced metrics,
+  aggregated league-wide from the local Statcast warehouse (see pitch_arsenals)
 """
 
 from typing import Dict, List, Optional, Any
 import pandas as pd
-import unicodedata
 from pybaseball import (
-    pitching_stats,
-    pitching_stats_bref,
-    batting_stats,
-    batting_stats_bref,
     playerid_lookup,
-    statcast_pitcher,
     cache
 )
 from config.logging_config import get_logger
-from utils.api_cache import get_api_cache
+from ingestion.pitch_arsenals import get_arsenal_store
+from ingestion.season_tables import get_season_tables
 
 # Enable pybaseball caching for faster subsequent fetches
 # Cache is stored in ~/.pybaseball/cache/
@@ -27,35 +24,19 @@ cache.enable()
 
 logger = get_logger(__name__)
 
-# Get shared API cache instance
-_cache = get_api_cache()
 
-
-def normalize_name(name: str) -> str:
-    """
-    Normalize player name by removing accents/diacritics.
-
-    Converts: "Rodríguez" -> "Rodriguez", "José" -> "Jose"
-
-    Args:
-        name: Player name with possible accents
-
-    Returns:
-        Name with accents removed (ASCII)
-    """
-    # Normalize to NFD (decomposed form), then filter out combining characters
-    nfd = unicodedata.normalize('NFD', name)
-    ascii_name = ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
-    return ascii_name
-
-
-def get_pitcher_stats(pitcher_name: str, season: int = 2025) -> Optional[Dict[str, Any]]:
+def get_pitcher_stats(
+    pitcher_name: str,
+    season: int = 2025,
+    player_id: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
     """
     Get pitcher stats from Baseball Reference for a season.
 
     Args:
         pitcher_name: Pitcher's name (e.g., "Gerrit Cole")
         season: Season year
+        player_id: MLBAM player ID (picks the right player when names clash)
 
     Returns:
         Dict with pitcher stats or None
@@ -63,36 +44,18 @@ def get_pitcher_stats(pitcher_name: str, season: int = 2025) -> Optional[Dict[st
     try:
         # Get all pitcher stats for the season from Baseball Reference
         logger.info(f"Fetching pitcher stats for {pitcher_name}, {season} season (Baseball Reference)")
-        stats = pitching_stats_bref(season)
-
-        # Find the pitcher
-        name_parts = pitcher_name.split()
-        if len(name_parts) < 2:
+        if len(pitcher_name.split()) < 2:
             logger.error(f"Invalid pitcher name format: {pitcher_name}")
             return None
 
-        # Normalize name parts for matching (handles accented characters)
-        first_name = name_parts[0]
-        last_name = name_parts[-1]
-        first_name_normalized = normalize_name(first_name)
-        last_name_normalized = normalize_name(last_name)
-
-        # Normalize the Name column in stats for matching
-        stats['Name_normalized'] = stats['Name'].apply(normalize_name)
+        # Season table indexed by normalized name (handles accented characters)
+        index = get_season_tables().index('bref_pitching', season)
+        pitcher = index.row(pitcher_name, player_id) if index else None
 
-        # Search for pitcher (try normalized names first, then original)
-        pitcher_df = stats[
-            (stats['Name_normalized'].str.contains(first_name_normalized, case=False, na=False)) &
-            (stats['Name_normalized'].str.contains(last_name_normalized, case=False, na=False))
-        ]
-
-        if pitcher_df.empty:
-            logger.warning(f"No stats found for {pitcher_name} in {season} (tried normalized: {first_name_normalized} {last_name_normalized})")
+        if pitcher is None:
+            logger.warning(f"No stats found for {pitcher_name} in {season}")
             return None
 
-        # Get first match
-        pitcher = pitcher_df.iloc[0]
-
         # Calculate rate stats if not available
         ip = float(pitcher.get('IP', 0))
         so = int(pitcher.get('SO', 0))
@@ -124,98 +87,42 @@ def get_pitcher_stats(pitcher_name: str, season: int = 2025) -> Optional[Dict[st
         return None
 
 
-def get_pitch_mix(pitcher_name: str, season: int = 2025) -> List[Dict[str, Any]]:
+def get_pitch_mix(pitcher_name: str, season: int = 2025, pitcher_id: Optional[int] = None) -> List[Dict[str, Any]]:
     """
     Get pitch mix data from Statcast/Baseball Savant.
 
+    Served from the league-wide season arsenals (see pitch_arsenals), so
+    after the day's table is built this is a dict lookup. Returns an
+    empty list until the slate prefetch has built the table.
+
     Args:
         pitcher_name: Pitcher's name
         season: Season year
+        pitcher_id: MLBAM player ID (skips the name lookup)
 
     Returns:
         List of pitch dicts with name, usage, velocity, spin, whiff
     """
-    # Check cache first
-    cache_params = {'pitcher_name': pitcher_name, 'season': season}
-    cached = _cache.get('statcast', 'pitch_mix', cache_params)
-    if cached is not None:
-        logger.debug(f"Cache hit for pitch mix: {pitcher_name}")
-        return cached
-
     try:
-        logger.info(f"Fetching pitch mix for {pitcher_name}, {season} season")
-
-        # Look up player ID
-        name_parts = pitcher_name.split()
-        if len(name_parts) < 2:
-            return []
-
-        first_name = name_parts[0]
-        last_name = name_parts[-1]
+        if pitcher_id is None:
+            # Look up player ID
+            name_parts = pitcher_name.split()
+            if len(name_parts) < 2:
+                return []
 
-        # Get player ID from lookup
-        player_lookup = playerid_lookup(last_name, first_name)
-        if player_lookup.empty:
-            logger.warning(f"Could not find player ID for {pitcher_name}")
-            return []
+            first_name = name_parts[0]
+            last_name = name_parts[-1]
 
-        mlb_id = player_lookup.iloc[0]['key_mlbam']
+            player_lookup = playerid_lookup(last_name, first_name)
+            if player_lookup.empty:
+                logger.warning(f"Could not find player ID for {pitcher_name}")
+                return []
 
-        # Get Statcast data
-        statcast_data = statcast_pitcher(f'{season}-03-01', f'{season}-10-31', int(mlb_id))
+            pitcher_id = int(player_lookup.iloc[0]['key_mlbam'])
 
-        if statcast_data.empty:
+        pitch_mix = get_arsenal_store().pitch_mix(pitcher_id, season)
+        if not pitch_mix:
             logger.warning(f"No Statcast data for {pitcher_name} in {season}")
-            return []
-
-        # Group by pitch type
-        pitch_groups = statcast_data.groupby('pitch_type')
-
-        pitch_mix = []
-        total_pitches = len(statcast_data)
-
-        for pitch_type, group in pitch_groups:
-            if pd.isna(pitch_type) or pitch_type == '':
-                continue
-
-            count = len(group)
-            usage = (count / total_pitches) * 100
-
-            # Get pitch name
-            pitch_name = get_pitch_name(pitch_type)
-
-            # Calculate stats
-            avg_velo = group['release_speed'].mean() if 'release_speed' in group else 0
-            avg_spin = int(group['release_spin_rate'].mean()) if 'release_spin_rate' in group else 0
-
-            # Whiff rate (swinging strikes / total swings)
-            swings = group[group['description'].isin(['swinging_strike', 'swinging_strike_blocked', 'foul', 'hit_into_play'])]
-            whiffs = group[group['description'].isin(['swinging_strike', 'swinging_strike_blocked'])]
-            whiff_rate = (len(whiffs) / len(swings) * 100) if len(swings) > 0 else 0
-
-            # RV/100 (run value per 100 pitches)
-            # delta_run_exp is the run expectancy change on each pitch
-            if 'delta_run_exp' in group.columns:
-                run_value_per_pitch = group['delta_run_exp'].mean()
-                rv_100 = run_value_per_pitch * 100
-            else:
-                rv_100 = 0
-
-            pitch_mix.append({
-                'name': pitch_name,
-                'usage': usage,
-                'velocity': avg_velo,
-                'spin': avg_spin,
-                'whiff': whiff_rate,
-                'rv_100': rv_100
-            })
-
-        # Sort by usage
-        pitch_mix.sort(key=lambda x: x['usage'], reverse=True)
-
-        # Cache the result
-        _cache.set('statcast', 'pitch_mix', cache_params, pitch_mix)
-
         return pitch_mix
 
     except Exception as e:
@@ -223,68 +130,35 @@ def get_pitch_mix(pitcher_name: str, season: int = 2025) -> List[Dict[str, Any]]
         return []
 
 
-def get_pitch_name(pitch_code: str) -> str:
-    """Convert pitch type code to readable name."""
-    pitch_names = {
-        'FF': '4-Seam FB',
-        'SI': 'Sinker',
-        'FC': 'Cutter',
-        'SL': 'Slider',
-        'CU': 'Curveball',
-        'CH': 'Changeup',
-        'FS': 'Splitter',
-        'KN': 'Knuckleball',
-        'SC': 'Screwball',
-        'FO': 'Forkball',
-        'EP': 'Eephus',
-        'FA': 'Fastball',
-        'ST': 'Sweeper',
-        'SV': 'Slurve'
-    }
-    return pitch_names.get(pitch_code, pitch_code)
-
-
-def get_batter_stats(batter_name: str, season: int = 2025) -> Optional[Dict[str, Any]]:
+def get_batter_stats(
+    batter_name: str,
+    season: int = 2025,
+    player_id: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
     """
     Get batter stats from Baseball Reference for a season.
 
     Args:
         batter_name: Batter's name (e.g., "Aaron Judge")
         season: Season year
+        player_id: MLBAM player ID (picks the right player when names clash)
 
     Returns:
         Dict with batter stats or None
     """
     try:
         logger.info(f"Fetching batter stats for {batter_name}, {season} season (Baseball Reference)")
-        stats = batting_stats_bref(season)
-
-        # Find the batter
-        name_parts = batter_name.split()
-        if len(name_parts) < 2:
+        if len(batter_name.split()) < 2:
             return None
 
-        # Normalize name parts for matching (handles accented characters)
-        first_name = name_parts[0]
-        last_name = name_parts[-1]
-        first_name_normalized = normalize_name(first_name)
-        last_name_normalized = normalize_name(last_name)
-
-        # Normalize the Name column in stats for matching
-        stats['Name_normalized'] = stats['Name'].apply(normalize_name)
-
-        # Search for batter using normalized names
-        batter_df = stats[
-            (stats['Name_normalized'].str.contains(first_name_normalized, case=False, na=False)) &
-            (stats['Name_normalized'].str.contains(last_name_normalized, case=False, na=False))
-        ]
+        # Season table indexed by normalized name (handles accented characters)
+        index = get_season_tables().index('bref_batting', season)
+        batter = index.row(batter_name, player_id) if index else None
 
-        if batter_df.empty:
-            logger.warning(f"No stats found for {batter_name} in {season} (tried normalized: {first_name_normalized} {last_name_normalized})")
+        if batter is None:
+            logger.warning(f"No stats found for {batter_name} in {season}")
             return None
 
-        batter = batter_df.iloc[0]
-
         # Format slash line (AVG/OBP/SLG)
         avg = float(batter.get('BA', 0))  # Baseball Reference uses 'BA' instead of 'AVG'
         obp = float(batter.get('OBP', 0))
@@ -319,8 +193,9 @@ def get_fangraphs_batting_stats(season: int = 2025) -> Optional[pd.DataFrame]:
     """
     Get all FanGraphs batting stats for a season.
 
-    Returns DataFrame with oWAR, dWAR, wRC+, etc. for all qualified batters.
-    Results are cached for the session.
+    Returns DataFrame with oWAR, dWAR, wRC+, etc. for all batters with a
+    plate appearance. The table is loaded once per process (and cached
+    between runs).
 
     Args:
         season: Season year
@@ -328,30 +203,31 @@ def get_fangraphs_batting_stats(season: int = 2025) -> Optional[pd.DataFrame]:
     Returns:
         DataFrame with FanGraphs batting stats or None
     """
-    # Check cache first
-    cache_params = {'season': season}
-    cached = _cache.get('fangraphs', 'batting_stats', cache_params)
-    if cached is not None:
-        logger.debug(f"Cache hit for FanGraphs batting stats {season}")
-        return pd.DataFrame(cached)
+    return get_season_tables().get('fangraphs_batting', season)
 
-    try:
-        logger.info(f"Fetching FanGraphs batting stats for {season} season...")
-        # qual=1 means at least 1 PA (we want all players)
-        df = batting_stats(season, qual=1)
-        logger.info(f"Got FanGraphs stats for {len(df)} batters")
 
-        # Cache as list of dicts for JSON serialization
-        _cache.set('fangraphs', 'batting_stats', cache_params, df.to_dict('records'))
+def get_fangraphs_pitching_stats(season: int = 2025) -> Optional[pd.DataFrame]:
+    """
+    Get all FanGraphs pitching stats for a season.
+
+    Returns DataFrame with WAR, FIP, xFIP, K%, BB%, etc. for all pitchers
+    with an inning pitched. The table is loaded once per process (and
+    cached between runs).
 
-        return df
+    Args:
+        season: Season year
 
-    except Exception as e:
-        logger.error(f"Error fetching FanGraphs batting stats: {e}", exc_info=True)
-        return None
+    Returns:
+        DataFrame with FanGraphs pitching stats or None
+    """
+    return get_season_tables().get('fangraphs_pitching', season)
 
 
-def get_batter_fangraphs_stats(player_name: str, season: int = 2025) -> Optional[Dict[str, Any]]:
+def get_batter_fangraphs_stats(
+    player_name: str,
+    season: int = 2025,
+    player_id: Optional[int] = None
+) -> Optional[Dict[str, Any]]:
     """
     Get batter stats from FanGraphs for a season.
 
@@ -360,41 +236,23 @@ def get_batter_fangraphs_stats(player_name: str, season: int = 2025) -> Optional
     Args:
         player_name: Player's name (e.g., "Aaron Judge")
         season: Season year
+        player_id: MLBAM player ID (picks the right player when names clash)
 
     Returns:
         Dict with FanGraphs stats or None
     """
     try:
-        # Get full FanGraphs dataset (cached)
-        df = get_fangraphs_batting_stats(season)
-        if df is None or df.empty:
-            return None
-
-        # Normalize player name for matching
-        name_parts = player_name.split()
-        if len(name_parts) < 2:
+        if len(player_name.split()) < 2:
             return None
 
-        first_name = name_parts[0]
-        last_name = name_parts[-1]
-        first_name_normalized = normalize_name(first_name)
-        last_name_normalized = normalize_name(last_name)
+        # Full FanGraphs dataset (cached), indexed by normalized name
+        index = get_season_tables().index('fangraphs_batting', season)
+        player = index.row(player_name, player_id) if index else None
 
-        # Normalize names in dataframe
-        df['Name_normalized'] = df['Name'].apply(normalize_name)
-
-        # Search for player
-        player_df = df[
-            (df['Name_normalized'].str.contains(first_name_normalized, case=False, na=False)) &
-            (df['Name_normalized'].str.contains(last_name_normalized, case=False, na=False))
-        ]
-
-        if player_df.empty:
+        if player is None:
             logger.debug(f"No FanGraphs stats for {player_name}")
             return None
 
-        player = player_df.iloc[0]
-
         # FanGraphs columns:
         # WAR = total WAR
         # Off = offensive runs above average
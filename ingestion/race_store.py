@@ -0,0 +1,221 @@
+"""
+Incrementally updated division race series.
+
+The division race charts plot every team's cumulative record game by
+game. Recomputing that from the full season schedule on every preview
+rebuild repeats work for games that finished weeks ago. RaceStore keeps
+the cumulative series for all teams on disk (data/race/<season>.json)
+together with the date it covers through. A refresh fetches only the
+league-wide schedule for the days after that date, builds their race
+rows, continues each team's running totals from its last stored game,
+and appends them; mid-season, that is a one-day schedule request.
+
+Only days that are over are stored (through yesterday at most), so a
+game still in progress never has to be corrected later.
+
+Usage:
+    store = get_race_store()
+    races = store.race_frame(2025)
+    nyy = races[races['team'] == 'NYY']
+"""
+
+import json
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+
+from config.logging_config import get_logger
+from ingestion.season_schedule import SEASON_END, SeasonSchedule, get_season_schedule
+from utils.api_cache import FINAL_GAME_STATUSES
+from utils.atomic_io import atomic_write_json, content_checksum, quarantine_file
+
+logger = get_logger(__name__)
+
+
+# Statuses of games that won't be played (or resumed) on their scheduled date
+_SKIPPED_STATUS_PREFIXES = ('Postponed', 'Cancelled', 'Suspended')
+
+
+def _is_settled(status: str) -> bool:
+    """Whether a game's status won't change its result on its scheduled date."""
+    return status.startswith('Final') or status in FINAL_GAME_STATUSES or status.startswith(_SKIPPED_STATUS_PREFIXES)
+
+
+def _covered_through(games: List[Dict], through_date: str) -> str:
+    """
+    The last date (at most through_date) the games cover with settled results.
+
+    Stops before the first day with a game that hasn't settled, e.g. one
+    still in progress in a schedule cached while it was being played.
+    """
+    dates = [g.get('game_date', '') for g in games if g.get('game_date', '') <= through_date]
+    covered = min(max(dates, default=''), through_date)
+    unsettled = [g.get('game_date', '') for g in games
+                 if g.get('game_date', '') <= covered and not _is_settled(g.get('status', ''))]
+    if unsettled:
+        first_unsettled = datetime.strptime(min(unsettled), '%Y-%m-%d')
+        covered = (first_unsettled - timedelta(days=1)).strftime('%Y-%m-%d')
+    return covered
+
+
+class RaceStore:
+    """Per-season cumulative race series for every team, extended day by day."""
+
+    def __init__(self, store_dir: str = "data/race", client=None):
+        """
+        Initialize store.
+
+        Args:
+            store_dir: Directory for stored race series
+            client: MLBStatsAPIClient to fetch with (default: the shared client)
+        """
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self._client = client
+
+        # season -> (through_date, races)
+        self._races: Dict[int, Tuple[str, pd.DataFrame]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            from ingestion.mlb_api_client import get_mlb_client
+            self._client = get_mlb_client()
+        return self._client
+
+    def _path(self, season: int) -> Path:
+        return self.store_dir / f"{season}.json"
+
+    def _load(self, season: int) -> Optional[Tuple[str, pd.DataFrame]]:
+        """Load a stored series, quarantining it if corrupt."""
+        path = self._path(season)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r') as f:
+                stored = json.load(f)
+            if stored.get('_checksum') != content_checksum(stored['races']):
+                raise ValueError('checksum mismatch')
+            return stored['through_date'], pd.DataFrame.from_records(stored['races'])
+        except Exception as e:
+            quarantine_file(path, reason=str(e))
+            return None
+
+    def _save(self, season: int, through_date: str, races: pd.DataFrame) -> None:
+        records = races.to_dict(orient='records')
+        try:
+            atomic_write_json(self._path(season), {
+                'season': season,
+                'through_date': through_date,
+                'races': records,
+                '_checksum': content_checksum(records)
+            }, indent=None)
+        except Exception as e:
+            logger.warning(f"Could not save {season} race series: {e}")
+
+    def _build(self, season: int, through_date: str) -> Tuple[str, pd.DataFrame]:
+        """Build the series from the full season schedule."""
+        schedule = get_season_schedule(season, client=self.client)
+        covered = _covered_through(schedule.games, through_date)
+        races = schedule.race_frame()
+        return covered, races[races['date'] <= covered].reset_index(drop=True)
+
+    def _extend(
+        self,
+        season: int,
+        races: pd.DataFrame,
+        after_date: str,
+        through_date: str
+    ) -> Tuple[str, pd.DataFrame]:
+        """
+        Append the games played after after_date, continuing each team's totals.
+
+        Returns:
+            (date now covered through, extended series). The covered date
+            only advances to the last day the schedule returned games for,
+            so a failed (empty) fetch is retried on the next refresh.
+        """
+        start = (datetime.strptime(after_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+        games = self.client.get_schedule(start_date=start, end_date=through_date)
+        if not games:
+            return after_date, races
+
+        covered = _covered_through(games, through_date)
+        if covered <= after_date:
+            return after_date, races
+
+        new = SeasonSchedule(season, games).race_frame()
+        new = new[new['date'] <= covered]
+        if new.empty:
+            return covered, races
+
+        # Running totals from each team's last stored game
+        last = races.groupby('team_id').last() if not races.empty else pd.DataFrame(
+            columns=['game_number', 'wins', 'losses'])
+        new = new.copy()
+        for column in ('game_number', 'wins', 'losses'):
+            new[column] += new['team_id'].map(last[column]).fillna(0).astype(int)
+        new['games_above_500'] = new['wins'] - new['losses']
+
+        logger.info(f"Appended {len(new)} race rows for {season} ({start} to {covered})")
+        return covered, pd.concat([races, new], ignore_index=True).sort_values(
+            ['team_id', 'game_number'], kind='stable', ignore_index=True
+        )
+
+    def race_frame(self, season: int, through_date: Optional[str] = None) -> pd.DataFrame:
+        """
+        Get every team's cumulative race series for a season.
+
+        Args:
+            season: Season year
+            through_date: Last date to include (YYYY-MM-DD; default:
+                          yesterday, or the end of a past season)
+
+        Returns:
+            DataFrame as SeasonSchedule.race_frame(): team_id, team,
+            game_number, wins, losses, games_above_500, result and date
+        """
+        if through_date is None:
+            yesterday = (date.today() - timedelta(days=1)).strftime('%Y-%m-%d')
+            through_date = min(yesterday, f"{season}-{SEASON_END}")
+
+        with self._lock:
+            stored = self._races.get(season) or self._load(season)
+
+            if stored is None:
+                covered, races = self._build(season, through_date)
+                if races.empty:
+                    # Nothing played yet, or the schedule fetch failed
+                    return races
+            elif stored[0] < through_date:
+                covered, races = self._extend(season, stored[1], stored[0], through_date)
+            else:
+                # Already covers the requested date
+                self._races[season] = stored
+                races = stored[1]
+                return races[races['date'] <= through_date]
+
+            self._races[season] = (covered, races)
+            if covered != (stored[0] if stored else None):
+                self._save(season, covered, races)
+            return races
+
+    def clear(self) -> None:
+        """Drop series held in memory (the stored files are kept)."""
+        with self._lock:
+            self._races.clear()
+
+
+# Global store instance
+_store: Optional[RaceStore] = None
+
+
+def get_race_store() -> RaceStore:
+    """Get or create the global race store."""
+    global _store
+    if _store is None:
+        _store = RaceStore()
+    return _store
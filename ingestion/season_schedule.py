@@ -0,0 +1,258 @@
+"""
+Columnar index over a full season's MLB schedule.
+
+Schedule context, head-to-head records and the division race charts all
+slice the same season schedule. SeasonSchedule is built once per season
+from the league-wide schedule (one request instead of one per team) and
+stores it as numpy columns (date, gamePk, team IDs, scores, status, game
+type) with per-team and per-date row indexes, so those lookups are array
+slices rather than Python loops over every game.
+
+Usage:
+    schedule = get_season_schedule(2025)
+    rows = schedule.team_rows(147)
+    wins, losses = schedule.head_to_head(147, 111, before_date='2025-09-25')
+    race = schedule.team_results(147)
+    races = schedule.race_frame()  # every team's cumulative record
+"""
+
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from config.logging_config import get_logger
+from utils.team_data import TEAM_ID_TO_ABBR
+
+logger = get_logger(__name__)
+
+# Season date range used for schedule requests (covers spring training
+# through the World Series)
+SEASON_START = '03-01'
+SEASON_END = '11-15'
+
+# How long a built season schedule is reused before re-reading the cache
+SCHEDULE_MEMO_SECONDS = 600
+
+# Regular season game types counted in the standings races
+RACE_GAME_TYPES = ('R', 'F')
+
+
+class SeasonSchedule:
+    """A season's games as numpy columns with per-team and per-date indexes."""
+
+    def __init__(self, season: int, games: List[Dict]):
+        """
+        Build the index.
+
+        Args:
+            season: Season year
+            games: League-wide schedule (statsapi.schedule() dicts)
+        """
+        self.season = season
+
+        order = sorted(range(len(games)), key=lambda i: (games[i].get('game_date', ''), games[i].get('game_datetime', '')))
+        self.games = [games[i] for i in order]
+
+        def column(key: str, dtype, default: Any) -> np.ndarray:
+            return np.array([g.get(key) or default for g in self.games], dtype=dtype)
+
+        self.game_pk = column('game_id', np.int64, 0)
+        self.date = column('game_date', 'datetime64[D]', 'NaT')
+        self.home_id = column('home_id', np.int32, 0)
+        self.away_id = column('away_id', np.int32, 0)
+        self.home_score = column('home_score', np.int16, 0)
+        self.away_score = column('away_score', np.int16, 0)
+        self.status = column('status', object, '')
+        self.game_type = column('game_type', object, '')
+        # 'Final', 'Final: Tied', 'Completed Early'
+        self.final = np.array(
+            [s.startswith('Final') or s == 'Completed Early' for s in self.status], dtype=bool
+        )
+
+        # Team -> row numbers (in date order), from one stable sort over
+        # both team columns
+        rows = np.arange(len(self.games))
+        team_ids = np.concatenate([self.home_id, self.away_id])
+        team_rows = np.concatenate([rows, rows])
+        by_team = np.argsort(team_ids, kind='stable')
+        team_ids, team_rows = team_ids[by_team], team_rows[by_team]
+        starts = np.flatnonzero(np.r_[True, team_ids[1:] != team_ids[:-1]]) if len(team_ids) else []
+        self._team_rows: Dict[int, np.ndarray] = {
+            int(team_ids[start]): np.sort(team_rows[start:end])
+            for start, end in zip(starts, list(starts[1:]) + [len(team_ids)])
+        }
+
+        # Race frames by game types, built on first use
+        self._race_frames: Dict[Tuple[str, ...], pd.DataFrame] = {}
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def team_rows(self, team_id: int) -> np.ndarray:
+        """Row numbers of a team's games, in date order."""
+        return self._team_rows.get(team_id, np.array([], dtype=np.int64))
+
+    def date_rows(self, start_date: str, end_date: Optional[str] = None) -> np.ndarray:
+        """Row numbers of all games from start_date through end_date (inclusive)."""
+        # Rows are in date order, so a date range is a contiguous slice
+        start = np.searchsorted(self.date, np.datetime64(start_date), side='left')
+        end = np.searchsorted(self.date, np.datetime64(end_date or start_date), side='right')
+        return np.arange(start, end)
+
+    def team_games(
+        self,
+        team_id: int,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ) -> List[Dict]:
+        """
+        A team's games as schedule dicts (copies), optionally within a date range.
+
+        Args:
+            team_id: MLB team ID
+            start_date: First date to include (YYYY-MM-DD)
+            end_date: Last date to include (YYYY-MM-DD)
+
+        Returns:
+            List of statsapi.schedule() style game dicts
+        """
+        rows = self.team_rows(team_id)
+        dates = self.date[rows]
+        mask = np.ones(len(rows), dtype=bool)
+        if start_date:
+            mask &= dates >= np.datetime64(start_date)
+        if end_date:
+            mask &= dates <= np.datetime64(end_date)
+        return [dict(self.games[row]) for row in rows[mask]]
+
+    def head_to_head(self, team_id: int, opponent_id: int, before_date: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Count a team's wins and losses against an opponent in final games.
+
+        Args:
+            team_id: MLB team ID
+            opponent_id: Opponent's MLB team ID
+            before_date: Only count games before this date (YYYY-MM-DD)
+
+        Returns:
+            (wins, losses) from team_id's perspective (ties count as losses)
+        """
+        rows = self.team_rows(team_id)
+        mask = self.final[rows] & ((self.home_id[rows] == opponent_id) | (self.away_id[rows] == opponent_id))
+        if before_date:
+            mask &= self.date[rows] < np.datetime64(before_date)
+
+        rows = rows[mask]
+        is_home = self.home_id[rows] == team_id
+        team_score = np.where(is_home, self.home_score[rows], self.away_score[rows])
+        opp_score = np.where(is_home, self.away_score[rows], self.home_score[rows])
+        wins = int(np.count_nonzero(team_score > opp_score))
+        return wins, len(rows) - wins
+
+    def race_frame(self, game_types: Tuple[str, ...] = RACE_GAME_TYPES) -> pd.DataFrame:
+        """
+        Game-by-game records for every team at once.
+
+        Each completed game contributes one row per team; cumulative
+        wins and losses come from one grouped cumsum over all 30 teams.
+        Built once per game_types and reused.
+
+        Args:
+            game_types: Game types to include (default: regular season)
+
+        Returns:
+            DataFrame with team_id, team, game_number, wins, losses,
+            games_above_500, result ('W'/'L') and date, ordered by team
+            and date
+        """
+        frame = self._race_frames.get(game_types)
+        if frame is not None:
+            return frame
+
+        rows = np.flatnonzero(self.final & np.isin(self.game_type, game_types))
+        home_won = self.home_score[rows] > self.away_score[rows]
+        away_won = self.away_score[rows] > self.home_score[rows]
+
+        frame = pd.DataFrame({
+            'row': np.concatenate([rows, rows]),
+            'team_id': np.concatenate([self.home_id[rows], self.away_id[rows]]),
+            'won': np.concatenate([home_won, away_won]),
+        }).sort_values(['team_id', 'row'], kind='stable', ignore_index=True)
+
+        by_team = frame.groupby('team_id', sort=False)
+        frame['game_number'] = by_team.cumcount() + 1
+        frame['wins'] = by_team['won'].cumsum()
+        frame['losses'] = frame['game_number'] - frame['wins']
+        frame['games_above_500'] = frame['wins'] - frame['losses']
+        frame['result'] = np.where(frame['won'], 'W', 'L')
+        frame['date'] = self.date[frame['row'].to_numpy()].astype(str)
+        frame['team'] = frame['team_id'].map(TEAM_ID_TO_ABBR)
+
+        frame = frame[['team_id', 'team', 'game_number', 'wins', 'losses', 'games_above_500', 'result', 'date']]
+        self._race_frames[game_types] = frame
+        return frame
+
+    def team_results(self, team_id: int, game_types: Tuple[str, ...] = RACE_GAME_TYPES) -> pd.DataFrame:
+        """
+        Game-by-game record for a team's completed games.
+
+        Args:
+            team_id: MLB team ID
+            game_types: Game types to include (default: regular season)
+
+        Returns:
+            DataFrame with game_number, wins, losses, games_above_500,
+            result ('W'/'L') and date, or an empty DataFrame
+        """
+        frame = self.race_frame(game_types)
+        team_frame = frame[frame['team_id'] == team_id]
+        if team_frame.empty:
+            return pd.DataFrame()
+        return team_frame.drop(columns=['team_id', 'team']).reset_index(drop=True)
+
+
+# Built schedules by season: season -> (built_at, schedule)
+_schedules: Dict[int, Tuple[float, SeasonSchedule]] = {}
+_schedules_lock = threading.Lock()
+
+
+def get_season_schedule(season: int, client=None) -> SeasonSchedule:
+    """
+    Get the season schedule index, building it from the league-wide schedule.
+
+    The schedule itself comes from the API cache (one league-wide request
+    per season); the built index is reused for SCHEDULE_MEMO_SECONDS.
+
+    Args:
+        season: Season year
+        client: MLBStatsAPIClient to fetch with (default: the shared client)
+
+    Returns:
+        SeasonSchedule (empty if the schedule could not be fetched)
+    """
+    with _schedules_lock:
+        entry = _schedules.get(season)
+        if entry is not None and time.monotonic() - entry[0] < SCHEDULE_MEMO_SECONDS:
+            return entry[1]
+
+    if client is None:
+        from ingestion.mlb_api_client import get_mlb_client
+        client = get_mlb_client()
+
+    games = client.get_schedule(start_date=f"{season}-{SEASON_START}", end_date=f"{season}-{SEASON_END}")
+    schedule = SeasonSchedule(season, games)
+    logger.info(f"Built {season} season schedule index: {len(schedule)} games")
+
+    # Don't hold on to a failed (empty) fetch
+    if len(schedule):
+        with _schedules_lock:
+            _schedules[season] = (time.monotonic(), schedule)
+    return schedule
+
+
+def clear_season_schedules() -> None:
+    """Drop built season schedules (they are rebuilt from the cache on next use)."""
+    with _schedules_lock:
+        _schedules.clear()
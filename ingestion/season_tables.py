@@ -0,0 +1,149 @@
+"""
+Season stats tables (Baseball Reference, FanGraphs), loaded once per process.
+
+The pybaseball season tables hold one row per player for a whole
+season. Reading them through pybaseball on every player lookup re-parses
+its cached HTML/CSV each time; SeasonTables loads each (table, season)
+once per process instead. The first load goes through the API cache,
+which stores DataFrames as Parquet, so later runs read a compressed
+columnar file rather than calling pybaseball at all.
+
+Tables are shared, so callers get copies: changes a caller makes
+(adding a column, setting a value) stay in its copy and never reach the
+shared table, with or without pandas copy-on-write.
+
+Tables:
+    bref_pitching       Baseball Reference pitching (pitching_stats_bref)
+    bref_batting        Baseball Reference batting (batting_stats_bref)
+    fangraphs_batting   FanGraphs batting, all batters with a PA
+    fangraphs_pitching  FanGraphs pitching, all pitchers with an inning
+
+Usage:
+    tables = get_season_tables()
+    df = tables.get('fangraphs_pitching', 2025)
+    index = tables.index('bref_batting', 2025)
+"""
+
+import threading
+from typing import Callable, Dict, Optional, Tuple
+import pandas as pd
+from pybaseball import batting_stats, batting_stats_bref, pitching_stats, pitching_stats_bref
+
+from config.logging_config import get_logger
+from ingestion.player_index import PlayerIndex, get_player_index
+from utils.api_cache import APICache, get_api_cache
+
+logger = get_logger(__name__)
+
+# Table name -> (cache source, cache endpoint, loader(season))
+SEASON_TABLES: Dict[str, Tuple[str, str, Callable[[int], pd.DataFrame]]] = {
+    'bref_pitching': ('bref', 'pitching_stats', pitching_stats_bref),
+    'bref_batting': ('bref', 'batting_stats', batting_stats_bref),
+    # qual=1: every player, not just qualified ones
+    'fangraphs_batting': ('fangraphs', 'batting_stats', lambda season: batting_stats(season, qual=1)),
+    'fangraphs_pitching': ('fangraphs', 'pitching_stats', lambda season: pitching_stats(season, qual=1)),
+}
+
+
+class SeasonTables:
+    """Per-process store of pybaseball season tables, backed by the API cache."""
+
+    def __init__(self, cache: Optional[APICache] = None):
+        """
+        Initialize store.
+
+        Args:
+            cache: API cache for loaded tables (default: the shared cache)
+        """
+        self.cache = cache or get_api_cache()
+
+        # (table, season) -> DataFrame
+        self._tables: Dict[Tuple[str, int], pd.DataFrame] = {}
+        self._lock = threading.Lock()
+        self._load_locks: Dict[Tuple[str, int], threading.Lock] = {}
+
+    def _load(self, table: str, season: int) -> Optional[pd.DataFrame]:
+        source, endpoint, loader = SEASON_TABLES[table]
+
+        def fetch() -> pd.DataFrame:
+            logger.info(f"Fetching {table} table for {season} season...")
+            df = loader(season)
+            logger.info(f"Got {table} {season}: {len(df)} players")
+            return df
+
+        df = self.cache.get_or_fetch(source, endpoint, {'season': season}, fetch)
+        if df is None:
+            return None
+        # Entries cached before DataFrame support are lists of records
+        return df if isinstance(df, pd.DataFrame) else pd.DataFrame(df)
+
+    def get(self, table: str, season: int) -> Optional[pd.DataFrame]:
+        """
+        Get a season table.
+
+        Args:
+            table: Table name (see SEASON_TABLES)
+            season: Season year
+
+        Returns:
+            DataFrame (a copy of the shared table), or None
+            if it could not be loaded
+
+        Raises:
+            KeyError: If the table name is unknown
+        """
+        if table not in SEASON_TABLES:
+            raise KeyError(f"Unknown season table: {table}")
+
+        key = (table, season)
+        with self._lock:
+            df = self._tables.get(key)
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        if df is None:
+            # One load per table; concurrent callers wait for it
+            with load_lock:
+                with self._lock:
+                    df = self._tables.get(key)
+                if df is None:
+                    try:
+                        df = self._load(table, season)
+                    except Exception as e:
+                        logger.error(f"Error fetching {table} table for {season}: {e}", exc_info=True)
+                        return None
+                    if df is None:
+                        return None
+                    with self._lock:
+                        self._tables[key] = df
+
+        return df.copy()
+
+    def index(self, table: str, season: int) -> Optional[PlayerIndex]:
+        """
+        Get the player name index for a season table.
+
+        Args:
+            table: Table name (see SEASON_TABLES)
+            season: Season year
+
+        Returns:
+            PlayerIndex, or None if the table could not be loaded
+        """
+        return get_player_index(table, season, lambda: self.get(table, season))
+
+    def clear(self) -> None:
+        """Drop tables held in memory (cached copies are kept)."""
+        with self._lock:
+            self._tables.clear()
+
+
+# Global store instance
+_tables: Optional[SeasonTables] = None
+
+
+def get_season_tables() -> SeasonTables:
+    """Get or create the global season table store."""
+    global _tables
+    if _tables is None:
+        _tables = SeasonTables()
+    return _tables
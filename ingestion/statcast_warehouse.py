@@ -0,0 +1,338 @@
+"""
+Local warehouse of league-wide Statcast pitch data, partitioned by date.
+
+Pitch mix and RE24 used to download each player's full season from
+Baseball Savant (statcast_pitcher / statcast_batter), so the same
+pitches were fetched again for every pitcher and batter who took part in
+them. The warehouse ingests every pitch once, league-wide, by date
+(pybaseball.statcast(start, end)), into Parquet files partitioned by
+season and date:
+
+    data/statcast/season=2025/game_date=2025-06-01/part.parquet
+
+Queries read them with pyarrow.dataset, so the date range prunes whole
+partitions and player/game filters are pushed down into the scan. Each
+query first ingests any dates in its range that aren't stored yet; after
+the initial backfill that is just the days since the last query, and a
+pitch-mix or RE24 computation is a local scan.
+
+Only days that are over (before today) are ingested. A date's partition
+is written atomically and then marked done with a _done file (pyarrow
+skips files starting with '_'), so an interrupted ingest is redone, and
+days without games are remembered without a data file.
+
+The most recent PROVISIONAL_DAYS days are not marked done: a West Coast
+game can still be in progress after midnight, and Savant sometimes posts
+games late. Those dates get a _provisional marker instead and are fetched
+again once it is PROVISIONAL_REFRESH_HOURS old, until they are old
+enough to be marked done. settled_through() is the last date that can no
+longer change; incremental aggregates should only store results up to it.
+
+statcast() also returns an empty frame when Savant is down, so a date
+without pitches is only marked done when the season schedule shows no
+finished games for it; otherwise it stays provisional and is fetched
+again.
+
+Usage:
+    warehouse = get_statcast_warehouse()
+    pitches = warehouse.pitcher_pitches(543037, '2025-03-01', '2025-10-31')
+    game = warehouse.game_pitches(776135, '2025-06-01')
+"""
+
+import io
+import threading
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, Optional
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pybaseball import statcast
+
+from config.logging_config import get_logger
+from ingestion.season_schedule import SeasonSchedule, get_season_schedule
+from utils.atomic_io import atomic_open
+
+logger = get_logger(__name__)
+
+# Days fetched per statcast() call while ingesting (each chunk is written
+# before the next is fetched, so a long backfill keeps its progress)
+INGEST_CHUNK_DAYS = 7
+
+# Stored columns and types. A fixed schema keeps partitions consistent
+# when Savant adds columns or a day has a column that is entirely null.
+WAREHOUSE_SCHEMA = pa.schema([
+    ('game_pk', pa.int64()),
+    ('at_bat_number', pa.int32()),
+    ('pitch_number', pa.int32()),
+    ('inning', pa.int32()),
+    ('inning_topbot', pa.string()),
+    ('home_team', pa.string()),
+    ('away_team', pa.string()),
+    ('game_type', pa.string()),
+    ('batter', pa.int64()),
+    ('pitcher', pa.int64()),
+    ('stand', pa.string()),
+    ('p_throws', pa.string()),
+    ('pitch_type', pa.string()),
+    ('pitch_name', pa.string()),
+    ('release_speed', pa.float64()),
+    ('release_spin_rate', pa.float64()),
+    ('description', pa.string()),
+    ('events', pa.string()),
+    ('delta_run_exp', pa.float64()),
+    ('bat_score', pa.float64()),
+    ('post_bat_score', pa.float64()),
+    ('balls', pa.int32()),
+    ('strikes', pa.int32()),
+    ('outs_when_up', pa.int32()),
+])
+
+# Directory partitions: season=YYYY/game_date=YYYY-MM-DD
+PARTITIONING = ds.partitioning(
+    pa.schema([('season', pa.int32()), ('game_date', pa.string())]),
+    flavor='hive'
+)
+
+# Stored columns plus the partition keys
+DATASET_SCHEMA = pa.schema(list(WAREHOUSE_SCHEMA) + list(PARTITIONING.schema))
+
+# Pitch order within a query result
+PITCH_ORDER = ['game_date', 'game_pk', 'at_bat_number', 'pitch_number']
+
+# Days before today whose pitches may still be incomplete (late games,
+# late postings), and how often they are fetched again meanwhile
+PROVISIONAL_DAYS = 2
+PROVISIONAL_REFRESH_HOURS = 3
+
+# Game types Statcast tracks: a finished game of these types has pitches
+STATCAST_GAME_TYPES = ['R', 'F', 'D', 'L', 'W']
+
+_DONE_MARKER = '_done'
+_PROVISIONAL_MARKER = '_provisional'
+
+
+def _date_range(start_date: str, end_date: str) -> List[str]:
+    start = datetime.strptime(start_date, '%Y-%m-%d').date()
+    end = datetime.strptime(end_date, '%Y-%m-%d').date()
+    return [(start + timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+
+def settled_through() -> str:
+    """The last date whose stored pitches are final (before the provisional days)."""
+    return (date.today() - timedelta(days=PROVISIONAL_DAYS + 1)).isoformat()
+
+
+def _to_table(df: pd.DataFrame) -> pa.Table:
+    """Coerce a statcast() frame to the warehouse schema."""
+    columns = {}
+    for field in WAREHOUSE_SCHEMA:
+        values = df[field.name] if field.name in df.columns else pd.Series([None] * len(df), dtype=object)
+        if pa.types.is_string(field.type):
+            values = values.astype('string')
+        else:
+            values = pd.to_numeric(values, errors='coerce')
+            if pa.types.is_integer(field.type):
+                values = values.astype('Int64')
+        columns[field.name] = pa.array(values, type=field.type, from_pandas=True)
+    return pa.Table.from_pydict(columns, schema=WAREHOUSE_SCHEMA)
+
+
+class StatcastWarehouse:
+    """Date-partitioned Parquet store of league-wide Statcast pitches."""
+
+    def __init__(self, root: str = "data/statcast", schedule: Optional[Callable[[int], SeasonSchedule]] = None):
+        """
+        Initialize warehouse.
+
+        Args:
+            root: Directory holding the partitioned dataset
+            schedule: Returns a season's schedule, to tell days without
+                      games from failed fetches (default: get_season_schedule)
+        """
+        self.root = Path(root)
+        self._schedule = schedule or get_season_schedule
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def _partition_dir(self, game_date: str) -> Path:
+        return self.root / f"season={game_date[:4]}" / f"game_date={game_date}"
+
+    def is_ingested(self, game_date: str) -> bool:
+        """
+        Whether a date's pitches are stored (days without games included).
+
+        A provisionally stored date counts until its marker is
+        PROVISIONAL_REFRESH_HOURS old, then it is fetched again.
+        """
+        partition = self._partition_dir(game_date)
+        if (partition / _DONE_MARKER).exists():
+            return True
+        provisional = partition / _PROVISIONAL_MARKER
+        if not provisional.exists():
+            return False
+        age = time.time() - provisional.stat().st_mtime
+        return age < PROVISIONAL_REFRESH_HOURS * 3600
+
+    def _has_games(self, game_date: str) -> Optional[bool]:
+        """Whether the schedule has finished Statcast-tracked games on a date (None if unknown)."""
+        try:
+            schedule = self._schedule(int(game_date[:4]))
+        except Exception as e:
+            logger.warning(f"Could not check the schedule for {game_date}: {e}")
+            return None
+        if not len(schedule):
+            return None
+        rows = schedule.date_rows(game_date)
+        return bool(np.any(schedule.final[rows] & np.isin(schedule.game_type[rows], STATCAST_GAME_TYPES)))
+
+    def _write_partition(self, game_date: str, df: pd.DataFrame, done: bool) -> None:
+        """Write one date's pitches, then mark the date done (or provisional)."""
+        partition = self._partition_dir(game_date)
+        partition.mkdir(parents=True, exist_ok=True)
+        if not df.empty:
+            buffer = io.BytesIO()
+            pq.write_table(_to_table(df), buffer, compression='zstd')
+            with atomic_open(partition / 'part.parquet', 'wb') as f:
+                f.write(buffer.getvalue())
+
+        if done:
+            (partition / _DONE_MARKER).touch()
+            (partition / _PROVISIONAL_MARKER).unlink(missing_ok=True)
+        else:
+            (partition / _PROVISIONAL_MARKER).touch()
+
+    def _ingest(self, start_date: str, end_date: str) -> None:
+        """Fetch league-wide pitches for a date range and store them by date."""
+        logger.info(f"Ingesting Statcast pitches from {start_date} to {end_date}")
+        df = statcast(start_date, end_date, verbose=False)
+        if df is None:
+            raise RuntimeError(f"statcast() returned nothing for {start_date} to {end_date}")
+
+        dates = pd.to_datetime(df['game_date']).dt.strftime('%Y-%m-%d') if not df.empty else pd.Series(dtype=str)
+        for game_date in _date_range(start_date, end_date):
+            day = df[dates == game_date] if not df.empty else df
+            done = game_date <= settled_through()
+            if done and day.empty and self._has_games(game_date) is not False:
+                # A failed fetch, or games not posted yet: try again later
+                logger.warning(f"No Statcast pitches for {game_date}, which has games; will fetch it again")
+                done = False
+            self._write_partition(game_date, day, done)
+
+        logger.info(f"Stored {len(df)} pitches from {start_date} to {end_date}")
+
+    def ensure(self, start_date: str, end_date: str) -> int:
+        """
+        Ingest any dates in a range that aren't stored yet.
+
+        Dates from today on are skipped (their games may not be over);
+        the provisional days before today are fetched again when stale.
+
+        Args:
+            start_date: First date (YYYY-MM-DD)
+            end_date: Last date (YYYY-MM-DD)
+
+        Returns:
+            Number of dates ingested
+        """
+        last_complete = (date.today() - timedelta(days=1)).isoformat()
+        end_date = min(end_date, last_complete)
+        if start_date > end_date:
+            return 0
+
+        # One ingest at a time; concurrent queries wait and then find the
+        # dates already stored
+        with self._lock:
+            missing = [d for d in _date_range(start_date, end_date) if not self.is_ingested(d)]
+
+            # Contiguous chunks of missing dates, at most INGEST_CHUNK_DAYS long
+            chunks: List[List[str]] = []
+            for game_date in missing:
+                if (chunks and len(chunks[-1]) < INGEST_CHUNK_DAYS
+                        and _date_range(chunks[-1][-1], game_date) == [chunks[-1][-1], game_date]):
+                    chunks[-1].append(game_date)
+                else:
+                    chunks.append([game_date])
+
+            for chunk in chunks:
+                self._ingest(chunk[0], chunk[-1])
+
+        return len(missing)
+
+    def covers(self, start_date: str, end_date: str) -> bool:
+        """Whether every date in a range is stored (an empty range counts)."""
+        if start_date > end_date:
+            return True
+        return all(self.is_ingested(game_date) for game_date in _date_range(start_date, end_date))
+
+    def query(
+        self,
+        start_date: str,
+        end_date: str,
+        where: Optional[ds.Expression] = None,
+        columns: Optional[List[str]] = None,
+        ingest: bool = True
+    ) -> pd.DataFrame:
+        """
+        Read stored pitches, ingesting missing dates in the range first.
+
+        Args:
+            start_date: First date (YYYY-MM-DD)
+            end_date: Last date (YYYY-MM-DD)
+            where: Extra pyarrow filter (e.g. ds.field('pitcher') == 543037)
+            columns: Columns to read (default: all, plus game_date)
+            ingest: Ingest missing dates first (False: read only what is stored)
+
+        Returns:
+            DataFrame of pitches in game order (empty if none)
+        """
+        if ingest:
+            self.ensure(start_date, end_date)
+
+        expression = (
+            (ds.field('season') >= int(start_date[:4])) & (ds.field('season') <= int(end_date[:4])) &
+            (ds.field('game_date') >= start_date) & (ds.field('game_date') <= end_date)
+        )
+        if where is not None:
+            expression = expression & where
+
+        if columns is not None:
+            columns = list(dict.fromkeys(columns + PITCH_ORDER))
+        else:
+            columns = WAREHOUSE_SCHEMA.names + ['game_date']
+
+        # Date filters prune partitions by path; the rest is pushed into the scan
+        dataset = ds.dataset(self.root, format='parquet', partitioning=PARTITIONING, schema=DATASET_SCHEMA)
+        df = dataset.to_table(columns=columns, filter=expression).to_pandas()
+        return df.sort_values(PITCH_ORDER, ignore_index=True)
+
+    def pitcher_pitches(self, pitcher_id: int, start_date: str, end_date: str) -> pd.DataFrame:
+        """All pitches thrown by a pitcher in a date range."""
+        return self.query(start_date, end_date, ds.field('pitcher') == int(pitcher_id))
+
+    def batter_pitches(self, batter_id: int, start_date: str, end_date: str) -> pd.DataFrame:
+        """All pitches seen by a batter in a date range."""
+        return self.query(start_date, end_date, ds.field('batter') == int(batter_id))
+
+    def game_pitches(self, game_pk: int, game_date: str) -> pd.DataFrame:
+        """All pitches in one game."""
+        return self.query(game_date, game_date, ds.field('game_pk') == int(game_pk))
+
+    def date_pitches(self, game_date: str) -> pd.DataFrame:
+        """All pitches on one date."""
+        return self.query(game_date, game_date)
+
+
+# Global warehouse instance
+_warehouse: Optional[StatcastWarehouse] = None
+
+
+def get_statcast_warehouse() -> StatcastWarehouse:
+    """Get or create the global Statcast warehouse."""
+    global _warehouse
+    if _warehouse is None:
+        _warehouse = StatcastWarehouse()
+    return _warehouse
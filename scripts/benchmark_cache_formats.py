@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cached DataFrame load time and file size, JSON records vs Parquet.
+
+Compares the old FanGraphs cache format (indented JSON of
+df.to_dict('records'), rebuilt with pd.DataFrame on every hit) with the
+Parquet payloads APICache now writes for DataFrames.
+
+By default uses a synthetic table shaped like the FanGraphs season batting
+table (~1,400 batters x ~320 columns). Pass --season to benchmark the real
+table instead (fetched via pybaseball).
+
+Usage:
+    python scripts/benchmark_cache_formats.py
+    python scripts/benchmark_cache_formats.py --season 2025 --repeat 10
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils.cache_backends import dataframe_to_parquet_bytes
+
+
+def synthetic_fangraphs_table(rows: int = 1400, numeric_cols: int = 310) -> pd.DataFrame:
+    """Build a table with the shape and dtypes of the FanGraphs batting table."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        rng.normal(size=(rows, numeric_cols)).round(3),
+        columns=[f"stat_{i}" for i in range(numeric_cols)]
+    )
+    df.insert(0, 'IDfg', np.arange(rows))
+    df.insert(1, 'Season', 2025)
+    df.insert(2, 'Name', [f"Player {i}" for i in range(rows)])
+    df.insert(3, 'Team', rng.choice(['NYY', 'BOS', 'TB', 'TOR', 'BAL'], size=rows))
+    df['Age Rng'] = '27 - 27'
+    df['Dol'] = [f"${v:.1f}" for v in rng.uniform(-5, 60, size=rows)]
+    return df
+
+
+def time_load(load, repeat: int) -> float:
+    """Best-of-N wall time for a load function, in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        load()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark cached DataFrame formats (JSON records vs Parquet)',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--season', type=int, help='Benchmark the real FanGraphs table for this season')
+    parser.add_argument('--repeat', type=int, default=5, help='Loads per format (best time is reported)')
+    args = parser.parse_args()
+
+    if args.season:
+        from pybaseball import batting_stats
+        df = batting_stats(args.season, qual=1)
+        label = f"FanGraphs batting {args.season}"
+    else:
+        df = synthetic_fangraphs_table()
+        label = "synthetic FanGraphs-shaped table"
+
+    print()
+    print(f"Table: {label} ({len(df)} rows x {len(df.columns)} columns)")
+    print()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        # Old format: indented JSON of records, wrapped like an APICache entry
+        json_path = tmp / 'fangraphs_batting_stats.json'
+        with open(json_path, 'w') as f:
+            json.dump({'_response': df.to_dict('records')}, f, indent=2, default=str)
+
+        def load_json():
+            with open(json_path, 'r') as f:
+                return pd.DataFrame(json.load(f)['_response'])
+
+        # New format: Parquet, as written by the file backend
+        parquet_path = tmp / 'fangraphs_batting_stats.parquet'
+        parquet_path.write_bytes(dataframe_to_parquet_bytes(df))
+
+        def load_parquet(memory_map=False):
+            return pq.read_table(parquet_path, memory_map=memory_map).to_pandas()
+
+        results = [
+            ('JSON records', json_path.stat().st_size, time_load(load_json, args.repeat)),
+            ('Parquet (zstd)', parquet_path.stat().st_size, time_load(load_parquet, args.repeat)),
+            ('Parquet (zstd, mmap)', parquet_path.stat().st_size,
+             time_load(lambda: load_parquet(memory_map=True), args.repeat)),
+        ]
+
+    baseline_size, baseline_time = results[0][1], results[0][2]
+    print(f"{'Format':<22} {'Size':>10} {'Load':>10} {'Speedup':>9}")
+    print("-" * 54)
+    for name, size, ms in results:
+        print(
+            f"{name:<22} {size / 1024:>8.1f}KB {ms:>8.1f}ms {baseline_time / ms:>8.1f}x"
+            f"  ({size / baseline_size:.0%} of JSON size)"
+        )
+    print()
+
+
+if __name__ == '__main__':
+    main()
@@ -10,7 +10,6 @@ Usage:
 """
 
 import argparse
-import json
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -20,8 +19,9 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from ingestion.data_fetcher import fetch_game_data
-from ingestion.mlb_api_client import MLBStatsAPIClient
+from ingestion.mlb_api_client import get_mlb_client
 from utils.team_data import get_team_full_name
+from utils.atomic_io import atomic_write_json, content_checksum, to_json_native
 from config.logging_config import get_logger
 import statsapi
 
@@ -76,7 +76,7 @@ Examples:
 
     # Find pitcher info from schedule
     print("Looking up game info...")
-    client = MLBStatsAPIClient()
+    client = get_mlb_client()
     schedule = client.get_schedule(team=args.home_team, start_date=args.game_date, end_date=args.game_date)
 
     pitcher_names = None
@@ -127,12 +127,17 @@ Examples:
         'season': args.season
     }
 
-    # Save bundle
+    # Checksum the bundle content so render_preview can detect a damaged file
+    data = to_json_native(data)
+    data['bundle_metadata']['checksum'] = content_checksum(
+        {k: v for k, v in data.items() if k != 'bundle_metadata'}
+    )
+
+    # Save bundle (temp file + rename, so a killed build never leaves a partial bundle)
     bundle_filename = f"{args.away_team}_{args.home_team}_{args.game_date}.json"
     bundle_path = BUNDLE_DIR / bundle_filename
 
-    with open(bundle_path, 'w') as f:
-        json.dump(data, f, indent=2, default=str)
+    atomic_write_json(bundle_path, data)
 
     print()
     print("=" * 60)
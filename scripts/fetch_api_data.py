@@ -22,41 +22,18 @@ import statsapi
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from ingestion.mlb_api_client import MLBStatsAPIClient
+from ingestion.mlb_api_client import get_mlb_client
+from ingestion.http_session import connection_stats
 from ingestion.pybaseball_client import get_pitch_mix, get_batter_fangraphs_stats
 from ingestion.weather_client import WeatherClient
-from utils.api_cache import get_api_cache
+from utils.api_cache import FINAL_GAME_STATUSES, get_api_cache
 from utils.real_season_data import fetch_division_teams_data
 from utils.re24_calculator import get_batter_season_re24
+from utils.team_data import get_division_teams, get_team_abbr, get_team_division
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
-# Team ID mappings
-TEAM_ID_TO_ABBR = {
-    147: 'NYY', 111: 'BOS', 139: 'TB', 141: 'TOR', 110: 'BAL',
-    114: 'CLE', 142: 'MIN', 145: 'CWS', 116: 'DET', 118: 'KC',
-    117: 'HOU', 140: 'TEX', 136: 'SEA', 108: 'LAA', 133: 'OAK',
-    144: 'ATL', 143: 'PHI', 121: 'NYM', 146: 'MIA', 120: 'WSH',
-    158: 'MIL', 138: 'STL', 112: 'CHC', 113: 'CIN', 134: 'PIT',
-    119: 'LAD', 135: 'SD', 137: 'SF', 115: 'COL', 109: 'ARI'
-}
-
-DIVISION_TEAMS = {
-    'AL East': ['NYY', 'BOS', 'TB', 'TOR', 'BAL'],
-    'AL Central': ['CLE', 'MIN', 'CWS', 'DET', 'KC'],
-    'AL West': ['HOU', 'TEX', 'SEA', 'LAA', 'OAK'],
-    'NL East': ['ATL', 'PHI', 'NYM', 'MIA', 'WSH'],
-    'NL Central': ['MIL', 'STL', 'CHC', 'CIN', 'PIT'],
-    'NL West': ['LAD', 'SD', 'SF', 'COL', 'ARI'],
-}
-
-TEAM_TO_DIVISION = {}
-for div, teams in DIVISION_TEAMS.items():
-    for team in teams:
-        TEAM_TO_DIVISION[team] = div
-
-
 def find_pitcher_id(pitcher_name: str) -> int:
     """Look up pitcher's MLB player ID by name."""
     if not pitcher_name:
@@ -105,7 +82,7 @@ Examples:
 
     # Find the game
     print(f"Finding game for {args.team} on {args.game_date}...")
-    client = MLBStatsAPIClient()
+    client = get_mlb_client()
     schedule = client.get_schedule(team=args.team, start_date=args.game_date, end_date=args.game_date)
 
     if not schedule:
@@ -113,8 +90,8 @@ Examples:
         sys.exit(1)
 
     game = schedule[0]
-    away_team_abbr = TEAM_ID_TO_ABBR.get(game.get('away_id'), 'UNK')
-    home_team_abbr = TEAM_ID_TO_ABBR.get(game.get('home_id'), 'UNK')
+    away_team_abbr = get_team_abbr(game.get('away_id')) or 'UNK'
+    home_team_abbr = get_team_abbr(game.get('home_id')) or 'UNK'
 
     print(f"✓ Found: {away_team_abbr} @ {home_team_abbr}")
     print(f"  Venue: {game.get('venue_name', 'TBD')}")
@@ -150,53 +127,61 @@ Examples:
     print("  Schedule context...")
     client.get_schedule_context(home_team_abbr, args.game_date)
 
-    # 3. Pitcher stats
-    if pitcher_ids.get('away'):
-        print(f"  Away pitcher stats...")
-        client.get_pitcher_season_stats(pitcher_ids['away'], args.season)
-    if pitcher_ids.get('home'):
-        print(f"  Home pitcher stats...")
-        client.get_pitcher_season_stats(pitcher_ids['home'], args.season)
+    # 3. Pitcher stats (both starters in one request)
+    starter_ids = [pid for pid in (pitcher_ids.get('away'), pitcher_ids.get('home')) if pid]
+    if starter_ids:
+        print(f"  Pitcher stats ({len(starter_ids)} starters)...")
+        client.get_pitcher_season_stats_bulk(starter_ids, args.season)
 
-    # 4. Pitch mix (Statcast - expensive)
+    # 4. Pitch mix (lookups in the league-wide Statcast arsenals)
     if away_pitcher_name:
         print(f"  Away pitcher pitch mix (Statcast)...")
-        get_pitch_mix(away_pitcher_name, args.season)
+        get_pitch_mix(away_pitcher_name, args.season, pitcher_id=pitcher_ids.get('away'))
     if home_pitcher_name:
         print(f"  Home pitcher pitch mix (Statcast)...")
-        get_pitch_mix(home_pitcher_name, args.season)
+        get_pitch_mix(home_pitcher_name, args.season, pitcher_id=pitcher_ids.get('home'))
 
-    # 5. Lineups
+    # 5. Lineups, bench and bullpen (all read from one live-feed download)
     game_id = game.get('game_id') or game.get('game_pk')
+    lineups = bench_players = None
     if game_id:
+        if game.get('status') not in FINAL_GAME_STATUSES:
+            # Game day re-runs: pull only the feed changes since the last run
+            changed = client.refresh_game_feed(game_id)
+            print(f"  Live feed {'changed' if changed else 'unchanged'} since last run")
+
         print("  Game lineups...")
-        client.get_game_lineups(game_id)
+        lineups = client.get_game_lineups(game_id)
 
         print("  Bench players...")
-        client.get_game_bench_players(game_id)
-
-    # 6. Batter stats for lineups
-    lineups = client.get_game_lineups(game_id) if game_id else None
-    if lineups:
-        print("  Batter stats (away lineup)...")
-        for batter in lineups.get('away', []):
-            client.get_batter_season_stats(batter['player_id'], args.season)
+        bench_players = client.get_game_bench_players(game_id)
 
-        print("  Batter stats (home lineup)...")
-        for batter in lineups.get('home', []):
-            client.get_batter_season_stats(batter['player_id'], args.season)
+        if pitcher_ids:
+            print("  Bullpen usage...")
+            client.get_bullpen_with_usage(game_id, starter_id=None, days_back=3)
+
+    # 6. Batter stats for lineups and bench, fetched in bulk
+    batter_ids = [
+        player['player_id']
+        for players in (lineups, bench_players) if players
+        for side in ('away', 'home')
+        for player in players.get(side, [])
+    ]
+    if batter_ids:
+        print(f"  Batter stats ({len(batter_ids)} lineup and bench players)...")
+        client.get_batter_season_stats_bulk(batter_ids, args.season)
 
     # 7. Division race data
-    away_div = TEAM_TO_DIVISION.get(away_team_abbr)
-    home_div = TEAM_TO_DIVISION.get(home_team_abbr)
+    away_div = get_team_division(away_team_abbr)
+    home_div = get_team_division(home_team_abbr)
 
-    if away_div:
+    if get_division_teams(away_div):
         print(f"  {away_div} standings...")
-        fetch_division_teams_data(DIVISION_TEAMS[away_div], args.season)
+        fetch_division_teams_data(get_division_teams(away_div), args.season)
 
-    if home_div and home_div != away_div:
+    if get_division_teams(home_div) and home_div != away_div:
         print(f"  {home_div} standings...")
-        fetch_division_teams_data(DIVISION_TEAMS[home_div], args.season)
+        fetch_division_teams_data(get_division_teams(home_div), args.season)
 
     # 8. Weather data
     venue = game.get('venue_name')
@@ -212,11 +197,11 @@ Examples:
     if lineups:
         print("  FanGraphs stats (away lineup)...")
         for batter in lineups.get('away', []):
-            get_batter_fangraphs_stats(batter['name'], args.season)
+            get_batter_fangraphs_stats(batter['name'], args.season, batter['player_id'])
 
         print("  FanGraphs stats (home lineup)...")
         for batter in lineups.get('home', []):
-            get_batter_fangraphs_stats(batter['name'], args.season)
+            get_batter_fangraphs_stats(batter['name'], args.season, batter['player_id'])
 
     # 10. RE24 data for lineup batters
     if lineups:
@@ -232,19 +217,7 @@ Examples:
     print(f"  Head-to-head record ({home_team_abbr} vs {away_team_abbr})...")
     client.get_head_to_head_record(home_team_abbr, away_team_abbr, args.season, before_date=args.game_date)
 
-    # 12. Bench player stats
-    if game_id:
-        bench_players = client.get_game_bench_players(game_id)
-        if bench_players:
-            print("  Bench player stats (away)...")
-            for player in bench_players.get('away', []):
-                client.get_batter_season_stats(player['player_id'], args.season)
-
-            print("  Bench player stats (home)...")
-            for player in bench_players.get('home', []):
-                client.get_batter_season_stats(player['player_id'], args.season)
-
-    # 13. Additional context
+    # 12. Additional context
     print("  Injuries, transactions, leaders...")
     client.get_team_injuries(away_team_abbr)
     client.get_team_injuries(home_team_abbr)
@@ -259,7 +232,15 @@ Examples:
 
     # Show cache stats
     stats = cache.stats()
-    print(f"API cache: {stats['valid_files']} responses ({stats['total_size_kb']:.1f} KB)")
+    print(
+        f"API cache: {stats['valid_files']} responses, {stats['pinned_files']} pinned "
+        f"({stats['total_size_kb']:.1f} KB)"
+    )
+    connections = connection_stats()
+    print(
+        f"MLB API: {connections['requests']} requests over {connections['new_connections']} connections "
+        f"({connections['reused_connections']} reused)"
+    )
     print()
 
     print("Next step: Build game bundle")
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Warm the API cache for every game on a date.
+
+Plans the deduplicated union of requests for the day's slate (season
+schedule, records, probable pitchers, lineups, batter stats, Statcast
+ranges, league-wide tables) and runs them with bounded concurrency.
+Afterwards, fetch_api_data.py / build_bundle.py for any game that day
+read from cache.
+
+Usage:
+    python scripts/prefetch_slate.py 2025-09-25
+    python scripts/prefetch_slate.py 2025-09-25 --workers 4
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from ingestion.http_session import connection_stats
+from ingestion.prefetch_planner import PrefetchPlanner, DEFAULT_MAX_WORKERS
+from utils.api_cache import get_api_cache
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Warm the API cache for a full day of games',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('game_date', help='Slate date (YYYY-MM-DD)')
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f'Requests in flight at once (default: {DEFAULT_MAX_WORKERS})')
+    args = parser.parse_args()
+
+    print()
+    print("=" * 60)
+    print(f"PREFETCH SLATE: {args.game_date}")
+    print("=" * 60)
+    print()
+
+    report = PrefetchPlanner(args.game_date, max_workers=args.workers).run()
+
+    if not report['games']:
+        print(f"✗ No games found on {args.game_date}")
+        sys.exit(1)
+
+    print(f"Games:     {report['games']}")
+    print(f"Requests:  {report['requested']} needed, {report['planned']} after deduplication")
+    print(f"Cached:    {report['cached']}")
+    print(f"Fetched:   {report['fetched']}")
+    if report['failed']:
+        print(f"Failed:    {report['failed']}")
+    print(f"Elapsed:   {report['elapsed_sec']}s")
+    print()
+
+    stats = get_api_cache().stats()
+    print(
+        f"API cache: {stats['valid_files']} responses, {stats['pinned_files']} pinned "
+        f"({stats['total_size_kb']:.1f} KB)"
+    )
+    connections = connection_stats()
+    print(
+        f"MLB API: {connections['requests']} requests over {connections['new_connections']} connections "
+        f"({connections['reused_connections']} reused)"
+    )
+    print()
+
+
+if __name__ == '__main__':
+    main()
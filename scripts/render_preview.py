@@ -28,6 +28,7 @@ from utils.data_validator import validate_game_data, print_data_summary, DataVal
 from visualization.charts.standings_chart import create_division_race_chart, create_re24_chart
 from output.html_generator import HTMLGenerator
 from output.pdf_generator import PDFGenerator
+from utils.atomic_io import content_checksum, quarantine_file
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -320,8 +321,34 @@ Examples:
         sys.exit(1)
 
     print(f"Loading bundle: {bundle_path.name}")
-    with open(bundle_path, 'r') as f:
-        data = json.load(f)
+    try:
+        with open(bundle_path, 'r') as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        data = None
+        reason = f"unreadable: {e}"
+    else:
+        if not isinstance(data, dict):
+            reason = f"expected a JSON object, got {type(data).__name__}"
+            data = None
+
+    # Bundles built before checksums were added have none to verify
+    if data is not None:
+        metadata = data.get('bundle_metadata')
+        checksum = metadata.get('checksum') if isinstance(metadata, dict) else None
+        if checksum is not None and checksum != content_checksum(
+                {k: v for k, v in data.items() if k != 'bundle_metadata'}):
+            data = None
+            reason = "checksum mismatch"
+
+    if data is None:
+        quarantined = quarantine_file(bundle_path, reason=reason)
+        print(f"✗ Corrupt bundle ({reason}), moved to {quarantined}")
+        print()
+        print("Rebuild it:")
+        print(f"  python scripts/build_bundle.py {args.away_team} {args.home_team} {args.game_date}")
+        print()
+        sys.exit(1)
 
     built_at = data.get('bundle_metadata', {}).get('built_at', 'unknown')
     print(f"  Built at: {built_at}")
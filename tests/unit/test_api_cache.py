@@ -0,0 +1,455 @@
+"""
+Unit tests for the API response cache.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from utils.api_cache import APICache, is_final_data
+from utils.atomic_io import atomic_open
+from utils.cache_backends import FileCacheBackend, SQLiteCacheBackend, create_backend
+
+
+@pytest.fixture(params=['file', 'sqlite'])
+def cache(request, tmp_path):
+    """APICache backed by a temporary directory, for each storage backend."""
+    return APICache(
+        cache_dir=str(tmp_path / 'api_cache'),
+        ttl_hours=6,
+        memory_entries=2,
+        backend=request.param
+    )
+
+
+def _age_entry(cache, source, endpoint, params, hours):
+    """Rewrite an entry as if it had been cached `hours` ago."""
+    response = cache.get(source, endpoint, params)
+    cached_at = datetime.now() - timedelta(hours=hours)
+    params_hash = cache._hash_params(params)
+    cache.backend.write(source, endpoint, params, params_hash, cached_at, cached_at + cache.ttl, response)
+    cache._memory_discard()
+
+
+def test_set_then_get_roundtrip(cache):
+    """Test a cached response is returned on the next get."""
+    cache.set('mlb', 'schedule', {'team_id': 147}, [{'game_id': 1}])
+    assert cache.get('mlb', 'schedule', {'team_id': 147}) == [{'game_id': 1}]
+
+
+def test_memory_hit_skips_storage_io(cache, monkeypatch):
+    """Test a warm entry is served from memory without touching the backend."""
+    cache.set('mlb', 'schedule', {'team_id': 147}, [{'game_id': 1}])
+
+    def fail_read(*args):
+        raise AssertionError(f"unexpected backend read: {args}")
+
+    monkeypatch.setattr(cache.backend, 'read', fail_read)
+    assert cache.get('mlb', 'schedule', {'team_id': 147}) == [{'game_id': 1}]
+    assert cache.stats()['memory_hits'] == 1
+
+
+def test_cold_hit_reads_storage_once(cache, monkeypatch):
+    """Test a cold hit reads storage once and promotes it into memory."""
+    cache.set('mlb', 'standings', {'season': 2025}, {'w': 90})
+    cache._memory_discard()
+
+    reads = []
+    original = cache.backend.read
+
+    def counting_read(*args):
+        reads.append(args)
+        return original(*args)
+
+    monkeypatch.setattr(cache.backend, 'read', counting_read)
+    assert cache.get('mlb', 'standings', {'season': 2025}) == {'w': 90}
+    assert cache.get('mlb', 'standings', {'season': 2025}) == {'w': 90}
+    assert len(reads) == 1
+
+    stats = cache.stats()
+    assert stats['disk_hits'] == 1
+    assert stats['memory_hits'] == 1
+
+
+def test_memory_hits_return_copies(cache):
+    """Test callers mutating a hit don't corrupt the cached entry."""
+    cache.set('mlb', 'batter_stats', {'player_id': 1}, {'name': 'A'})
+    first = cache.get('mlb', 'batter_stats', {'player_id': 1})
+    first['position'] = 'SS'
+    assert cache.get('mlb', 'batter_stats', {'player_id': 1}) == {'name': 'A'}
+
+
+def test_lru_evicts_least_recently_used(cache):
+    """Test the memory tier is bounded and evicts the oldest entry."""
+    cache.set('mlb', 'a', {}, 1)
+    cache.set('mlb', 'b', {}, 2)
+    cache.get('mlb', 'a', {})
+    cache.set('mlb', 'c', {}, 3)
+
+    stats = cache.stats()
+    assert stats['memory_entries'] == 2
+    assert stats['evictions'] == 1
+    # 'b' was evicted from memory but is still in storage
+    assert cache.get('mlb', 'b', {}) == 2
+    assert cache.stats()['disk_hits'] == 1
+
+
+def test_expired_entry_is_a_miss(cache):
+    """Test entries older than the TTL are not returned."""
+    cache.set('mlb', 'schedule', {'team_id': 111}, [])
+    _age_entry(cache, 'mlb', 'schedule', {'team_id': 111}, hours=7)
+
+    assert cache.get('mlb', 'schedule', {'team_id': 111}) is None
+    assert cache.stats()['misses'] == 1
+
+
+def test_clear_expired_and_stats(cache):
+    """Test expiry sweeps remove only expired entries."""
+    cache.set('mlb', 'schedule', {'team_id': 111}, [1])
+    cache.set('mlb', 'schedule', {'team_id': 147}, [2])
+    _age_entry(cache, 'mlb', 'schedule', {'team_id': 111}, hours=7)
+
+    stats = cache.stats()
+    assert stats['total_files'] == 2
+    assert stats['expired_files'] == 1
+
+    assert cache.clear_expired() == 1
+    assert cache.stats()['total_files'] == 1
+    assert cache.get('mlb', 'schedule', {'team_id': 147}) == [2]
+
+
+def test_invalidate_drops_memory_entry(cache):
+    """Test invalidate removes both the stored and the memory entry."""
+    cache.set('mlb', 'schedule', {'team_id': 147}, [1])
+    assert cache.invalidate('mlb', 'schedule', {'team_id': 147})
+    assert cache.get('mlb', 'schedule', {'team_id': 147}) is None
+
+
+def test_clear_all(cache):
+    """Test clear_all empties storage and memory."""
+    cache.set('mlb', 'a', {}, 1)
+    cache.set('mlb', 'b', {}, 2)
+    assert cache.clear_all() == 2
+    assert cache.get('mlb', 'a', {}) is None
+
+
+def _write_legacy_file(tmp_path, cache, endpoint, params, stored_params, hours_old, response):
+    """Write a cache file the way versions before stored expiries did."""
+    path = tmp_path / f"mlb_{endpoint}_{cache._hash_params(params)[:8]}.json"
+    path.write_text(json.dumps({
+        '_cached_at': (datetime.now() - timedelta(hours=hours_old)).isoformat(),
+        '_source': 'mlb',
+        '_endpoint': endpoint,
+        '_params': stored_params,
+        '_response': response
+    }))
+    return path
+
+
+def test_file_backend_reads_legacy_files(tmp_path):
+    """Test short-named files without _expires_at fall back to the endpoint's TTL."""
+    cache = APICache(cache_dir=str(tmp_path), ttl_hours=6, memory_entries=0)
+    params = {'team_id': 147}
+    _write_legacy_file(tmp_path, cache, 'schedule', params, params, 0, [1, 2])
+    assert cache.get('mlb', 'schedule', params) == [1, 2]
+
+    # Transactions have a 1h TTL, well inside the 6h cache-wide TTL
+    path = _write_legacy_file(tmp_path, cache, 'transactions', params, params, 2, [3])
+    assert cache.get('mlb', 'transactions', params) is None
+    assert cache.clear_expired() == 1
+    assert not path.exists()
+
+
+def test_file_backend_ignores_legacy_files_for_other_params(tmp_path):
+    """Test a short-named file whose stored params hash differently isn't returned."""
+    cache = APICache(cache_dir=str(tmp_path), ttl_hours=6, memory_entries=0)
+    params = {'team_id': 147}
+    path = _write_legacy_file(tmp_path, cache, 'schedule', params, {'team_id': 111}, 0, ['red sox'])
+    assert cache.get('mlb', 'schedule', params) is None
+
+    cache.set('mlb', 'schedule', params, ['yankees'])
+    assert cache.get('mlb', 'schedule', params) == ['yankees']
+    # The unrelated short-named file is left alone
+    assert path.exists()
+
+
+def test_file_backend_replaces_legacy_files(tmp_path):
+    """Test writing or invalidating an entry removes its short-named file."""
+    cache = APICache(cache_dir=str(tmp_path), ttl_hours=6, memory_entries=0)
+    params = {'team_id': 147}
+    path = _write_legacy_file(tmp_path, cache, 'schedule', params, params, 0, [1])
+    cache.set('mlb', 'schedule', params, [2])
+    assert not path.exists()
+    assert cache.get('mlb', 'schedule', params) == [2]
+
+    path = _write_legacy_file(tmp_path, cache, 'team_record', params, params, 0, [3])
+    cache.invalidate('mlb', 'team_record', params)
+    assert not path.exists()
+    assert cache.get('mlb', 'team_record', params) is None
+
+
+def test_create_backend_by_name(tmp_path):
+    """Test backends are selected by CacheConfig.cache_backend name."""
+    ttl = timedelta(hours=6)
+    assert isinstance(create_backend('sqlite', tmp_path, ttl), SQLiteCacheBackend)
+    assert isinstance(create_backend('file', tmp_path, ttl), FileCacheBackend)
+    # Unsupported names (e.g. the 'mongodb' default) fall back to files
+    assert isinstance(create_backend('mongodb', tmp_path, ttl), FileCacheBackend)
+
+
+def test_dataframe_roundtrip(cache):
+    """Test DataFrames are stored as Parquet and returned as DataFrames."""
+    pd = pytest.importorskip('pandas')
+    df = pd.DataFrame({
+        'Name': ['Aaron Judge', 'Juan Soto'],
+        'WAR': [10.1, 7.9],
+        'Dol': ['$80.1', None],
+    })
+    cache.set('fangraphs', 'batting_stats', {'season': 2025}, df)
+
+    # Memory tier
+    hit = cache.get('fangraphs', 'batting_stats', {'season': 2025})
+    assert isinstance(hit, pd.DataFrame)
+    pd.testing.assert_frame_equal(hit, df)
+
+    # Storage tier
+    cache._memory_discard()
+    hit = cache.get('fangraphs', 'batting_stats', {'season': 2025})
+    assert isinstance(hit, pd.DataFrame)
+    assert hit['Name'].tolist() == ['Aaron Judge', 'Juan Soto']
+    assert hit['WAR'].tolist() == [10.1, 7.9]
+
+
+def test_dataframe_replaces_json_entry(cache):
+    """Test switching an entry between JSON and DataFrame keeps one copy."""
+    pd = pytest.importorskip('pandas')
+    cache.set('fangraphs', 'batting_stats', {'season': 2025}, [{'Name': 'A'}])
+    cache.set('fangraphs', 'batting_stats', {'season': 2025}, pd.DataFrame({'Name': ['A']}))
+    cache._memory_discard()
+
+    assert isinstance(cache.get('fangraphs', 'batting_stats', {'season': 2025}), pd.DataFrame)
+    assert cache.stats()['total_files'] == 1
+
+
+def test_ttl_policy_per_endpoint(tmp_path):
+    """Test endpoints get their TTL from the policy table."""
+    cache = APICache(
+        cache_dir=str(tmp_path),
+        ttl_hours=6,
+        ttl_policy={('mlb', 'transactions'): 1}
+    )
+    assert cache.ttl_for('mlb', 'transactions') == timedelta(hours=1)
+    assert cache.ttl_for('mlb', 'schedule') == timedelta(hours=6)
+
+    cache.set('mlb', 'transactions', {'team_id': 147}, [])
+    stored = cache.backend.read('mlb', 'transactions', cache._hash_params({'team_id': 147}))
+    assert stored['expires_at'] - stored['cached_at'] == timedelta(hours=1)
+
+
+@pytest.mark.parametrize('params, response, final', [
+    ({'start_date': '2024-06-01', 'end_date': '2024-06-07'}, [], True),
+    ({'start_date': '2024-06-01', 'end_date': '2999-06-07'}, [], False),
+    ({'date': '2024-06-01', 'days_back': 3}, [], True),
+    ({'start_date': '2024-06-01', 'end_date': '2024-06-07'},
+     [{'status': 'Final'}, {'status': 'Postponed: Rain'}, {'status': 'Cancelled'}], True),
+    ({'start_date': '2024-06-01', 'end_date': '2024-06-07'}, [{'status': 'Final'}, {'status': 'In Progress'}], False),
+    ({'start_date': '2024-06-01', 'end_date': '2024-06-07'}, [{'status': 'Suspended: Rain'}], False),
+    ({'season': 2024}, {}, True),
+    ({'season': 2999}, {}, False),
+    ({'team_id': 147}, [{'status': 'Final'}, {'status': 'Completed Early'}], True),
+    ({'team_id': 147}, [{'status': 'Final'}, {'status': 'Scheduled'}], False),
+    ({'team_id': 147}, [], False),
+    ({'game_id': 1}, {'gameData': {'status': {'abstractGameState': 'Final'}}}, True),
+    ({'game_id': 1}, {'gameData': {'status': {'abstractGameState': 'Live'}}}, False),
+])
+def test_is_final_data(params, response, final):
+    """Test which responses are detected as provably final."""
+    assert is_final_data(params, response) is final
+
+
+def test_final_entries_are_pinned(cache):
+    """Test pinned entries never expire and survive expiry sweeps."""
+    cache.set('mlb', 'schedule', {'start_date': '2024-06-01', 'end_date': '2024-06-07'}, [1])
+    cache.set('mlb', 'game_lineups', {'game_id': 1}, {'away': []}, pin=True)
+    cache.set('mlb', 'schedule', {'team_id': 147}, [2])
+
+    stored = cache.backend.read('mlb', 'game_lineups', cache._hash_params({'game_id': 1}))
+    assert stored['expires_at'] is None
+
+    _age_entry(cache, 'mlb', 'schedule', {'team_id': 147}, hours=7)
+    stats = cache.stats()
+    assert stats['pinned_files'] == 2
+    assert stats['expired_files'] == 1
+
+    assert cache.clear_expired() == 1
+    cache._memory_discard()
+    assert cache.get('mlb', 'game_lineups', {'game_id': 1}) == {'away': []}
+
+
+def test_stale_while_revalidate(tmp_path):
+    """Test an expired entry is served while a background refresh replaces it."""
+    cache = APICache(cache_dir=str(tmp_path), ttl_hours=6, stale_while_revalidate=True)
+    params = {'team_abbr': 'NYY', 'season': 2999}
+    cache.set('mlb', 'team_record', params, {'wins': 1, 'losses': 0})
+    _age_entry(cache, 'mlb', 'team_record', params, hours=7)
+
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return {'wins': 2, 'losses': 0}
+
+    assert cache.get('mlb', 'team_record', params, revalidate=fetch) == {'wins': 1, 'losses': 0}
+    cache.wait_for_revalidation()
+
+    assert fetches == [1]
+    assert cache.get('mlb', 'team_record', params) == {'wins': 2, 'losses': 0}
+    stats = cache.stats()
+    assert stats['stale_hits'] == 1
+    assert stats['revalidations'] == 1
+
+
+def test_stale_entries_respect_bounds(tmp_path):
+    """Test stale entries aren't served past the staleness bound or when disabled."""
+    params = {'team_abbr': 'NYY', 'season': 2999}
+
+    cache = APICache(
+        cache_dir=str(tmp_path / 'swr'), ttl_hours=6, stale_while_revalidate=True,
+        max_staleness={('mlb', 'team_record'): 2}
+    )
+    cache.set('mlb', 'team_record', params, {'wins': 1})
+    _age_entry(cache, 'mlb', 'team_record', params, hours=9)
+    assert cache.get('mlb', 'team_record', params, revalidate=lambda: {'wins': 2}) is None
+
+    cache = APICache(cache_dir=str(tmp_path / 'off'), ttl_hours=6)
+    cache.set('mlb', 'team_record', params, {'wins': 1})
+    _age_entry(cache, 'mlb', 'team_record', params, hours=7)
+    assert cache.get('mlb', 'team_record', params, revalidate=lambda: {'wins': 2}) is None
+    assert cache.stats()['revalidations'] == 0
+
+
+def _concurrent_calls(n, call):
+    """Run `call` from n threads released together; return their results."""
+    barrier = threading.Barrier(n)
+
+    def run():
+        barrier.wait()
+        return call()
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return [f.result() for f in [pool.submit(run) for _ in range(n)]]
+
+
+def test_get_or_fetch_coalesces_concurrent_misses(cache):
+    """Test concurrent misses on one key trigger a single fetch."""
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        time.sleep(0.1)
+        return [{'game_id': 1}]
+
+    results = _concurrent_calls(
+        8, lambda: cache.get_or_fetch('mlb', 'schedule', {'team_id': 147}, fetch)
+    )
+
+    assert fetches == [1]
+    assert results == [[{'game_id': 1}]] * 8
+    assert cache.get('mlb', 'schedule', {'team_id': 147}) == [{'game_id': 1}]
+
+
+def test_get_or_fetch_shares_errors(cache):
+    """Test waiters see the fetching caller's exception and nothing is cached."""
+    def fetch():
+        time.sleep(0.1)
+        raise RuntimeError('API down')
+
+    def call():
+        try:
+            return cache.get_or_fetch('mlb', 'schedule', {'team_id': 147}, fetch)
+        except RuntimeError as e:
+            return str(e)
+
+    assert _concurrent_calls(4, call) == ['API down'] * 4
+    assert cache.get('mlb', 'schedule', {'team_id': 147}) is None
+
+
+def test_process_lock_coalesces_across_instances(tmp_path):
+    """Test caches sharing a directory reuse each other's fetch under the file lock."""
+    caches = [APICache(cache_dir=str(tmp_path), process_lock=True) for _ in range(4)]
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        time.sleep(0.1)
+        return {'wins': 90}
+
+    calls = iter(caches)
+    lock = threading.Lock()
+
+    def call():
+        with lock:
+            cache = next(calls)
+        return cache.get_or_fetch('mlb', 'team_record', {'team_abbr': 'NYY', 'season': 2999}, fetch)
+
+    assert _concurrent_calls(4, call) == [{'wins': 90}] * 4
+    assert fetches == [1]
+
+
+def test_truncated_file_is_quarantined(tmp_path):
+    """Test a partially written file is quarantined and counted, not returned."""
+    cache = APICache(cache_dir=str(tmp_path), memory_entries=0)
+    params = {'team_id': 147}
+    path = cache.set('mlb', 'schedule', params, [{'game_id': 1}])
+    path.write_text(path.read_text()[:40])
+
+    assert cache.get('mlb', 'schedule', params) is None
+    assert not path.exists()
+    stats = cache.stats()
+    assert stats['quarantined_files'] == 1
+    assert stats['total_files'] == 0
+
+
+def test_checksum_mismatch_is_quarantined(cache):
+    """Test entries whose content no longer matches the checksum are quarantined."""
+    cache = APICache(cache_dir=str(cache.cache_dir), memory_entries=0, backend=cache.backend.name)
+    params = {'team_id': 147}
+    cache.set('mlb', 'schedule', params, [{'game_id': 1}])
+
+    if cache.backend.name == 'file':
+        path = cache.backend._path('mlb', 'schedule', cache._hash_params(params))
+        path.write_text(path.read_text().replace('"game_id": 1', '"game_id": 2'))
+    else:
+        with cache.backend._conn:
+            cache.backend._conn.execute("UPDATE api_cache SET payload = ?", (b'garbage',))
+
+    assert cache.get('mlb', 'schedule', params) is None
+    assert cache.stats()['quarantined_files'] == 1
+
+
+def test_atomic_open_keeps_old_file_on_failure(tmp_path):
+    """Test a failed write leaves the previous file intact and no temp files."""
+    path = tmp_path / 'bundle.json'
+    path.write_text('{"ok": true}')
+
+    with pytest.raises(RuntimeError):
+        with atomic_open(path) as f:
+            f.write('{"ok": fa')
+            raise RuntimeError('killed')
+
+    assert json.loads(path.read_text()) == {'ok': True}
+    assert [p.name for p in tmp_path.iterdir()] == ['bundle.json']
+
+
+def test_cached_dataframes_are_not_shared_with_the_caller(cache):
+    """Test changing a DataFrame after caching it doesn't change the entry."""
+    df = pd.DataFrame({'Name': ['Aaron Judge'], 'HR': [58]})
+    cache.set('fangraphs', 'batting_stats', {'season': 2024}, df)
+    df.loc[0, 'HR'] = 0
+
+    assert cache.get('fangraphs', 'batting_stats', {'season': 2024}).loc[0, 'HR'] == 58
@@ -0,0 +1,68 @@
+"""
+Unit tests for the asyncio MLB Stats API client.
+"""
+
+import asyncio
+import threading
+import time
+
+from config.settings import APIConfig
+from ingestion.async_mlb_client import AsyncMLBStatsAPIClient
+from utils.api_cache import APICache
+
+
+class SlowClient:
+    """Stands in for MLBStatsAPIClient; records peak concurrency and caches like the real one."""
+
+    def __init__(self, cache, delay=0.05):
+        self.cache = cache
+        self.delay = delay
+        self.fetches = 0
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _fetch(self, team, season):
+        with self._lock:
+            self.fetches += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return {'team': team, 'wins': 90}
+
+    def get_team_record(self, team_abbr, season=None):
+        return self.cache.get_or_fetch(
+            'mlb', 'team_record', {'team': team_abbr, 'season': season},
+            lambda: self._fetch(team_abbr, season)
+        )
+
+
+def test_requests_overlap_within_concurrency_limit(tmp_path):
+    sync_client = SlowClient(APICache(cache_dir=tmp_path))
+    client = AsyncMLBStatsAPIClient(client=sync_client, config=APIConfig(), max_concurrency=3)
+    teams = ['NYY', 'BOS', 'TB', 'TOR', 'BAL', 'CLE']
+
+    async def fetch_all():
+        return await asyncio.gather(*(client.get_team_record(team, 2025) for team in teams))
+
+    start = time.perf_counter()
+    results = asyncio.run(fetch_all())
+    elapsed = time.perf_counter() - start
+
+    assert [r['team'] for r in results] == teams
+    assert sync_client.peak == 3
+    # Six 50ms requests, three at a time: two rounds rather than six
+    assert elapsed < 6 * sync_client.delay
+
+
+def test_async_and_sync_callers_share_cache_entries(tmp_path):
+    sync_client = SlowClient(APICache(cache_dir=tmp_path), delay=0)
+    sync_client.get_team_record('NYY', 2025)
+
+    client = AsyncMLBStatsAPIClient(client=sync_client, config=APIConfig())
+    result = asyncio.run(client.get_team_record('NYY', 2025))
+
+    assert result == {'team': 'NYY', 'wins': 90}
+    assert sync_client.fetches == 1
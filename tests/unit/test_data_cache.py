@@ -0,0 +1,32 @@
+"""
+Unit tests for the per-game data cache.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from utils.data_cache import DataCache
+
+
+def test_non_json_values_are_rejected(tmp_path):
+    """Test values JSON can't represent raise instead of coming back as strings."""
+    cache = DataCache(cache_dir=str(tmp_path))
+    cache.set('NYY', 'BOS', '2024-06-15', {'away_record': '40-30'})
+
+    with pytest.raises(TypeError):
+        cache.set('NYY', 'BOS', '2024-06-15', {'first_pitch': datetime(2024, 6, 15, 19, 5)})
+
+    # The earlier file is left as it was
+    assert cache.get('NYY', 'BOS', '2024-06-15')['away_record'] == '40-30'
+
+
+@pytest.mark.parametrize('contents', ['[1, 2]', '{"away_record": "40-30", "cache_metadata": null}'])
+def test_non_object_files_are_quarantined(tmp_path, contents):
+    """Test valid JSON that isn't a cache entry object is quarantined instead of raising."""
+    cache = DataCache(cache_dir=str(tmp_path))
+    cache_path = cache.get_cache_path('NYY', 'BOS', '2024-06-15')
+    cache_path.write_text(contents)
+
+    assert cache.get('NYY', 'BOS', '2024-06-15') is None
+    assert not cache_path.exists()
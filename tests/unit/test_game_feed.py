@@ -0,0 +1,103 @@
+"""
+Unit tests for the live game feed store.
+"""
+
+import pytest
+
+from ingestion import game_feed
+from ingestion.game_feed import GameFeedStore, apply_json_patch
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """Serves queued diffPatch responses and records the timecodes asked for."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.timecodes = []
+
+    def get(self, url, params=None, **kwargs):
+        self.timecodes.append(params['startTimecode'])
+        return FakeResponse(self.responses.pop(0))
+
+
+def make_feed(timecode, lineup):
+    return {
+        'metaData': {'timeStamp': timecode},
+        'gameData': {'status': {'abstractGameState': 'Preview'}},
+        'liveData': {'boxscore': {'teams': {'home': {'battingOrder': lineup}}}},
+    }
+
+
+@pytest.fixture
+def full_fetches(monkeypatch):
+    fetched = []
+
+    def fake_get(endpoint, params):
+        fetched.append(params['gamePk'])
+        return make_feed('20240615_170000', [])
+
+    monkeypatch.setattr(game_feed.statsapi, 'get', fake_get)
+    return fetched
+
+
+def test_apply_json_patch_operations():
+    doc = {'a': {'b': [1, 2]}, 'c': 'x', 'd/e': 0}
+    doc = apply_json_patch(doc, [
+        {'op': 'replace', 'path': '/c', 'value': 'y'},
+        {'op': 'add', 'path': '/a/b/-', 'value': 3},
+        {'op': 'add', 'path': '/a/b/0', 'value': 0},
+        {'op': 'remove', 'path': '/d~1e'},
+        {'op': 'copy', 'from': '/a/b', 'path': '/f'},
+        {'op': 'move', 'from': '/c', 'path': '/g'},
+        {'op': 'test', 'path': '/g', 'value': 'y'},
+    ])
+    assert doc == {'a': {'b': [0, 1, 2, 3]}, 'f': [0, 1, 2, 3], 'g': 'y'}
+
+    with pytest.raises(ValueError):
+        apply_json_patch(doc, [{'op': 'replace', 'path': '/missing', 'value': 1}])
+
+
+def test_refresh_applies_patches_to_feed_from_previous_run(tmp_path, full_fetches):
+    GameFeedStore(feed_dir=str(tmp_path)).get(1)
+    assert full_fetches == [1]
+
+    # A later run: the feed from disk is patched, not downloaded again
+    session = FakeSession([
+        [{'diff': [
+            {'op': 'replace', 'path': '/metaData/timeStamp', 'value': '20240615_180000'},
+            {'op': 'add', 'path': '/liveData/boxscore/teams/home/battingOrder/-', 'value': 660271},
+        ]}],
+        [],
+    ])
+    store = GameFeedStore(feed_dir=str(tmp_path), session=session)
+    feed = store.get(1, refresh=True)
+
+    assert full_fetches == [1]
+    assert session.timecodes == ['20240615_170000']
+    assert feed['liveData']['boxscore']['teams']['home']['battingOrder'] == [660271]
+    assert store.changed(1)
+
+    # Nothing new since the patched timecode
+    assert store.get(1, refresh=True) is feed
+    assert session.timecodes[-1] == '20240615_180000'
+    assert not store.changed(1)
+
+
+def test_failed_patch_falls_back_to_full_fetch(tmp_path, full_fetches):
+    GameFeedStore(feed_dir=str(tmp_path)).get(1)
+
+    session = FakeSession([[{'diff': [{'op': 'remove', 'path': '/no/such/path'}]}]])
+    store = GameFeedStore(feed_dir=str(tmp_path), session=session)
+    assert store.get(1, refresh=True) is not None
+    assert full_fetches == [1, 1]
@@ -0,0 +1,66 @@
+"""
+Unit tests for the pooled MLB API session.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from config.settings import APIConfig
+from ingestion.http_session import StatsAPITransport, connection_stats, create_mlb_session
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _KeepAliveHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_reuses_connections(server_url):
+    """Test sequential requests share one keep-alive connection."""
+    session = create_mlb_session(APIConfig(mlb_api_timeout=5, mlb_api_pool_size=4))
+    for _ in range(5):
+        assert session.get(f"{server_url}/api/v1/schedule").json() == {'ok': True}
+
+    assert connection_stats(session) == {'requests': 5, 'new_connections': 1, 'reused_connections': 4}
+    session.close()
+
+
+def test_statsapi_transport_uses_session_and_timeout(server_url):
+    """Test statsapi's requests.get() goes through the session with its default timeout."""
+    session = create_mlb_session(APIConfig(mlb_api_timeout=7))
+    seen = {}
+    original = session.send
+
+    def send(request, **kwargs):
+        seen['timeout'] = kwargs.get('timeout')
+        return original(request, **kwargs)
+
+    session.send = send
+    transport = StatsAPITransport(session)
+    assert transport.get(f"{server_url}/api/v1/game").status_code == 200
+    assert seen['timeout'] == 7
+    session.close()
+    # Attributes other than get() fall through to the requests module
+    assert transport.exceptions.HTTPError is not None
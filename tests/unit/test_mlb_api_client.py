@@ -0,0 +1,231 @@
+"""
+Unit tests for MLBStatsAPIClient bulk season stats.
+"""
+
+import pytest
+
+from config.settings import APIConfig
+from ingestion import mlb_api_client
+from ingestion.mlb_api_client import MLBStatsAPIClient
+from ingestion.season_schedule import clear_season_schedules
+from utils.api_cache import APICache
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """Answers /people requests from canned hitting lines; records each request."""
+
+    def __init__(self):
+        self.requests = []
+        self.hydrates = []
+
+    def get(self, url, params=None, **kwargs):
+        ids = [int(pid) for pid in params['personIds'].split(',')]
+        self.requests.append(ids)
+        self.hydrates.append(params['hydrate'])
+        people = [
+            {
+                'id': pid,
+                'fullName': f'Player {pid}',
+                'currentAge': 27,
+                'stats': [{'splits': [{'stat': {
+                    'avg': '.300', 'obp': '.400', 'slg': '.500',
+                    'homeRuns': 20, 'rbi': 70, 'totalBases': 200, 'stolenBases': 5
+                }}]}]
+            }
+            for pid in ids if pid != 999
+        ]
+        return FakeResponse({'people': people})
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(mlb_api_client, '_cache', APICache(cache_dir=str(tmp_path)))
+    client = MLBStatsAPIClient(config=APIConfig())
+    client.session = FakeSession()
+    clear_season_schedules()
+    return client
+
+
+def test_bulk_fetch_batches_requests_and_fills_per_player_cache(client, monkeypatch):
+    monkeypatch.setattr(mlb_api_client, 'PEOPLE_BATCH_SIZE', 2)
+
+    results = client.get_batter_season_stats_bulk([1, 2, 3, 999], 2025)
+
+    assert client.session.requests == [[1, 2], [3, 999]]
+    assert results[999] is None
+    assert results[1]['slash'] == '.300/.400/.500'
+    assert results[1]['ops'] == pytest.approx(0.9)
+    assert results[3]['hr'] == 20
+
+    # Single-player lookups read the entries the bulk call wrote
+    assert client.get_batter_season_stats(2, 2025) == results[2]
+    assert len(client.session.requests) == 2
+
+
+def test_bulk_fetch_only_requests_uncached_players(client):
+    client.get_batter_season_stats_bulk([1, 2], 2025)
+    client.get_batter_season_stats_bulk([1, 2, 3, 3], 2025)
+
+    assert client.session.requests == [[1, 2], [3]]
+
+
+def test_single_player_stats_use_one_request_for_requested_season(client):
+    stats = client.get_batter_season_stats(7, 2019)
+
+    assert stats['name'] == 'Player 7'
+    assert stats['rbi'] == 70
+    assert client.session.requests == [[7]]
+    assert client.session.hydrates == ['stats(group=[hitting],type=[season],season=2019)']
+
+
+def test_pitcher_stats_parse_placeholder_values(client):
+    client.session.get = lambda url, params=None, **kwargs: FakeResponse({'people': [{
+        'id': 5, 'fullName': 'Some Pitcher', 'primaryNumber': '45', 'pitchHand': {'code': 'L'},
+        'stats': [{'splits': [
+            {'team': {'id': 147}, 'stat': {'wins': 1, 'era': '9.00'}},
+            {'team': {'id': 111}, 'stat': {'wins': 2, 'era': '1.00'}},
+            {'stat': {'wins': 3, 'losses': 0, 'era': '-.--', 'inningsPitched': '20.1', 'whip': '1.10'}},
+        ]}]
+    }]})
+
+    stats = client.get_pitcher_season_stats(5, 2024)
+
+    # The team-less split is the combined line for a traded player
+    assert stats['wins'] == 3
+    assert stats['ERA'] == 0.0
+    assert stats['IP'] == 20.1
+    assert stats['number'] == 45
+    assert stats['hand'] == 'L'
+
+
+def test_team_pitch_counts_read_each_boxscore_once(client, monkeypatch):
+    from datetime import datetime
+
+    schedule = [
+        {'game_id': 1, 'game_date': '2024-06-13', 'status': 'Final'},
+        {'game_id': 2, 'game_date': '2024-06-14', 'status': 'Final'},
+    ]
+    boxscores = {
+        1: {'teams': {
+            'home': {'team': {'id': 147}, 'players': {
+                'ID10': {'person': {'id': 10}, 'stats': {'pitching': {'numberOfPitches': 25}}},
+                'ID11': {'person': {'id': 11}, 'stats': {'pitching': {}}},
+            }},
+            'away': {'team': {'id': 111}, 'players': {
+                'ID20': {'person': {'id': 20}, 'stats': {'pitching': {'numberOfPitches': 90}}},
+            }},
+        }},
+        2: {'teams': {
+            'away': {'team': {'id': 147}, 'players': {
+                'ID10': {'person': {'id': 10}, 'stats': {'pitching': {'numberOfPitches': 12}}},
+            }},
+        }},
+    }
+    fetched = []
+
+    def fake_get(endpoint, params):
+        fetched.append(params['gamePk'])
+        return boxscores[params['gamePk']]
+
+    monkeypatch.setattr(client, 'get_schedule', lambda **kwargs: schedule)
+    monkeypatch.setattr(mlb_api_client.statsapi, 'get', fake_get)
+
+    usage = client.get_team_pitch_counts(147, datetime(2024, 6, 15), 3)
+    assert usage == {10: [
+        {'date': '2024-06-13', 'pitches': 25, 'game_id': 1},
+        {'date': '2024-06-14', 'pitches': 12, 'game_id': 2},
+    ]}
+
+    # Final boxscores are pinned and reused
+    client.get_team_pitch_counts(147, datetime(2024, 6, 15), 3)
+    assert fetched == [1, 2]
+    assert mlb_api_client._cache.stats()['pinned_files'] == 2
+
+
+def test_lineups_bench_and_bullpen_share_one_feed_download(client, monkeypatch, tmp_path):
+    from ingestion.game_feed import GameFeedStore
+
+    feed = {
+        'gameData': {'status': {'abstractGameState': 'Final'}, 'datetime': {'officialDate': '2024-06-15'}},
+        'liveData': {'boxscore': {'teams': {
+            side: {
+                'team': {'id': team_id},
+                'battingOrder': [team_id * 10 + 1],
+                'players': {
+                    f'ID{team_id * 10 + 1}': {'person': {'id': team_id * 10 + 1, 'fullName': 'Batter'},
+                                              'position': {'abbreviation': 'SS'}},
+                    f'ID{team_id * 10 + 2}': {'person': {'id': team_id * 10 + 2, 'fullName': 'Bench'},
+                                              'position': {'abbreviation': 'C'}},
+                    f'ID{team_id * 10 + 3}': {'person': {'id': team_id * 10 + 3, 'fullName': 'Reliever'},
+                                              'position': {'abbreviation': 'P'}},
+                },
+            }
+            for side, team_id in (('away', 111), ('home', 147))
+        }}},
+    }
+    downloads = []
+
+    def fake_get(endpoint, params):
+        downloads.append(endpoint)
+        return feed
+
+    monkeypatch.setattr('ingestion.game_feed.statsapi.get', fake_get)
+    monkeypatch.setattr(client, 'feeds', GameFeedStore(feed_dir=str(tmp_path / 'feeds')))
+    monkeypatch.setattr(client, 'get_team_pitch_counts', lambda *args: {})
+
+    lineups = client.get_game_lineups(1)
+    bench = client.get_game_bench_players(1)
+    feed_file = tmp_path / 'feeds' / '1.json'
+    assert feed_file.exists()
+    bullpen = client.get_bullpen_with_usage(1)
+
+    assert downloads == ['game']
+    # Everything derived from the final feed is cached, so its file is deleted
+    assert not feed_file.exists()
+    assert [p['player_id'] for p in lineups['home']] == [1471]
+    assert [p['player_id'] for p in bench['away']] == [1112]
+    assert [p['player_id'] for p in bullpen['home']] == [1473]
+    # Final games: all three derived results are pinned (plus the list of
+    # bullpen param sets cached for the game)
+    assert mlb_api_client._cache.stats()['pinned_files'] == 4
+
+    # A bullpen cached with other params is invalidated with the rest
+    client.get_bullpen_with_usage(1, starter_id=1473, days_back=5)
+    monkeypatch.setattr(client.feeds, 'changed', lambda game_pk: True)
+    assert client.refresh_game_feed(1)
+    for endpoint, params in (('game_lineups', {'game_id': 1}),
+                             ('game_bullpen', {'game_id': 1, 'starter_id': None, 'days_back': 3}),
+                             ('game_bullpen', {'game_id': 1, 'starter_id': 1473, 'days_back': 5})):
+        assert not mlb_api_client._cache.has('mlb', endpoint, params)
+
+
+def test_schedule_processing_resolves_teams_by_id(client, monkeypatch):
+    schedule = [
+        # Names the old substring matching got wrong or missed
+        {'game_date': '2024-06-01', 'home_id': 147, 'away_id': 133, 'home_name': 'New York Yankees',
+         'away_name': 'Athletics', 'home_score': 5, 'away_score': 2, 'status': 'Final'},
+        {'game_date': '2024-06-02', 'home_id': 133, 'away_id': 147, 'home_name': 'Athletics',
+         'away_name': 'New York Yankees', 'home_score': 4, 'away_score': 1, 'status': 'Final'},
+        {'game_date': '2024-06-03', 'home_id': 111, 'away_id': 147, 'home_name': 'Boston Red Sox',
+         'away_name': 'New York Yankees', 'home_score': 0, 'away_score': 3, 'status': 'Final'},
+    ]
+    monkeypatch.setattr(client, 'get_schedule', lambda **kwargs: [dict(g) for g in schedule])
+
+    assert client.get_head_to_head_record('NYY', 'OAK', 2024) == {'wins': 1, 'losses': 1}
+
+    calendar = client.get_schedule_context('NYY', '2024-06-04', weeks_before=1, weeks_after=0)['calendar']
+    games = {g['game_date']: g for g in calendar}
+    assert games['2024-06-01']['opponent_abbr'] == 'vs OAK'
+    assert games['2024-06-02']['opponent_abbr'] == '@ OAK'
+    assert games['2024-06-03']['result'] == 'W'
@@ -0,0 +1,126 @@
+"""
+Unit tests for the pitch mix aggregation and league-wide arsenals.
+"""
+
+import pandas as pd
+import pytest
+
+from ingestion import pitch_arsenals
+from ingestion.pitch_arsenals import ArsenalStore, aggregate_pitch_mix
+from utils.api_cache import APICache
+
+
+@pytest.fixture
+def pitches():
+    return pd.DataFrame({
+        'pitcher': [1, 1, 1, 1, 2, 2],
+        'pitch_type': ['FF', 'FF', 'SL', None, 'FF', 'CH'],
+        'description': ['swinging_strike', 'foul', 'ball', 'ball', 'hit_into_play', 'called_strike'],
+        'release_speed': [95.0, 96.0, 85.0, None, 93.0, 84.0],
+        'release_spin_rate': [2300, 2400, 2500, None, 2200, 1700],
+        'delta_run_exp': [-0.05, -0.03, 0.04, 0.02, 0.2, -0.04],
+        'stand': ['R', 'L', 'R', 'R', 'L', 'L'],
+        'balls': [0, 1, 0, 1, 0, 0],
+        'strikes': [0, 0, 1, 1, 0, 0],
+    })
+
+
+def test_overall_mix_per_pitcher(pitches):
+    overall = aggregate_pitch_mix(pitches)['overall']
+    ff = overall[(overall['pitcher'] == 1) & (overall['pitch_type'] == 'FF')].iloc[0]
+
+    # Pitches without a type count towards usage but get no row
+    assert list(overall[overall['pitcher'] == 1]['pitch_type']) == ['FF', 'SL']
+    assert ff['usage'] == 50.0
+    assert ff['velocity'] == 95.5
+    assert ff['whiff'] == 50.0
+    assert ff['rv_100'] == pytest.approx(-4.0)
+
+
+def test_count_and_handedness_splits(pitches):
+    tables = aggregate_pitch_mix(pitches)
+
+    stand = tables['stand']
+    vs_left = stand[(stand['pitcher'] == 1) & (stand['stand'] == 'L')]
+    assert list(vs_left['pitch_type']) == ['FF']
+    assert vs_left['usage'].iloc[0] == 100.0
+
+    count = tables['count']
+    first_pitch = count[(count['pitcher'] == 2) & (count['balls'] == 0) & (count['strikes'] == 0)]
+    assert sorted(first_pitch['pitch_type']) == ['CH', 'FF']
+    assert list(first_pitch['usage']) == [50.0, 50.0]
+
+
+def test_single_pitcher_frame(pitches):
+    mix = aggregate_pitch_mix(pitches[pitches['pitcher'] == 2], keys=[])['overall']
+    assert list(mix.columns[:3]) == ['pitch_type', 'pitches', 'usage']
+    assert mix['pitches'].sum() == 2
+
+
+class FakeWarehouse:
+    """Stands in for the Statcast warehouse; counts queries and ingests."""
+
+    def __init__(self, pitches, stored=True):
+        self.pitches = pitches
+        self.stored = stored
+        self.queries = 0
+        self.ingests = 0
+        self.end_dates = []
+
+    def covers(self, start_date, end_date):
+        return self.stored
+
+    def query(self, start_date, end_date, where=None, columns=None, ingest=True):
+        self.queries += 1
+        self.end_dates.append(end_date)
+        if ingest and not self.stored:
+            self.ingests += 1
+            self.stored = True
+        return self.pitches
+
+
+def test_arsenal_store_looks_up_every_pitcher(pitches, tmp_path):
+    warehouse = FakeWarehouse(pitches)
+    store = ArsenalStore(warehouse=warehouse, cache=APICache(cache_dir=str(tmp_path)))
+
+    arsenals = store.arsenals(2024)
+    assert len(arsenals) == 2 and 1 in arsenals
+
+    mix = store.pitch_mix(1, 2024)
+    assert [p['name'] for p in mix] == ['4-Seam FB', 'Slider']
+    assert mix[0]['usage'] == 50.0 and mix[0]['whiff'] == 50.0
+    assert store.pitch_mix(999, 2024) == []
+    assert warehouse.queries == 1
+
+    # A new process reads the aggregated table from the cache
+    rerun = ArsenalStore(warehouse=warehouse, cache=store.cache)
+    assert rerun.pitch_mix(2, 2024) == store.pitch_mix(2, 2024)
+    assert warehouse.queries == 1
+
+
+def test_arsenals_stop_at_settled_dates(pitches, tmp_path, monkeypatch):
+    """Test provisional warehouse days are left out of built and cached tables."""
+    monkeypatch.setattr(pitch_arsenals, 'settled_through', lambda: '2024-06-01')
+    warehouse = FakeWarehouse(pitches)
+    store = ArsenalStore(warehouse=warehouse, cache=APICache(cache_dir=str(tmp_path)))
+
+    assert store.arsenals(2024, '2024-06-03').through_date == '2024-06-01'
+    assert warehouse.end_dates == ['2024-06-01']
+
+    # Later requests before the next date settles reuse that table
+    store.arsenals(2024, '2024-06-02')
+    assert warehouse.queries == 1
+
+
+def test_lookups_never_backfill_a_cold_warehouse(pitches, tmp_path):
+    """Test per-game lookups come back empty until a batch build has run."""
+    warehouse = FakeWarehouse(pitches, stored=False)
+    store = ArsenalStore(warehouse=warehouse, cache=APICache(cache_dir=str(tmp_path)))
+
+    assert store.arsenals(2024) is None
+    assert store.pitch_mix(1, 2024) == []
+    assert warehouse.queries == 0
+
+    assert len(store.arsenals(2024, build=True)) == 2
+    assert warehouse.ingests == 1
+    assert [p['name'] for p in store.pitch_mix(1, 2024)] == ['4-Seam FB', 'Slider']
@@ -0,0 +1,48 @@
+"""
+Unit tests for the season table player name index.
+"""
+
+import pandas as pd
+
+from ingestion.player_index import PlayerIndex, clear_player_indexes, get_player_index
+
+
+def test_lookup_normalizes_accents_suffixes_and_middle_names():
+    index = PlayerIndex(pd.DataFrame({'Name': ['Julio Rodríguez', 'Jazz Chisholm Jr.', 'Ronald Acuña Jr.']}))
+
+    assert index.find('Julio Rodriguez') == 0
+    assert index.find('jazz chisholm') == 1
+    assert index.find('Ronald Acuna Jr.') == 2
+    assert index.find('Nobody Here') is None
+
+
+def test_ambiguous_names_need_a_player_id():
+    df = pd.DataFrame({
+        'Name': ['Will Smith', 'Will Smithson', 'Will Smith'],
+        'mlbID': [669257, 111111, 519293],
+    })
+    index = PlayerIndex(df)
+
+    # The old contains-match returned whichever Will Smith came first
+    assert index.find('Will Smith') is None
+    assert index.find('Will Smith', player_id=519293) == 2
+    assert index.find('Will Smithson') == 1
+
+
+def test_rows_for_the_same_player_are_not_ambiguous():
+    df = pd.DataFrame({'Name': ['Max Muncy', 'Max Muncy'], 'IDfg': [13301, 13301]})
+    assert PlayerIndex(df).find('Max Muncy') == 0
+
+
+def test_index_is_built_once_per_table_and_season():
+    clear_player_indexes()
+    loads = []
+
+    def load():
+        loads.append(1)
+        return pd.DataFrame({'Name': ['Aaron Judge']})
+
+    for _ in range(3):
+        index = get_player_index('fangraphs_batting', 2024, load)
+    assert index.find('Aaron Judge') == 0
+    assert len(loads) == 1
@@ -0,0 +1,163 @@
+"""
+Unit tests for the slate prefetch planner.
+"""
+
+import pandas as pd
+import pytest
+
+from ingestion import prefetch_planner
+from ingestion.season_schedule import clear_season_schedules
+from ingestion.prefetch_planner import PrefetchPlanner
+from utils.api_cache import APICache
+
+
+class FakeClient:
+    """Stands in for MLBStatsAPIClient; records calls and caches like the real one."""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.calls = []
+
+    def _call(self, endpoint, *args, result=None):
+        self.calls.append((endpoint,) + args)
+        return self.cache.get_or_fetch('mlb', endpoint, {'args': list(args)}, lambda: result)
+
+    def get_schedule(self, team=None, start_date=None, end_date=None):
+        if team is None:
+            return [
+                {'game_id': 1, 'away_id': 147, 'home_id': 111, 'away_probable_pitcher': 'A Pitcher'},
+                {'game_id': 2, 'away_id': 139, 'home_id': 141, 'home_probable_pitcher': 'B Pitcher'},
+            ]
+        return self._call('schedule', team, start_date, end_date, result=[])
+
+    def get_team_record(self, team, season):
+        return self._call('team_record', team, season, result={'wins': 1})
+
+    def get_team_injuries(self, team):
+        return self._call('team_injuries', team, result=[])
+
+    def get_game_lineups(self, game_id):
+        return self._call('game_lineups', game_id, result={'away': [{'player_id': 10}], 'home': [{'player_id': 11}]})
+
+    def get_game_bench_players(self, game_id):
+        return self._call('game_bench', game_id, result={'away': [{'player_id': 10}], 'home': []})
+
+    def get_bullpen_with_usage(self, game_id, starter_id=None, days_back=3):
+        return self._call('game_bullpen', game_id, days_back, result={'away': [], 'home': []})
+
+    def get_recent_transactions(self, date):
+        return self._call('transactions', date, result=[])
+
+    def get_league_leaders(self, season):
+        return self._call('league_leaders', season, result={'batting': []})
+
+    def get_pitcher_season_stats_bulk(self, player_ids, season):
+        return self._call('pitcher_stats', tuple(player_ids), season,
+                          result={str(pid): {'era': 3.0} for pid in player_ids})
+
+    def get_batter_season_stats_bulk(self, player_ids, season):
+        return self._call('batter_stats', tuple(player_ids), season,
+                          result={str(pid): {'avg': '.300'} for pid in player_ids})
+
+    def get_schedule_context(self, team, game_date):
+        return self._call('schedule_context', team, game_date, result={'calendar': []})
+
+    def get_head_to_head_record(self, team, opponent, season, before_date=None):
+        return self._call('head_to_head', team, opponent, season, result={'wins': 0})
+
+
+class FakeWarehouse:
+    """Stands in for the Statcast warehouse: ingests 5 dates the first time."""
+
+    def __init__(self):
+        self.ingested = False
+
+    def ensure(self, start_date, end_date):
+        if self.ingested:
+            return 0
+        self.ingested = True
+        return 5
+
+
+class FakeArsenalStore:
+    """Stands in for the pitch arsenal store (nothing to aggregate)."""
+
+    def arsenals(self, season, build=False):
+        return None
+
+
+@pytest.fixture
+def planner(tmp_path, monkeypatch):
+    cache = APICache(cache_dir=str(tmp_path))
+    monkeypatch.setattr(prefetch_planner, 'get_api_cache', lambda: cache)
+    monkeypatch.setattr(prefetch_planner, 'lookup_player_id', lambda name: hash(name) % 1000)
+    monkeypatch.setattr(prefetch_planner, 'get_fangraphs_batting_stats', lambda season: None)
+    monkeypatch.setattr(prefetch_planner, 'get_batter_season_re24', lambda *args, **kwargs: {})
+    warehouse = FakeWarehouse()
+    monkeypatch.setattr(prefetch_planner, 'get_statcast_warehouse', lambda: warehouse)
+    arsenals = FakeArsenalStore()
+    monkeypatch.setattr(prefetch_planner, 'get_arsenal_store', lambda: arsenals)
+    clear_season_schedules()
+    return PrefetchPlanner('2999-06-01', client=FakeClient(cache), max_workers=4)
+
+
+def test_plan_deduplicates_shared_requests(planner):
+    """Test the season schedule and league-wide requests are planned once for the slate."""
+    report = planner.run()
+    calls = planner.client.calls
+
+    # One league-wide season schedule instead of one per division team
+    assert sum(1 for c in calls if c[0] == 'schedule') == 0
+    assert sum(1 for key in planner._tasks if key[0] == 'season_schedule') == 1
+    assert sum(1 for c in calls if c[0] in ('league_leaders', 'transactions')) == 2
+    # Both probable starters' pitch mix comes from one league-wide build
+    assert sum(1 for key in planner._tasks if key[0] == 'pitch_arsenals') == 1
+    # One bulk request for the slate's batters and one for its starters;
+    # player 10 is in game 1's lineup and bench, and in game 2's lineup
+    batter_calls = [c for c in calls if c[0] == 'batter_stats']
+    assert len(batter_calls) == 1
+    assert sorted(batter_calls[0][1]) == [10, 11]
+    assert sum(1 for c in calls if c[0] == 'pitcher_stats') == 1
+
+    assert report['games'] == 2
+    assert report['requested'] > report['planned']
+    assert report['fetched'] + report['cached'] + report['failed'] == report['planned']
+    assert len(calls) == len(set(calls))
+
+
+def test_rerun_is_served_from_cache(planner):
+    """Test a second run for the same slate makes no new fetches."""
+    planner.run()
+    rerun = PrefetchPlanner('2999-06-01', client=planner.client)
+    report = rerun.run()
+    assert report['fetched'] == 0
+
+
+def test_warehouse_ingest_and_failed_requests_are_reported(planner, monkeypatch):
+    """Test work outside the API cache counts as fetched, and empty fetches as failed."""
+    client = planner.client
+    monkeypatch.setattr(client, 'get_league_leaders',
+                        lambda season: client._call('league_leaders', season, result=None))
+
+    report = planner.run()
+    outcomes = {task.key[0]: task.outcome for task in planner._tasks.values()}
+    assert outcomes['statcast_warehouse'] == 'fetched'
+    assert outcomes['league_leaders'] == 'failed'
+    assert report['failed'] == 1
+
+    # Nothing left to ingest on a rerun
+    rerun = PrefetchPlanner('2999-06-01', client=client)
+    rerun.run()
+    assert rerun._tasks[next(k for k in rerun._tasks if k[0] == 'statcast_warehouse')].outcome == 'cached'
+
+
+def test_dataframe_fetch_is_reported_as_fetched(planner, monkeypatch):
+    """Test a season table written through the cache on a miss counts as fetched."""
+    cache = planner.cache
+    batting = pd.DataFrame({'Name': ['A Batter'], 'WAR': [1.5]})
+    monkeypatch.setattr(prefetch_planner, 'get_fangraphs_batting_stats',
+                        lambda season: cache.get_or_fetch('fangraphs', 'batting_stats',
+                                                          {'season': season}, lambda: batting))
+
+    planner.run()
+    assert planner._tasks[('fangraphs_batting', planner.season)].outcome == 'fetched'
@@ -0,0 +1,63 @@
+"""
+Unit tests for the incrementally updated race store.
+"""
+
+from ingestion.race_store import RaceStore
+from ingestion.season_schedule import clear_season_schedules
+
+
+def game(game_id, date, home_id, away_id, home_score, away_score, status='Final'):
+    return {'game_id': game_id, 'game_date': date, 'home_id': home_id, 'away_id': away_id,
+            'home_score': home_score, 'away_score': away_score, 'status': status, 'game_type': 'R'}
+
+
+SEASON = [
+    game(1, '2024-06-01', 147, 111, 5, 2),
+    game(2, '2024-06-02', 147, 111, 1, 3),
+    game(3, '2024-06-03', 111, 147, 0, 4),
+    game(4, '2024-06-04', 111, 147, 2, 1, status='In Progress'),
+]
+
+
+class FakeClient:
+    def __init__(self, games):
+        self.games = games
+        self.requests = []
+
+    def get_schedule(self, team=None, start_date=None, end_date=None):
+        self.requests.append((start_date, end_date))
+        return [g for g in self.games if start_date <= g['game_date'] <= end_date]
+
+
+def test_refresh_fetches_only_new_days_and_continues_totals(tmp_path):
+    clear_season_schedules()
+    client = FakeClient(list(SEASON))
+    store = RaceStore(store_dir=str(tmp_path), client=client)
+
+    races = store.race_frame(2024, through_date='2024-06-02')
+    assert list(races[races['team'] == 'NYY']['wins']) == [1, 1]
+
+    # A new process picks up the stored series and fetches one day
+    client.games[3] = game(4, '2024-06-04', 111, 147, 2, 1)
+    store = RaceStore(store_dir=str(tmp_path), client=client)
+    races = store.race_frame(2024, through_date='2024-06-04')
+
+    assert client.requests[-1] == ('2024-06-03', '2024-06-04')
+    nyy = races[races['team'] == 'NYY']
+    assert list(nyy['game_number']) == [1, 2, 3, 4]
+    assert list(nyy['games_above_500']) == [1, 0, 1, 0]
+
+
+def test_unsettled_days_are_not_stored(tmp_path):
+    clear_season_schedules()
+    client = FakeClient(list(SEASON))
+    store = RaceStore(store_dir=str(tmp_path), client=client)
+
+    races = store.race_frame(2024, through_date='2024-06-04')
+    # Game 4 is still in progress: the store covers through 06-03 only
+    assert races['date'].max() == '2024-06-03'
+
+    client.games[3] = game(4, '2024-06-04', 111, 147, 2, 1)
+    races = store.race_frame(2024, through_date='2024-06-04')
+    assert client.requests[-1] == ('2024-06-04', '2024-06-04')
+    assert list(races[races['team'] == 'BOS']['wins']) == [0, 1, 1, 2]
@@ -0,0 +1,60 @@
+"""
+Unit tests for incremental season RE24.
+"""
+
+import pandas as pd
+
+from utils import re24_calculator
+from utils.api_cache import APICache
+
+
+class FakeWarehouse:
+    """Stands in for the Statcast warehouse: one 3-PA game per day."""
+
+    def __init__(self):
+        self.scans = []
+
+    def batter_pitches(self, batter_id, start_date, end_date):
+        self.scans.append((start_date, end_date))
+        rows = []
+        for day in pd.date_range(start_date, end_date):
+            if day.month != 6:
+                continue
+            for at_bat in (1, 2, 3):
+                rows.append({'game_pk': day.day, 'game_date': day.strftime('%Y-%m-%d'),
+                             'at_bat_number': at_bat, 'delta_run_exp': 0.1})
+        return pd.DataFrame(rows, columns=['game_pk', 'game_date', 'at_bat_number', 'delta_run_exp'])
+
+
+def test_later_end_dates_scan_only_the_missing_days(tmp_path, monkeypatch):
+    warehouse = FakeWarehouse()
+    monkeypatch.setattr(re24_calculator, '_cache', APICache(cache_dir=str(tmp_path)))
+    monkeypatch.setattr(re24_calculator, 'get_statcast_warehouse', lambda: warehouse)
+
+    first = re24_calculator.get_batter_season_re24(592450, 2024, end_date='2024-06-10')
+    assert len(first['games']) == 10
+    assert first['pa'] == 30
+
+    second = re24_calculator.get_batter_season_re24(592450, 2024, end_date='2024-06-11')
+    assert warehouse.scans == [('2024-03-01', '2024-06-10'), ('2024-06-11', '2024-06-11')]
+    assert second['games'][-1] == {'game_number': 11, 'game_date': '2024-06-11', 're24': 0.3,
+                                   'cumulative_re24': 3.3, 'pa': 3}
+
+    # Earlier ranges come from the stored games
+    earlier = re24_calculator.get_batter_season_re24(592450, 2024, start_date='2024-06-05', end_date='2024-06-06')
+    assert [g['game_number'] for g in earlier['games']] == [1, 2]
+    assert len(warehouse.scans) == 2
+
+
+def test_provisional_days_are_scanned_again(tmp_path, monkeypatch):
+    warehouse = FakeWarehouse()
+    monkeypatch.setattr(re24_calculator, '_cache', APICache(cache_dir=str(tmp_path)))
+    monkeypatch.setattr(re24_calculator, 'get_statcast_warehouse', lambda: warehouse)
+    monkeypatch.setattr(re24_calculator, 'settled_through', lambda: '2024-06-08')
+
+    first = re24_calculator.get_batter_season_re24(592450, 2024, end_date='2024-06-10')
+    again = re24_calculator.get_batter_season_re24(592450, 2024, end_date='2024-06-10')
+    assert first == again
+    assert len(again['games']) == 10
+    # Only the days after the settled date are scanned again
+    assert warehouse.scans == [('2024-03-01', '2024-06-10'), ('2024-06-09', '2024-06-10')]
@@ -0,0 +1,77 @@
+"""
+Unit tests for the columnar season schedule index.
+"""
+
+from ingestion.season_schedule import SeasonSchedule, clear_season_schedules, get_season_schedule
+
+
+def game(game_id, date, home_id, away_id, home_score=0, away_score=0, status='Final', game_type='R'):
+    return {'game_id': game_id, 'game_date': date, 'home_id': home_id, 'away_id': away_id,
+            'home_score': home_score, 'away_score': away_score, 'status': status, 'game_type': game_type}
+
+
+GAMES = [
+    game(3, '2024-06-03', 111, 147, 0, 3),
+    game(1, '2024-06-01', 147, 111, 5, 2),
+    game(2, '2024-06-02', 139, 141, 4, 1),
+    game(4, '2024-06-04', 147, 111, 1, 6),
+    game(5, '2024-06-05', 147, 111, status='Scheduled'),
+    game(6, '2024-03-20', 147, 139, 9, 0, game_type='S'),
+]
+
+
+def test_team_and_date_slices():
+    schedule = SeasonSchedule(2024, GAMES)
+
+    assert [g['game_id'] for g in schedule.team_games(147)] == [6, 1, 3, 4, 5]
+    assert [g['game_id'] for g in schedule.team_games(147, '2024-06-02', '2024-06-04')] == [3, 4]
+    assert list(schedule.game_pk[schedule.date_rows('2024-06-02', '2024-06-03')]) == [2, 3]
+    assert schedule.team_games(999) == []
+
+    # Callers get copies they can annotate
+    schedule.team_games(147)[0]['result'] = 'W'
+    assert 'result' not in schedule.games[0]
+
+
+def test_head_to_head_and_race_results():
+    schedule = SeasonSchedule(2024, GAMES)
+
+    assert schedule.head_to_head(147, 111) == (2, 1)
+    assert schedule.head_to_head(111, 147, before_date='2024-06-04') == (0, 2)
+
+    race = schedule.team_results(147)
+    # Spring training and unplayed games are left out
+    assert list(race['result']) == ['W', 'W', 'L']
+    assert list(race['games_above_500']) == [1, 2, 1]
+    assert list(race['date']) == ['2024-06-01', '2024-06-03', '2024-06-04']
+
+
+class FakeClient:
+    def __init__(self):
+        self.requests = []
+
+    def get_schedule(self, team=None, start_date=None, end_date=None):
+        self.requests.append((team, start_date, end_date))
+        return list(GAMES)
+
+
+def test_season_schedule_is_fetched_league_wide_once():
+    clear_season_schedules()
+    client = FakeClient()
+
+    first = get_season_schedule(2024, client=client)
+    second = get_season_schedule(2024, client=client)
+
+    assert first is second
+    assert client.requests == [(None, '2024-03-01', '2024-11-15')]
+
+
+def test_race_frame_covers_every_team():
+    schedule = SeasonSchedule(2024, GAMES)
+    races = schedule.race_frame()
+
+    assert set(races['team']) == {'NYY', 'BOS', 'TB', 'TOR'}
+    bos = races[races['team'] == 'BOS']
+    assert list(bos['wins']) == [0, 0, 1]
+    assert list(bos['losses']) == [1, 2, 2]
+    assert schedule.race_frame() is races
@@ -0,0 +1,46 @@
+"""
+Unit tests for the per-process season table store.
+"""
+
+import pandas as pd
+
+from ingestion import season_tables
+from ingestion.player_index import clear_player_indexes
+from ingestion.season_tables import SeasonTables
+from utils.api_cache import APICache
+
+
+def test_tables_load_once_and_persist_between_processes(tmp_path, monkeypatch):
+    clear_player_indexes()
+    loads = []
+
+    def loader(season):
+        loads.append(season)
+        return pd.DataFrame({'Name': ['Tarik Skubal', 'Paul Skenes'], 'WAR': [6.2, 5.9]})
+
+    monkeypatch.setitem(season_tables.SEASON_TABLES, 'fangraphs_pitching', ('fangraphs', 'pitching_stats', loader))
+
+    tables = SeasonTables(cache=APICache(cache_dir=str(tmp_path)))
+    for _ in range(3):
+        df = tables.get('fangraphs_pitching', 2024)
+    assert loads == [2024]
+    assert tables.index('fangraphs_pitching', 2024).row('Paul Skenes')['WAR'] == 5.9
+
+    # A later run reads the cached (Parquet) copy instead of calling pybaseball
+    later = SeasonTables(cache=APICache(cache_dir=str(tmp_path)))
+    assert list(later.get('fangraphs_pitching', 2024)['Name']) == ['Tarik Skubal', 'Paul Skenes']
+    assert loads == [2024]
+
+
+def test_callers_cannot_change_the_shared_table(tmp_path, monkeypatch):
+    monkeypatch.setitem(season_tables.SEASON_TABLES, 'bref_batting',
+                        ('bref', 'batting_stats', lambda season: pd.DataFrame({'Name': ['Aaron Judge'], 'HR': [58]})))
+    tables = SeasonTables(cache=APICache(cache_dir=str(tmp_path)))
+
+    df = tables.get('bref_batting', 2024)
+    df['Name_normalized'] = df['Name'].str.lower()
+    df.loc[0, 'HR'] = 0
+
+    shared = tables.get('bref_batting', 2024)
+    assert list(shared.columns) == ['Name', 'HR']
+    assert shared.loc[0, 'HR'] == 58
@@ -0,0 +1,110 @@
+"""
+Unit tests for the date-partitioned Statcast warehouse.
+"""
+
+from datetime import date, timedelta
+
+import pandas as pd
+
+from ingestion import statcast_warehouse
+from ingestion.season_schedule import SeasonSchedule
+from ingestion.statcast_warehouse import StatcastWarehouse
+
+
+def fake_statcast(calls):
+    """statcast() stand-in: two plate appearances a day, no games on the 2nd."""
+
+    def statcast(start_dt, end_dt, verbose=True):
+        calls.append((start_dt, end_dt))
+        rows = []
+        for day in pd.date_range(start_dt, end_dt):
+            if day.day == 2:
+                continue
+            for at_bat, batter in ((1, 11), (2, 12)):
+                rows.append({'game_date': day, 'game_pk': day.day, 'at_bat_number': at_bat, 'pitch_number': 1,
+                             'batter': batter, 'pitcher': 99, 'pitch_type': 'FF', 'delta_run_exp': 0.25,
+                             'events': 'single', 'new_savant_column': 'x'})
+        return pd.DataFrame(rows)
+
+    return statcast
+
+
+def fake_schedule(season):
+    """A final game every day of June 2024 except the 2nd."""
+    return SeasonSchedule(season, [
+        {'game_id': day.day, 'game_date': day.strftime('%Y-%m-%d'), 'status': 'Final', 'game_type': 'R'}
+        for day in pd.date_range('2024-06-01', '2024-06-30') if day.day != 2
+    ])
+
+
+def test_queries_ingest_only_missing_dates(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(statcast_warehouse, 'INGEST_CHUNK_DAYS', 3)
+    monkeypatch.setattr(statcast_warehouse, 'statcast', fake_statcast(calls))
+    warehouse = StatcastWarehouse(root=str(tmp_path), schedule=fake_schedule)
+
+    pitches = warehouse.batter_pitches(11, '2024-06-01', '2024-06-05')
+    assert calls == [('2024-06-01', '2024-06-03'), ('2024-06-04', '2024-06-05')]
+    assert list(pitches['game_date']) == ['2024-06-01', '2024-06-03', '2024-06-04', '2024-06-05']
+    assert set(pitches['batter']) == {11}
+
+    # Stored dates (including the day without games) are not fetched again
+    assert len(warehouse.game_pitches(4, '2024-06-04')) == 2
+    assert warehouse.date_pitches('2024-06-02').empty
+    warehouse.pitcher_pitches(99, '2024-06-01', '2024-06-06')
+    assert calls[2:] == [('2024-06-06', '2024-06-06')]
+
+
+def test_future_dates_are_not_ingested(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(statcast_warehouse, 'statcast', fake_statcast(calls))
+    warehouse = StatcastWarehouse(root=str(tmp_path), schedule=fake_schedule)
+
+    assert warehouse.ensure('2999-06-01', '2999-06-05') == 0
+    assert warehouse.pitcher_pitches(99, '2999-06-01', '2999-06-05').empty
+    assert calls == []
+
+
+def test_recent_dates_are_fetched_again_until_settled(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(statcast_warehouse, 'statcast', fake_statcast(calls))
+    warehouse = StatcastWarehouse(root=str(tmp_path), schedule=fake_schedule)
+    yesterday = (date.today() - timedelta(days=1)).isoformat()
+
+    # Yesterday is provisional: stored, but fetched again once stale
+    assert warehouse.ensure(yesterday, yesterday) == 1
+    assert warehouse.ensure(yesterday, yesterday) == 0
+    monkeypatch.setattr(statcast_warehouse, 'PROVISIONAL_REFRESH_HOURS', 0)
+    assert warehouse.ensure(yesterday, yesterday) == 1
+
+    # Once it has settled, it is fetched one last time and marked done
+    monkeypatch.setattr(statcast_warehouse, 'PROVISIONAL_DAYS', 0)
+    assert warehouse.ensure(yesterday, yesterday) == 1
+    assert warehouse.ensure(yesterday, yesterday) == 0
+    assert len(calls) == 3
+
+
+def test_failed_fetch_of_a_game_day_is_retried(tmp_path, monkeypatch):
+    calls = []
+    fetch = fake_statcast(calls)
+
+    def flaky_statcast(start_dt, end_dt, verbose=True):
+        # Savant down: an empty frame for a day with games
+        df = fetch(start_dt, end_dt, verbose)
+        return df.iloc[0:0] if len(calls) == 1 else df
+
+    monkeypatch.setattr(statcast_warehouse, 'statcast', flaky_statcast)
+    warehouse = StatcastWarehouse(root=str(tmp_path), schedule=fake_schedule)
+
+    def done(game_date):
+        return (tmp_path / 'season=2024' / f'game_date={game_date}' / '_done').exists()
+
+    assert warehouse.date_pitches('2024-06-05').empty
+    assert not done('2024-06-05')
+    # A day without games is done even though it has no pitches
+    warehouse.ensure('2024-06-02', '2024-06-02')
+    assert done('2024-06-02')
+
+    monkeypatch.setattr(statcast_warehouse, 'PROVISIONAL_REFRESH_HOURS', 0)
+    assert len(warehouse.date_pitches('2024-06-05')) == 2
+    assert done('2024-06-05')
@@ -0,0 +1,48 @@
+"""
+Unit tests for the team registry.
+"""
+
+from utils.team_data import (
+    DIVISION_TEAMS,
+    TEAM_FULL_NAMES,
+    TEAM_IDS,
+    TEAM_SHORT_NAMES,
+    get_division_teams,
+    get_team_abbr,
+    get_team_abbr_by_name,
+    get_team_division,
+    get_team_id,
+    normalize_team_abbr,
+)
+
+
+def test_registry_tables_cover_the_same_teams():
+    teams = set(TEAM_IDS)
+    assert len(teams) == 30
+    assert set(TEAM_FULL_NAMES) == teams
+    assert set(TEAM_SHORT_NAMES) == teams
+    assert {abbr for division in DIVISION_TEAMS.values() for abbr in division} == teams
+
+
+def test_lookups_round_trip():
+    for abbr, team_id in TEAM_IDS.items():
+        assert get_team_abbr(team_id) == abbr
+        assert get_team_abbr_by_name(TEAM_FULL_NAMES[abbr]) == abbr
+        assert get_team_abbr_by_name(TEAM_SHORT_NAMES[abbr]) == abbr
+        assert abbr in get_division_teams(get_team_division(abbr))
+
+
+def test_aliases_and_unknowns():
+    assert normalize_team_abbr('chw') == 'CWS'
+    assert get_team_id('WSN') == TEAM_IDS['WSH']
+    assert get_team_id('XXX') == 0
+    assert get_team_abbr(999) is None
+    assert get_team_division('XXX') == 'Unknown'
+    assert get_division_teams('Unknown') == []
+
+
+def test_missing_abbreviations():
+    """Test abbreviations missing from game data look up as unknown instead of raising."""
+    assert get_team_id(None) == 0
+    assert get_team_id('') == 0
+    assert normalize_team_abbr(None) is None
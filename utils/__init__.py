@@ -7,8 +7,15 @@ from utils.team_data import (
     get_team_logo_url,
     get_player_headshot_url,
     get_team_id,
+    get_team_abbr,
+    get_team_abbr_by_name,
+    get_team_short_name,
+    get_team_division,
+    get_division_teams,
+    normalize_team_abbr,
     TEAM_FULL_NAMES,
-    TEAM_IDS
+    TEAM_IDS,
+    DIVISION_TEAMS
 )
 from utils.data_cache import DataCache
 
@@ -17,7 +24,14 @@ __all__ = [
     'get_team_logo_url',
     'get_player_headshot_url',
     'get_team_id',
+    'get_team_abbr',
+    'get_team_abbr_by_name',
+    'get_team_short_name',
+    'get_team_division',
+    'get_division_teams',
+    'normalize_team_abbr',
     'TEAM_FULL_NAMES',
     'TEAM_IDS',
+    'DIVISION_TEAMS',
     'DataCache'
 ]
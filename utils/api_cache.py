@@ -5,19 +5,162 @@ Caches individual API responses to allow format/transform changes
 without re-fetching data from external APIs.
 """
 
+import copy
 import json
-import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Optional, Callable
-from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Callable, Tuple
+from datetime import date, datetime, timedelta
 from functools import wraps
+import pandas as pd
 from config.logging_config import get_logger
+from config.settings import CacheConfig
+from utils.cache_backends import create_backend, hash_params
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking
+    fcntl = None
 
 logger = get_logger(__name__)
 
 # Default TTL: 6 hours
 DEFAULT_TTL_HOURS = 6
 
+# Default number of decoded responses kept in the in-memory LRU tier
+DEFAULT_MEMORY_ENTRIES = 256
+
+# Per-endpoint TTLs in hours, keyed by (source, endpoint).
+# Endpoints not listed here use the cache-wide TTL.
+TTL_POLICY_HOURS: Dict[Tuple[str, str], float] = {
+    # Changes through the day
+    ('mlb', 'transactions'): 1,
+    ('mlb', 'team_injuries'): 1,
+    ('mlb', 'game_lineups'): 1,
+    ('mlb', 'game_bench'): 1,
+    ('mlb', 'game_bullpen'): 1,
+    ('mlb', 'game_boxscore'): 1,  # final boxscores are pinned
+    # Changes once or twice a day
+    ('mlb', 'schedule'): 6,
+    ('mlb', 'team_record'): 6,
+    ('mlb', 'league_leaders'): 12,
+    ('mlb', 'batter_stats'): 12,
+    ('mlb', 'pitcher_stats'): 12,
+    # Season aggregates, refreshed overnight at most
+    ('statcast', 'arsenals'): 24,
+    ('fangraphs', 'batting_stats'): 24,
+    ('fangraphs', 'pitching_stats'): 24,
+    ('bref', 'batting_stats'): 24,
+    ('bref', 'pitching_stats'): 24,
+    # Series extended day by day (past days don't change)
+    ('statcast', 're24_games'): 168,
+}
+
+# How long past expiry (in hours) an entry may still be served while it is
+# refreshed in the background, keyed by (source, endpoint). Only used in
+# stale-while-revalidate mode; endpoints not listed are never served stale.
+MAX_STALENESS_HOURS: Dict[Tuple[str, str], float] = {
+    ('mlb', 'schedule'): 12,
+    ('mlb', 'team_record'): 12,
+    ('mlb', 'league_leaders'): 24,
+}
+
+# Background threads refreshing stale entries
+REVALIDATE_WORKERS = 2
+
+# Game statuses after which a game's data can no longer change
+FINAL_GAME_STATUSES = {'Final', 'Completed Early'}
+
+# Statuses of games that won't be played on their scheduled date (a
+# postponed game is rescheduled as a new entry on its new date)
+CALLED_OFF_STATUS_PREFIXES = ('Postponed', 'Cancelled')
+
+# Params that bound a request's date range, checked in order
+_RANGE_END_PARAMS = ('end_date', 'date', 'start_date')
+
+
+def _parse_date(value: Any) -> Optional[date]:
+    """Parse a YYYY-MM-DD param, returning None if it isn't one."""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value), '%Y-%m-%d').date()
+    except (TypeError, ValueError):
+        return None
+
+
+def is_final_data(params: dict, response: Any) -> bool:
+    """
+    Check whether a response is provably final and can be cached forever.
+
+    Data is final when:
+        - the request's date range ends before today
+          (end_date, or date/start_date for single-day requests)
+        - the request is for a past season
+        - every game in the response has a final status
+          (statsapi.schedule lists or raw game feeds)
+
+    A past date range or season is not enough for schedule lists: a
+    schedule fetched just after midnight for "through yesterday" can
+    still hold a late game in progress or a suspended one. Those are
+    only final once every game is final, postponed or cancelled.
+
+    Args:
+        params: Request parameters
+        response: Response data
+
+    Returns:
+        True if the data can never change
+    """
+    today = date.today()
+
+    # statsapi.schedule() results
+    statuses = None
+    if isinstance(response, list) and response and all(isinstance(g, dict) and 'status' in g for g in response):
+        statuses = [str(g.get('status') or '') for g in response]
+
+    past = False
+    for key in _RANGE_END_PARAMS:
+        if params.get(key):
+            range_end = _parse_date(params[key])
+            past = range_end is not None and range_end < today
+            break
+
+    season = params.get('season')
+    if isinstance(season, int) and season < today.year:
+        past = True
+
+    if past:
+        if statuses is None:
+            return True
+        return all(status in FINAL_GAME_STATUSES or status.startswith(CALLED_OFF_STATUS_PREFIXES)
+                   for status in statuses)
+
+    if statuses is not None and all(status in FINAL_GAME_STATUSES for status in statuses):
+        return True
+
+    # Raw game feeds (statsapi.get('game', ...))
+    if isinstance(response, dict):
+        status = response.get('gameData', {}).get('status', {})
+        if status.get('abstractGameState') == 'Final':
+            return True
+
+    return False
+
+
+class _Flight:
+    """An in-flight fetch that other callers of the same key wait on."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
 
 class APICache:
     """
@@ -25,173 +168,475 @@ class APICache:
 
     Cache keys are based on: source + endpoint + params_hash
     Example: mlb_schedule_a1b2c3d4.json
+
+    Storage is delegated to a backend (see utils.cache_backends): one file
+    per entry, or a single SQLite database. pandas DataFrames are stored as
+    Parquet and returned as DataFrames; everything else is stored as JSON.
+
+    Each endpoint gets a TTL from TTL_POLICY_HOURS (falling back to the
+    cache-wide TTL), and entries holding data that can no longer change
+    (final games, past date ranges, past seasons) are pinned and never
+    expire. See is_final_data().
+
+    With stale_while_revalidate enabled, get() calls that pass a
+    revalidate callable return an expired entry (within the endpoint's
+    MAX_STALENESS_HOURS) immediately and refresh it on a background thread.
+
+    get_or_fetch() deduplicates concurrent misses (single-flight): one
+    caller fetches and every other caller of the same key waits for its
+    result. With process_lock enabled, a file lock per key extends this to
+    processes sharing the cache directory.
+
+    A process-local LRU tier sits in front of the backend and keeps decoded
+    responses with their cache timestamps, so repeated reads of the same
+    entry (schedules, standings, FanGraphs tables) skip storage I/O entirely.
     """
 
-    def __init__(self, cache_dir: str = "data/api_cache", ttl_hours: int = DEFAULT_TTL_HOURS):
+    def __init__(
+        self,
+        cache_dir: str = "data/api_cache",
+        ttl_hours: int = DEFAULT_TTL_HOURS,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        backend: str = 'file',
+        memory_map: bool = False,
+        ttl_policy: Optional[Dict[Tuple[str, str], float]] = None,
+        stale_while_revalidate: bool = False,
+        max_staleness: Optional[Dict[Tuple[str, str], float]] = None,
+        process_lock: bool = False
+    ):
         """
         Initialize API cache.
 
         Args:
             cache_dir: Directory to store cache files
-            ttl_hours: Time-to-live in hours (default: 6)
+            ttl_hours: Default time-to-live in hours (default: 6)
+            memory_entries: Max decoded responses kept in memory (0 disables the tier)
+            backend: Storage backend name ('file' or 'sqlite')
+            memory_map: Memory-map Parquet files when loading cached DataFrames
+            ttl_policy: Per-endpoint TTLs in hours keyed by (source, endpoint)
+                        (default: TTL_POLICY_HOURS)
+            stale_while_revalidate: Serve expired entries while refreshing them
+            max_staleness: Per-endpoint staleness bounds in hours
+                           (default: MAX_STALENESS_HOURS)
+            process_lock: Also coalesce fetches across processes with file locks
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = timedelta(hours=ttl_hours)
-        logger.info(f"APICache initialized: {self.cache_dir} (TTL: {ttl_hours}h)")
+        self.ttl_policy = TTL_POLICY_HOURS if ttl_policy is None else ttl_policy
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_staleness = MAX_STALENESS_HOURS if max_staleness is None else max_staleness
+        self.process_lock = process_lock and fcntl is not None
+        self.lock_dir = self.cache_dir / '.locks'
+        self.memory_entries = memory_entries
+        self.backend = create_backend(backend, self.cache_dir, self.ttl, memory_map, self.ttl_policy)
+
+        # key -> (cached_at, expires_at, response), most recently used last
+        self._memory: "OrderedDict[str, Tuple[datetime, Optional[datetime], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0,
+            'stale_hits': 0, 'revalidations': 0, 'coalesced': 0
+        }
 
-    def _hash_params(self, params: dict) -> str:
-        """Create a short hash of parameters for cache key."""
-        # Sort keys for consistent hashing
-        param_str = json.dumps(params, sort_keys=True, default=str)
-        return hashlib.md5(param_str.encode()).hexdigest()[:8]
+        # key -> fetch in progress in this process
+        self._inflight: Dict[str, _Flight] = {}
 
-    def _get_cache_path(self, source: str, endpoint: str, params: dict) -> Path:
-        """
-        Generate cache file path.
+        # Per-thread counters for track()
+        self._local = threading.local()
 
-        Args:
-            source: API source (e.g., 'mlb', 'statcast', 'bref')
-            endpoint: Endpoint name (e.g., 'schedule', 'pitch_mix')
-            params: Request parameters
+        # Keys with a background refresh in flight, and the pool running them
+        self._revalidating: set = set()
+        self._revalidate_pool: Optional[ThreadPoolExecutor] = None
 
-        Returns:
-            Path to cache file
-        """
-        params_hash = self._hash_params(params)
-        filename = f"{source}_{endpoint}_{params_hash}.json"
-        return self.cache_dir / filename
+        logger.info(
+            f"APICache initialized: {self.cache_dir} "
+            f"(backend: {self.backend.name}, TTL: {ttl_hours}h, memory: {memory_entries} entries)"
+        )
 
-    def _is_expired(self, cache_path: Path) -> bool:
-        """Check if cache file has expired."""
-        if not cache_path.exists():
-            return True
+    def _hash_params(self, params: dict) -> str:
+        """Create a hash of parameters for cache key."""
+        return hash_params(params)
+
+    def _memory_key(self, source: str, endpoint: str, params_hash: str) -> str:
+        return f"{source}_{endpoint}_{params_hash}"
+
+    def ttl_for(self, source: str, endpoint: str) -> timedelta:
+        """Get the TTL for an endpoint from the policy table."""
+        hours = self.ttl_policy.get((source, endpoint))
+        return self.ttl if hours is None else timedelta(hours=hours)
+
+    @staticmethod
+    def _is_expired(expires_at: Optional[datetime]) -> bool:
+        """Check if an expiry timestamp has passed (None never expires)."""
+        return expires_at is not None and expires_at < datetime.now()
+
+    def _memory_get(self, key: str) -> Optional[Tuple[datetime, Optional[datetime], Any]]:
+        """Look up an entry in the LRU tier, marking it most recently used."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+            return entry
+
+    def _memory_put(self, key: str, cached_at: datetime, expires_at: Optional[datetime], response: Any) -> None:
+        """Insert an entry into the LRU tier, evicting the oldest if full."""
+        if self.memory_entries <= 0:
+            return
+
+        with self._lock:
+            self._memory[key] = (cached_at, expires_at, response)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def _memory_discard(self, key: Optional[str] = None) -> None:
+        """Drop one entry (or all entries when key is None) from the LRU tier."""
+        with self._lock:
+            if key is None:
+                self._memory.clear()
+            else:
+                self._memory.pop(key, None)
 
-        try:
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
+    def _count(self, counter: str) -> None:
+        """Increment a hit/miss counter."""
+        with self._lock:
+            self._counters[counter] += 1
 
-            cached_at = datetime.fromisoformat(data.get('_cached_at', '2000-01-01'))
-            return datetime.now() - cached_at > self.ttl
+        tracked = getattr(self._local, 'tracked', None)
+        if tracked is not None:
+            tracked[counter] = tracked.get(counter, 0) + 1
 
-        except Exception:
-            return True
+    @contextmanager
+    def track(self):
+        """
+        Count cache hits/misses made by the current thread inside the block.
 
-    def get(self, source: str, endpoint: str, params: dict) -> Optional[Any]:
+        Usage:
+            with cache.track() as counts:
+                client.get_schedule(...)
+            fetched = counts.get('misses', 0) > 0
+        """
+        previous = getattr(self._local, 'tracked', None)
+        self._local.tracked = counts = {}
+        try:
+            yield counts
+        finally:
+            self._local.tracked = previous
+            if previous is not None:
+                for counter, n in counts.items():
+                    previous[counter] = previous.get(counter, 0) + n
+
+    def _servable_stale(self, source: str, endpoint: str, expires_at: datetime) -> bool:
+        """Check if an expired entry is within its endpoint's staleness bound."""
+        hours = self.max_staleness.get((source, endpoint))
+        if not hours:
+            return False
+        return datetime.now() <= expires_at + timedelta(hours=hours)
+
+    def _revalidate(self, key: str, source: str, endpoint: str, params: dict, fetch: Callable[[], Any]) -> None:
+        """Refresh an entry on a background thread (once per key at a time)."""
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+            if self._revalidate_pool is None:
+                self._revalidate_pool = ThreadPoolExecutor(
+                    max_workers=REVALIDATE_WORKERS,
+                    thread_name_prefix='api-cache-revalidate'
+                )
+            pool = self._revalidate_pool
+
+        def refresh():
+            try:
+                response = fetch()
+                if response is not None:
+                    self.set(source, endpoint, params, response)
+                    self._count('revalidations')
+                    logger.debug(f"Revalidated: {key}")
+            except Exception as e:
+                logger.warning(f"Background refresh of {key} failed: {e}")
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        pool.submit(refresh)
+
+    def wait_for_revalidation(self) -> None:
+        """Block until in-flight background refreshes have finished."""
+        with self._lock:
+            pool, self._revalidate_pool = self._revalidate_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def get(
+        self,
+        source: str,
+        endpoint: str,
+        params: dict,
+        revalidate: Optional[Callable[[], Any]] = None
+    ) -> Optional[Any]:
         """
         Get cached response if available and not expired.
 
+        Checks the in-memory tier first, then falls back to the backend
+        (read once and promoted into memory).
+
+        In stale-while-revalidate mode, an expired entry still within the
+        endpoint's staleness bound is returned as-is when `revalidate` is
+        given, and `revalidate()` is run in the background to refresh it.
+
         Args:
             source: API source
             endpoint: Endpoint name
             params: Request parameters
+            revalidate: Fetches a fresh response (no args; None results are not cached)
 
         Returns:
             Cached data or None if not found/expired
         """
-        cache_path = self._get_cache_path(source, endpoint, params)
-
-        if not cache_path.exists():
-            logger.debug(f"Cache miss: {cache_path.name}")
+        params_hash = self._hash_params(params)
+        key = self._memory_key(source, endpoint, params_hash)
+
+        entry = self._memory_get(key)
+        if entry is not None:
+            cached_at, expires_at, response = entry
+            if not self._is_expired(expires_at):
+                self._count('memory_hits')
+                logger.debug(f"Cache hit (memory): {key}")
+                # Hand out a copy so callers can't mutate the shared entry
+                return copy.deepcopy(response)
+            self._memory_discard(key)
+
+        stored = self.backend.read(source, endpoint, params_hash)
+        if stored is None:
+            self._count('misses')
+            logger.debug(f"Cache miss: {key}")
             return None
 
-        if self._is_expired(cache_path):
-            logger.debug(f"Cache expired: {cache_path.name}")
-            return None
+        if self._is_expired(stored['expires_at']):
+            if (revalidate is not None and self.stale_while_revalidate
+                    and self._servable_stale(source, endpoint, stored['expires_at'])):
+                self._count('stale_hits')
+                logger.debug(f"Cache stale hit: {key}")
+                self._revalidate(key, source, endpoint, params, revalidate)
+                return stored['response']
 
-        try:
-            with open(cache_path, 'r') as f:
-                data = json.load(f)
+            self._count('misses')
+            logger.debug(f"Cache expired: {key}")
+            return None
 
-            # Return the actual response data, not metadata
-            logger.debug(f"Cache hit: {cache_path.name}")
-            return data.get('_response')
+        response = stored['response']
+        self._memory_put(key, stored['cached_at'], stored['expires_at'], copy.deepcopy(response))
+        self._count('disk_hits')
 
-        except Exception as e:
-            logger.warning(f"Error reading cache {cache_path.name}: {e}")
-            return None
+        # Return the actual response data, not metadata
+        logger.debug(f"Cache hit: {key}")
+        return response
 
-    def set(self, source: str, endpoint: str, params: dict, response: Any) -> Path:
+    def set(self, source: str, endpoint: str, params: dict, response: Any, pin: bool = False) -> Path:
         """
         Cache an API response.
 
+        The entry expires after the endpoint's TTL, unless it is pinned:
+        either explicitly, or because is_final_data() shows it can't change.
+
         Args:
             source: API source
             endpoint: Endpoint name
             params: Request parameters
             response: Response data to cache
+            pin: Never expire this entry (e.g. a lineup from a final game)
 
         Returns:
-            Path to cache file
+            Path to the cache file (or database)
         """
-        cache_path = self._get_cache_path(source, endpoint, params)
-
-        cache_data = {
-            '_cached_at': datetime.now().isoformat(),
-            '_source': source,
-            '_endpoint': endpoint,
-            '_params': params,
-            '_response': response
-        }
+        params_hash = self._hash_params(params)
+        key = self._memory_key(source, endpoint, params_hash)
+        cached_at = datetime.now()
+
+        if pin or is_final_data(params, response):
+            expires_at = None
+            logger.debug(f"Pinned: {key}")
+        else:
+            expires_at = cached_at + self.ttl_for(source, endpoint)
+
+        # Store the JSON round-tripped form so memory hits match storage hits;
+        # DataFrames are copied so the caller's later changes don't reach
+        # the memory tier
+        if isinstance(response, pd.DataFrame):
+            response = response.copy()
+        else:
+            response = json.loads(json.dumps(response, default=str))
 
         try:
-            with open(cache_path, 'w') as f:
-                json.dump(cache_data, f, indent=2, default=str)
+            path = self.backend.write(source, endpoint, params, params_hash, cached_at, expires_at, response)
+        except Exception as e:
+            logger.error(f"Error writing cache {key}: {e}")
+            raise
 
-            logger.debug(f"Cached: {cache_path.name} ({cache_path.stat().st_size / 1024:.1f} KB)")
-            return cache_path
+        self._memory_put(key, cached_at, expires_at, response)
+        return path
 
-        except Exception as e:
-            logger.error(f"Error writing cache {cache_path.name}: {e}")
+    def peek(self, source: str, endpoint: str, params: dict) -> Optional[Any]:
+        """Read a live entry without updating counters or the LRU tier."""
+        params_hash = self._hash_params(params)
+        with self._lock:
+            entry = self._memory.get(self._memory_key(source, endpoint, params_hash))
+        if entry is not None and not self._is_expired(entry[1]):
+            return copy.deepcopy(entry[2])
+
+        stored = self.backend.read(source, endpoint, params_hash)
+        if stored is not None and not self._is_expired(stored['expires_at']):
+            return stored['response']
+        return None
+
+    def has(self, source: str, endpoint: str, params: dict) -> bool:
+        """Check for a live entry without counting a hit or miss."""
+        params_hash = self._hash_params(params)
+        with self._lock:
+            entry = self._memory.get(self._memory_key(source, endpoint, params_hash))
+        if entry is not None and not self._is_expired(entry[1]):
+            return True
+        stored = self.backend.read(source, endpoint, params_hash)
+        return stored is not None and not self._is_expired(stored['expires_at'])
+
+    @contextmanager
+    def _key_lock(self, key: str):
+        """Hold an exclusive file lock for a key (no-op unless process_lock)."""
+        if not self.process_lock:
+            yield
+            return
+
+        self.lock_dir.mkdir(exist_ok=True)
+        with open(self.lock_dir / f"{key}.lock", 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def get_or_fetch(
+        self,
+        source: str,
+        endpoint: str,
+        params: dict,
+        fetch: Callable[[], Any],
+        pin: bool = False
+    ) -> Optional[Any]:
+        """
+        Get a cached response, fetching and caching it on a miss.
+
+        Concurrent misses on the same key are coalesced: the first caller
+        runs fetch() and the others wait and receive a copy of its result
+        (or its exception). With process_lock, the fetching caller also
+        holds a per-key file lock and re-checks the cache once it has it, so
+        a fetch completed by another process is reused.
+
+        Args:
+            source: API source
+            endpoint: Endpoint name
+            params: Request parameters
+            fetch: Fetches the response (no args; None results are not cached)
+            pin: Never expire the fetched entry
+
+        Returns:
+            Cached or freshly fetched data (None if fetch returned None)
+        """
+        cached = self.get(source, endpoint, params, revalidate=fetch)
+        if cached is not None:
+            return cached
+
+        key = self._memory_key(source, endpoint, self._hash_params(params))
+        with self._lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+            else:
+                self._counters['coalesced'] += 1
+
+        if not leader:
+            logger.debug(f"Waiting on in-flight fetch: {key}")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        try:
+            with self._key_lock(key):
+                # Another thread or process may have filled the entry since our miss
+                result = self.peek(source, endpoint, params)
+                if result is None:
+                    result = fetch()
+                    if result is not None:
+                        self.set(source, endpoint, params, result, pin=pin)
+            flight.result = result
+            return result
+        except BaseException as e:
+            flight.error = e
             raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
 
     def invalidate(self, source: str, endpoint: str, params: dict) -> bool:
         """Delete a specific cache entry."""
-        cache_path = self._get_cache_path(source, endpoint, params)
-        if cache_path.exists():
-            cache_path.unlink()
-            logger.info(f"Invalidated: {cache_path.name}")
+        params_hash = self._hash_params(params)
+        key = self._memory_key(source, endpoint, params_hash)
+        self._memory_discard(key)
+        if self.backend.delete(source, endpoint, params_hash):
+            logger.info(f"Invalidated: {key}")
             return True
         return False
 
     def clear_expired(self) -> int:
-        """Remove all expired cache files. Returns count of removed files."""
-        removed = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            if self._is_expired(cache_file):
-                cache_file.unlink()
-                removed += 1
+        """Remove all expired cache entries. Returns count of removed entries."""
+        now = datetime.now()
+        with self._lock:
+            for key in [k for k, (_, expires_at, _) in self._memory.items()
+                        if expires_at is not None and expires_at < now]:
+                del self._memory[key]
+
+        removed = self.backend.clear_expired(now)
         if removed:
-            logger.info(f"Cleared {removed} expired cache files")
+            logger.info(f"Cleared {removed} expired cache entries")
         return removed
 
     def clear_all(self) -> int:
-        """Remove all cache files. Returns count of removed files."""
-        removed = 0
-        for cache_file in self.cache_dir.glob("*.json"):
-            cache_file.unlink()
-            removed += 1
+        """Remove all cache entries. Returns count of removed entries."""
+        self._memory_discard()
+        removed = self.backend.clear_all()
         if removed:
-            logger.info(f"Cleared all {removed} cache files")
+            logger.info(f"Cleared all {removed} cache entries")
         return removed
 
     def stats(self) -> dict:
         """Get cache statistics."""
-        total = 0
-        expired = 0
-        total_size = 0
+        stored = self.backend.stats(datetime.now())
 
-        for cache_file in self.cache_dir.glob("*.json"):
-            total += 1
-            total_size += cache_file.stat().st_size
-            if self._is_expired(cache_file):
-                expired += 1
+        with self._lock:
+            counters = dict(self._counters)
+            memory_entries = len(self._memory)
 
         return {
-            'total_files': total,
-            'expired_files': expired,
-            'valid_files': total - expired,
-            'total_size_kb': total_size / 1024
+            'backend': self.backend.name,
+            'total_files': stored['total'],
+            'expired_files': stored['expired'],
+            'valid_files': stored['total'] - stored['expired'],
+            'pinned_files': stored['pinned'],
+            'quarantined_files': stored['quarantined'],
+            'total_size_kb': stored['size_bytes'] / 1024,
+            'memory_entries': memory_entries,
+            'memory_hits': counters['memory_hits'],
+            'disk_hits': counters['disk_hits'],
+            'misses': counters['misses'],
+            'evictions': counters['evictions'],
+            'stale_hits': counters['stale_hits'],
+            'revalidations': counters['revalidations'],
+            'coalesced': counters['coalesced']
         }
 
 
@@ -200,10 +645,22 @@ _cache: Optional[APICache] = None
 
 
 def get_api_cache() -> APICache:
-    """Get or create the global API cache instance."""
+    """
+    Get or create the global API cache instance.
+
+    The storage backend comes from CacheConfig.cache_backend
+    (CACHE_BACKEND in .env): 'file' or 'sqlite'. Stale-while-revalidate
+    reads are enabled with CACHE_STALE_WHILE_REVALIDATE=true, and
+    cross-process fetch coalescing with CACHE_PROCESS_LOCK=true.
+    """
     global _cache
     if _cache is None:
-        _cache = APICache()
+        config = CacheConfig()
+        _cache = APICache(
+            backend=config.cache_backend,
+            stale_while_revalidate=config.cache_stale_while_revalidate,
+            process_lock=config.cache_process_lock
+        )
     return _cache
 
 
@@ -243,17 +700,8 @@ def cached(source: str, endpoint: str, param_keys: list[str] = None):
                     if param_names[i] != 'self':
                         params[param_names[i]] = arg
 
-            # Check cache
-            cached_result = cache.get(source, endpoint, params)
-            if cached_result is not None:
-                return cached_result
-
-            # Call function and cache result
-            result = func(*args, **kwargs)
-            if result is not None:
-                cache.set(source, endpoint, params, result)
-
-            return result
+            # Concurrent callers with the same params share one call
+            return cache.get_or_fetch(source, endpoint, params, lambda: func(*args, **kwargs))
 
         return wrapper
     return decorator
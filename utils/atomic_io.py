@@ -0,0 +1,137 @@
+"""
+Crash-safe file writes and content checksums for cached data.
+
+Cache files and bundles are written to a temporary file beside the target,
+flushed to disk and renamed over it, so a process killed mid-write leaves
+either the old file or the new one, never a truncated mix. A checksum
+stored with the content lets readers detect files damaged some other way;
+damaged files are moved aside to a quarantine directory instead of being
+read or silently overwritten.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, IO, Iterator, Optional
+from config.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Subdirectory (of a cache directory) holding quarantined files
+QUARANTINE_DIRNAME = 'quarantine'
+
+
+@contextmanager
+def atomic_open(path: Path, mode: str = 'w') -> Iterator[IO]:
+    """
+    Open a temporary file that replaces `path` when the block exits cleanly.
+
+    If the block raises, the temporary file is removed and `path` is left
+    untouched.
+
+    Args:
+        path: Destination file
+        mode: 'w' for text or 'wb' for binary
+
+    Usage:
+        with atomic_open(path) as f:
+            json.dump(data, f)
+    """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, mode) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def atomic_write_json(
+    path: Path,
+    data: Any,
+    indent: Optional[int] = 2,
+    default: Optional[Callable[[Any], Any]] = str
+) -> Path:
+    """
+    Write JSON to a file atomically.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable data
+        indent: JSON indentation (None for compact)
+        default: Converts non-JSON values (default: str(); None raises
+                 TypeError like json.dump, leaving the file untouched)
+
+    Returns:
+        The destination path
+    """
+    with atomic_open(path) as f:
+        json.dump(data, f, indent=indent, default=default)
+    return Path(path)
+
+
+def content_checksum(data: Any) -> str:
+    """
+    SHA-256 of the canonical JSON form of `data`.
+
+    Keys are sorted and separators fixed, so the checksum only depends on
+    the content, not on how the file was formatted. `data` should already
+    be JSON-native (as loaded back from the file); see to_json_native().
+    """
+    canonical = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def to_json_native(data: Any) -> Any:
+    """Round-trip data through JSON (non-JSON values become str), as a reader would see it."""
+    return json.loads(json.dumps(data, default=str))
+
+
+def bytes_checksum(payload: bytes) -> str:
+    """SHA-256 of raw bytes."""
+    return hashlib.sha256(payload).hexdigest()
+
+
+def quarantine_file(path: Path, quarantine_dir: Optional[Path] = None, reason: str = '') -> Optional[Path]:
+    """
+    Move a corrupt file aside so it is neither read nor overwritten.
+
+    Args:
+        path: The corrupt file
+        quarantine_dir: Destination directory (default: <path's dir>/quarantine)
+        reason: Why the file was quarantined (logged)
+
+    Returns:
+        New location of the file, or None if it could not be moved
+    """
+    path = Path(path)
+    if quarantine_dir is None:
+        quarantine_dir = path.parent / QUARANTINE_DIRNAME
+
+    target = quarantine_dir / f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{path.name}"
+    try:
+        quarantine_dir.mkdir(parents=True, exist_ok=True)
+        os.replace(path, target)
+    except FileNotFoundError:
+        # Another reader got there first
+        return None
+    except OSError as e:
+        logger.error(f"Could not quarantine {path}: {e}")
+        return None
+
+    logger.warning(f"Quarantined corrupt file {path.name} -> {target}" + (f" ({reason})" if reason else ""))
+    return target
+
+
+def count_quarantined(quarantine_dir: Path) -> int:
+    """Count files in a quarantine directory."""
+    if not quarantine_dir.exists():
+        return 0
+    return sum(1 for p in quarantine_dir.iterdir() if p.is_file())
@@ -0,0 +1,638 @@
+"""
+Storage backends for the API response cache.
+
+APICache handles keys, TTLs and the in-memory tier; a backend only
+stores and retrieves entries. Two backends are available:
+
+- 'file':   one pretty-printed JSON file per entry (the original layout)
+- 'sqlite': a single SQLite database with compressed payloads and an
+            index on expiry, so sweeps and stats are one query instead
+            of re-opening every file
+
+Each entry carries its cached_at and expires_at timestamps. An
+expires_at of None means the entry never expires.
+
+Writes are crash-safe (temp file + rename for files, transactions for
+SQLite) and each entry carries a checksum that is verified on read.
+Entries that fail to parse or verify are quarantined, not returned:
+moved to <cache_dir>/quarantine, or to the api_cache_quarantine table.
+
+Plain responses are stored as JSON. pandas DataFrames are stored as
+Parquet (columnar, zstd-compressed) and come back as DataFrames, which
+avoids the records-JSON round trip for large tables like FanGraphs.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from datetime import datetime, timedelta
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from config.logging_config import get_logger
+from utils.atomic_io import (
+    QUARANTINE_DIRNAME, atomic_open, bytes_checksum, content_checksum,
+    count_quarantined, quarantine_file
+)
+
+logger = get_logger(__name__)
+
+# Parquet schema metadata key holding the cache entry metadata
+_PARQUET_META_KEY = b'api_cache'
+
+
+def hash_params(params: dict) -> str:
+    """Hash request parameters into the hex digest entries are keyed by."""
+    # Sort keys for consistent hashing
+    param_str = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.md5(param_str.encode()).hexdigest()
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO timestamp, returning None for missing/invalid values."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _dataframe_to_table(df: pd.DataFrame, metadata: Optional[dict] = None) -> pa.Table:
+    """Convert a DataFrame to an Arrow table, attaching cache metadata."""
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Object columns mixing types (e.g. '$1.2' strings next to NaN) can't be
+        # typed by Arrow; store them as nullable strings instead
+        df = df.copy()
+        for col in df.columns[df.dtypes == object]:
+            df[col] = df[col].astype('string')
+        table = pa.Table.from_pandas(df)
+
+    if metadata is not None:
+        schema_metadata = dict(table.schema.metadata or {})
+        schema_metadata[_PARQUET_META_KEY] = json.dumps(metadata, default=str).encode()
+        table = table.replace_schema_metadata(schema_metadata)
+
+    return table
+
+
+def dataframe_to_parquet_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame to Parquet bytes."""
+    sink = pa.BufferOutputStream()
+    pq.write_table(_dataframe_to_table(df), sink, compression='zstd', write_page_checksum=True)
+    return sink.getvalue().to_pybytes()
+
+
+def parquet_bytes_to_dataframe(payload: bytes) -> pd.DataFrame:
+    """Deserialize Parquet bytes written by dataframe_to_parquet_bytes."""
+    return pq.read_table(pa.BufferReader(payload), page_checksum_verification=True).to_pandas()
+
+
+class CacheBackend:
+    """
+    Interface for API cache storage.
+
+    Entries are addressed by (source, endpoint, params_hash), where
+    params_hash is the full hex digest of the request parameters.
+    """
+
+    name = 'base'
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: timedelta,
+        memory_map: bool = False,
+        ttl_policy: Optional[Dict[Tuple[str, str], float]] = None
+    ):
+        """
+        Initialize backend.
+
+        Args:
+            cache_dir: Directory owned by the cache
+            ttl: Fallback TTL for entries written without an expiry
+            memory_map: Memory-map Parquet files when reading DataFrames
+            ttl_policy: Per-endpoint TTLs in hours keyed by (source, endpoint),
+                        used instead of `ttl` where an endpoint has one
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.memory_map = memory_map
+        self.ttl_policy = ttl_policy or {}
+
+    def ttl_for(self, source: Optional[str], endpoint: Optional[str]) -> timedelta:
+        """Get the fallback TTL for an endpoint's entries written without an expiry."""
+        hours = self.ttl_policy.get((source, endpoint))
+        return self.ttl if hours is None else timedelta(hours=hours)
+
+    def read(self, source: str, endpoint: str, params_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Read an entry.
+
+        Returns:
+            Dict with 'cached_at', 'expires_at' and 'response', or None if missing/unreadable
+        """
+        raise NotImplementedError
+
+    def write(
+        self,
+        source: str,
+        endpoint: str,
+        params: dict,
+        params_hash: str,
+        cached_at: datetime,
+        expires_at: Optional[datetime],
+        response: Any
+    ) -> Path:
+        """
+        Write an entry, replacing any existing one.
+
+        Returns:
+            Path where the entry was stored
+        """
+        raise NotImplementedError
+
+    def delete(self, source: str, endpoint: str, params_hash: str) -> bool:
+        """Delete an entry. Returns True if it existed."""
+        raise NotImplementedError
+
+    def clear_expired(self, now: datetime) -> int:
+        """Delete entries that expired before `now`. Returns count removed."""
+        raise NotImplementedError
+
+    def clear_all(self) -> int:
+        """Delete all entries. Returns count removed."""
+        raise NotImplementedError
+
+    def stats(self, now: datetime) -> Dict[str, Any]:
+        """
+        Summarize stored entries.
+
+        Returns:
+            Dict with 'total', 'expired', 'pinned' (never expire),
+            'quarantined' (corrupt entries set aside) and 'size_bytes'
+        """
+        raise NotImplementedError
+
+
+class FileCacheBackend(CacheBackend):
+    """
+    One file per entry.
+
+    Filenames use the full params hash:
+    mlb_schedule_<hash>.json for plain responses, and
+    fangraphs_batting_stats_<hash>.parquet for DataFrames (entry
+    metadata lives in the Parquet schema metadata).
+
+    Files from earlier versions are named by the first 8 hex chars of
+    the hash. They are still read, but only after checking their stored
+    params hash to the full hash, since two parameter sets can share a
+    short prefix.
+
+    JSON entries store a '_checksum' of the response; Parquet files carry
+    page checksums. Files written before checksums are still accepted.
+    """
+
+    name = 'file'
+
+    PATTERNS = ("*.json", "*.parquet")
+
+    def _path(self, source: str, endpoint: str, params_hash: str, suffix: str = '.json') -> Path:
+        return self.cache_dir / f"{source}_{endpoint}_{params_hash}{suffix}"
+
+    def _legacy_path(self, source: str, endpoint: str, params_hash: str, suffix: str = '.json') -> Path:
+        return self.cache_dir / f"{source}_{endpoint}_{params_hash[:8]}{suffix}"
+
+    def _legacy_entries(self, source: str, endpoint: str, params_hash: str, metadata_only: bool = False):
+        """Yield (path, data) for short-named files that belong to this entry."""
+        for suffix in ('.json', '.parquet'):
+            path = self._legacy_path(source, endpoint, params_hash, suffix)
+            if not path.exists():
+                continue
+            data = self._load_metadata(path) if metadata_only else self._load(path)
+            if data is not None and hash_params(data.get('_params')) == params_hash:
+                yield path, data
+
+    def _files(self):
+        for pattern in self.PATTERNS:
+            yield from self.cache_dir.glob(pattern)
+
+    @property
+    def quarantine_dir(self) -> Path:
+        return self.cache_dir / QUARANTINE_DIRNAME
+
+    def _quarantine(self, path: Path, reason: str) -> None:
+        quarantine_file(path, self.quarantine_dir, reason)
+
+    def _load(self, path: Path) -> Optional[dict]:
+        """
+        Parse and verify a cache file once.
+
+        Returns None if the file is missing; corrupt files are quarantined
+        and also return None.
+        """
+        try:
+            if path.suffix == '.parquet':
+                table = pq.read_table(path, memory_map=self.memory_map, page_checksum_verification=True)
+                data = json.loads(table.schema.metadata[_PARQUET_META_KEY])
+                data['_response'] = table.to_pandas()
+                return data
+
+            with open(path, 'r') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._quarantine(path, f"unreadable: {e}")
+            return None
+
+        if not isinstance(data, dict):
+            self._quarantine(path, "not a cache document")
+            return None
+
+        if '_checksum' in data and content_checksum(data.get('_response')) != data['_checksum']:
+            self._quarantine(path, "checksum mismatch")
+            return None
+
+        return data
+
+    def _load_metadata(self, path: Path) -> Optional[dict]:
+        """Load entry metadata, reading only the footer of Parquet files."""
+        if path.suffix != '.parquet':
+            return self._load(path)
+
+        try:
+            return json.loads(pq.read_schema(path).metadata[_PARQUET_META_KEY])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self._quarantine(path, f"unreadable: {e}")
+            return None
+
+    def _expiry(self, data: dict) -> tuple:
+        """Get (cached_at, expires_at) from a cache document."""
+        cached_at = _parse_timestamp(data.get('_cached_at')) or datetime.min
+
+        # Files written before expiries were stored fall back to the
+        # endpoint's TTL
+        if '_expires_at' not in data:
+            return cached_at, cached_at + self.ttl_for(data.get('_source'), data.get('_endpoint'))
+
+        return cached_at, _parse_timestamp(data['_expires_at'])
+
+    def read(self, source: str, endpoint: str, params_hash: str) -> Optional[Dict[str, Any]]:
+        data = self._load(self._path(source, endpoint, params_hash))
+        if data is None:
+            data = self._load(self._path(source, endpoint, params_hash, '.parquet'))
+        if data is None:
+            data = next((data for _, data in self._legacy_entries(source, endpoint, params_hash)), None)
+        if data is None:
+            return None
+
+        cached_at, expires_at = self._expiry(data)
+        return {
+            'cached_at': cached_at,
+            'expires_at': expires_at,
+            'response': data.get('_response')
+        }
+
+    def write(self, source, endpoint, params, params_hash, cached_at, expires_at, response) -> Path:
+        metadata = {
+            '_cached_at': cached_at.isoformat(),
+            '_expires_at': expires_at.isoformat() if expires_at else None,
+            '_source': source,
+            '_endpoint': endpoint,
+            '_params': params
+        }
+
+        # Written to a temp file and renamed over the entry, so readers
+        # (and processes killed mid-write) never see a partial file
+        if isinstance(response, pd.DataFrame):
+            path = self._path(source, endpoint, params_hash, '.parquet')
+            with atomic_open(path, 'wb') as f:
+                pq.write_table(
+                    _dataframe_to_table(response, metadata), f,
+                    compression='zstd', write_page_checksum=True
+                )
+            stale = self._path(source, endpoint, params_hash)
+        else:
+            path = self._path(source, endpoint, params_hash)
+            metadata['_checksum'] = content_checksum(response)
+            with atomic_open(path) as f:
+                json.dump({**metadata, '_response': response}, f, indent=2, default=str)
+            stale = self._path(source, endpoint, params_hash, '.parquet')
+
+        # Don't leave an entry of the other format (or an older short-named
+        # file) shadowing this one
+        stale.unlink(missing_ok=True)
+        for legacy_path, _ in self._legacy_entries(source, endpoint, params_hash, metadata_only=True):
+            legacy_path.unlink(missing_ok=True)
+
+        logger.debug(f"Cached: {path.name} ({path.stat().st_size / 1024:.1f} KB)")
+        return path
+
+    def delete(self, source: str, endpoint: str, params_hash: str) -> bool:
+        deleted = False
+        for suffix in ('.json', '.parquet'):
+            path = self._path(source, endpoint, params_hash, suffix)
+            if path.exists():
+                path.unlink()
+                deleted = True
+        for path, _ in list(self._legacy_entries(source, endpoint, params_hash, metadata_only=True)):
+            path.unlink(missing_ok=True)
+            deleted = True
+        return deleted
+
+    def _file_expiry(self, path: Path) -> tuple:
+        """Get (readable, expires_at) for a cache file."""
+        data = self._load_metadata(path)
+        if data is None:
+            return False, None
+        _, expires_at = self._expiry(data)
+        return True, expires_at
+
+    def _is_expired(self, path: Path, now: datetime) -> bool:
+        readable, expires_at = self._file_expiry(path)
+        if not readable:
+            return True
+        return expires_at is not None and expires_at < now
+
+    def clear_expired(self, now: datetime) -> int:
+        removed = 0
+        for cache_file in list(self._files()):
+            if self._is_expired(cache_file, now):
+                # Unreadable files were already moved to quarantine
+                if cache_file.exists():
+                    cache_file.unlink()
+                removed += 1
+        return removed
+
+    def clear_all(self) -> int:
+        removed = 0
+        for cache_file in list(self._files()):
+            cache_file.unlink()
+            removed += 1
+        return removed
+
+    def stats(self, now: datetime) -> Dict[str, Any]:
+        total = 0
+        expired = 0
+        pinned = 0
+        size = 0
+
+        for cache_file in list(self._files()):
+            readable, expires_at = self._file_expiry(cache_file)
+            if not readable:
+                # Corrupt (now quarantined) or deleted concurrently
+                continue
+
+            total += 1
+            size += cache_file.stat().st_size
+            if expires_at is not None and expires_at < now:
+                expired += 1
+            elif expires_at is None:
+                pinned += 1
+
+        return {
+            'total': total,
+            'expired': expired,
+            'pinned': pinned,
+            'quarantined': count_quarantined(self.quarantine_dir),
+            'size_bytes': size
+        }
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    All entries in one SQLite database (api_cache.sqlite3 in the cache dir).
+
+    Payloads are zlib-compressed compact JSON ('json' format) or Parquet
+    bytes for DataFrames ('parquet' format), with a SHA-256 of the payload
+    bytes. Timestamps are stored as epoch seconds; expires_at is indexed so
+    expiry sweeps and stats don't touch the payloads. Rows that fail to
+    verify or decode are moved to api_cache_quarantine.
+    """
+
+    name = 'sqlite'
+
+    DB_FILENAME = 'api_cache.sqlite3'
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS api_cache (
+            source      TEXT NOT NULL,
+            endpoint    TEXT NOT NULL,
+            params_hash TEXT NOT NULL,
+            params      TEXT,
+            cached_at   REAL NOT NULL,
+            expires_at  REAL,
+            format      TEXT NOT NULL DEFAULT 'json',
+            payload     BLOB NOT NULL,
+            checksum    TEXT,
+            PRIMARY KEY (source, endpoint, params_hash)
+        );
+        CREATE INDEX IF NOT EXISTS idx_api_cache_expires_at ON api_cache (expires_at);
+        CREATE TABLE IF NOT EXISTS api_cache_quarantine (
+            source         TEXT NOT NULL,
+            endpoint       TEXT NOT NULL,
+            params_hash    TEXT NOT NULL,
+            params         TEXT,
+            cached_at      REAL,
+            expires_at     REAL,
+            format         TEXT,
+            payload        BLOB,
+            checksum       TEXT,
+            reason         TEXT,
+            quarantined_at REAL NOT NULL
+        );
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        ttl: timedelta,
+        memory_map: bool = False,
+        ttl_policy: Optional[Dict[Tuple[str, str], float]] = None
+    ):
+        super().__init__(cache_dir, ttl, memory_map, ttl_policy)
+        self.db_path = self.cache_dir / self.DB_FILENAME
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=30)
+        with self._lock:
+            # WAL lets other processes read while one writes
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(self._SCHEMA)
+
+            # Databases created by earlier versions lack the format/checksum columns
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(api_cache)")}
+            if 'format' not in columns:
+                self._conn.execute("ALTER TABLE api_cache ADD COLUMN format TEXT NOT NULL DEFAULT 'json'")
+            if 'checksum' not in columns:
+                self._conn.execute("ALTER TABLE api_cache ADD COLUMN checksum TEXT")
+
+    def read(self, source: str, endpoint: str, params_hash: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT cached_at, expires_at, format, payload, checksum FROM api_cache "
+                "WHERE source = ? AND endpoint = ? AND params_hash = ?",
+                (source, endpoint, params_hash)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        cached_at, expires_at, payload_format, payload, checksum = row
+        if checksum is not None and bytes_checksum(payload) != checksum:
+            self._quarantine(source, endpoint, params_hash, "checksum mismatch")
+            return None
+
+        try:
+            if payload_format == 'parquet':
+                response = parquet_bytes_to_dataframe(payload)
+            else:
+                response = json.loads(zlib.decompress(payload))
+        except Exception as e:
+            self._quarantine(source, endpoint, params_hash, f"undecodable: {e}")
+            return None
+
+        return {
+            'cached_at': datetime.fromtimestamp(cached_at),
+            'expires_at': datetime.fromtimestamp(expires_at) if expires_at is not None else None,
+            'response': response
+        }
+
+    def write(self, source, endpoint, params, params_hash, cached_at, expires_at, response) -> Path:
+        if isinstance(response, pd.DataFrame):
+            payload_format = 'parquet'
+            payload = dataframe_to_parquet_bytes(response)
+        else:
+            payload_format = 'json'
+            payload = zlib.compress(json.dumps(response, separators=(',', ':'), default=str).encode())
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO api_cache "
+                "(source, endpoint, params_hash, params, cached_at, expires_at, format, payload, checksum) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    source, endpoint, params_hash,
+                    json.dumps(params, sort_keys=True, default=str),
+                    cached_at.timestamp(),
+                    expires_at.timestamp() if expires_at else None,
+                    payload_format,
+                    payload,
+                    bytes_checksum(payload)
+                )
+            )
+
+        logger.debug(f"Cached: {source}/{endpoint}/{params_hash[:8]} ({len(payload) / 1024:.1f} KB)")
+        return self.db_path
+
+    def _quarantine(self, source: str, endpoint: str, params_hash: str, reason: str) -> None:
+        """Move a corrupt row to api_cache_quarantine."""
+        key = (source, endpoint, params_hash)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO api_cache_quarantine "
+                "(source, endpoint, params_hash, params, cached_at, expires_at, format, payload, "
+                "checksum, reason, quarantined_at) "
+                "SELECT source, endpoint, params_hash, params, cached_at, expires_at, format, payload, "
+                "checksum, ?, ? FROM api_cache WHERE source = ? AND endpoint = ? AND params_hash = ?",
+                (reason, time.time(), *key)
+            )
+            self._conn.execute(
+                "DELETE FROM api_cache WHERE source = ? AND endpoint = ? AND params_hash = ?", key
+            )
+        logger.warning(f"Quarantined corrupt cache entry {source}/{endpoint}/{params_hash[:8]} ({reason})")
+
+    def delete(self, source: str, endpoint: str, params_hash: str) -> bool:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM api_cache WHERE source = ? AND endpoint = ? AND params_hash = ?",
+                (source, endpoint, params_hash)
+            )
+        return cursor.rowcount > 0
+
+    def clear_expired(self, now: datetime) -> int:
+        with self._lock, self._conn:
+            cursor = self._conn.execute(
+                "DELETE FROM api_cache WHERE expires_at < ?", (now.timestamp(),)
+            )
+        return cursor.rowcount
+
+    def clear_all(self) -> int:
+        with self._lock, self._conn:
+            cursor = self._conn.execute("DELETE FROM api_cache")
+        return cursor.rowcount
+
+    def stats(self, now: datetime) -> Dict[str, Any]:
+        with self._lock:
+            total, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0) FROM api_cache"
+            ).fetchone()
+            expired, = self._conn.execute(
+                "SELECT COUNT(*) FROM api_cache WHERE expires_at < ?", (now.timestamp(),)
+            ).fetchone()
+            pinned, = self._conn.execute(
+                "SELECT COUNT(*) FROM api_cache WHERE expires_at IS NULL"
+            ).fetchone()
+            quarantined, = self._conn.execute(
+                "SELECT COUNT(*) FROM api_cache_quarantine"
+            ).fetchone()
+
+        return {
+            'total': total,
+            'expired': expired,
+            'pinned': pinned,
+            'quarantined': quarantined,
+            'size_bytes': size
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Backend name (CacheConfig.cache_backend) -> implementation
+BACKENDS = {
+    'file': FileCacheBackend,
+    'json': FileCacheBackend,
+    'sqlite': SQLiteCacheBackend,
+}
+
+
+def create_backend(
+    name: str,
+    cache_dir: Path,
+    ttl: timedelta,
+    memory_map: bool = False,
+    ttl_policy: Optional[Dict[Tuple[str, str], float]] = None
+) -> CacheBackend:
+    """
+    Create a storage backend by name.
+
+    Unknown names fall back to the file backend.
+
+    Args:
+        name: Backend name ('file' or 'sqlite')
+        cache_dir: Cache directory
+        ttl: Fallback TTL for entries without a stored expiry
+        memory_map: Memory-map Parquet files when reading DataFrames
+        ttl_policy: Per-endpoint TTLs in hours keyed by (source, endpoint)
+
+    Returns:
+        CacheBackend instance
+    """
+    backend_cls = BACKENDS.get((name or '').lower())
+    if backend_cls is None:
+        logger.info(f"Cache backend '{name}' is not supported for API responses; using 'file'")
+        backend_cls = FileCacheBackend
+    return backend_cls(cache_dir, ttl, memory_map, ttl_policy)
@@ -3,6 +3,9 @@ Data cache manager for game preview data.
 
 Provides file-based JSON caching to separate data fetching from report generation.
 This enables fast iteration on report design without expensive API calls.
+
+Files are written atomically with a checksum in their cache_metadata;
+files that fail to parse or verify are moved to data/cache/quarantine.
 """
 
 import json
@@ -10,6 +13,10 @@ from pathlib import Path
 from typing import Dict, Any, Optional
 from datetime import datetime
 from config.logging_config import get_logger
+from utils.atomic_io import (
+    QUARANTINE_DIRNAME, atomic_write_json, content_checksum, count_quarantined, quarantine_file,
+    to_json_native
+)
 
 logger = get_logger(__name__)
 
@@ -26,8 +33,14 @@ class DataCache:
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.quarantine_dir = self.cache_dir / QUARANTINE_DIRNAME
         logger.info(f"Cache directory: {self.cache_dir}")
 
+    @staticmethod
+    def _checksum(data: Dict[str, Any]) -> str:
+        """Checksum of the cached data, excluding its cache metadata."""
+        return content_checksum({k: v for k, v in data.items() if k != 'cache_metadata'})
+
     def get_cache_key(self, away_team: str, home_team: str, game_date: str) -> str:
         """
         Generate cache key for a game.
@@ -82,7 +95,7 @@ class DataCache:
             game_date: Game date in YYYY-MM-DD format
 
         Returns:
-            Cached data dict or None if not found
+            Cached data dict or None if not found (or corrupt)
         """
         cache_path = self.get_cache_path(away_team, home_team, game_date)
 
@@ -93,14 +106,24 @@ class DataCache:
         try:
             with open(cache_path, 'r') as f:
                 data = json.load(f)
-
-            logger.info(f"Cache hit: {cache_path.name} (fetched at {data.get('fetched_at', 'unknown')})")
-            return data
-
         except Exception as e:
             logger.error(f"Error reading cache {cache_path}: {e}")
+            quarantine_file(cache_path, self.quarantine_dir, f"unreadable: {e}")
+            return None
+
+        if not isinstance(data, dict) or not isinstance(data.get('cache_metadata'), dict):
+            quarantine_file(cache_path, self.quarantine_dir, "not a JSON object")
+            return None
+
+        # Files written before checksums were added have none to verify
+        checksum = data['cache_metadata'].get('checksum')
+        if checksum is not None and checksum != self._checksum(data):
+            quarantine_file(cache_path, self.quarantine_dir, "checksum mismatch")
             return None
 
+        logger.info(f"Cache hit: {cache_path.name} (fetched at {data.get('fetched_at', 'unknown')})")
+        return data
+
     def set(self, away_team: str, home_team: str, game_date: str, data: Dict[str, Any]) -> Path:
         """
         Save data to cache.
@@ -123,10 +146,11 @@ class DataCache:
             'game_date': game_date,
             'fetched_at': datetime.now().isoformat()
         }
+        data['cache_metadata']['checksum'] = self._checksum(to_json_native(data))
 
         try:
-            with open(cache_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            # Temp file + rename: a killed process never leaves a truncated file
+            atomic_write_json(cache_path, data, default=None)
 
             logger.info(f"Cached data: {cache_path.name} ({cache_path.stat().st_size / 1024:.1f} KB)")
             return cache_path
@@ -156,6 +180,10 @@ class DataCache:
 
         return False
 
+    def quarantined_count(self) -> int:
+        """Number of corrupt cache files moved to quarantine."""
+        return count_quarantined(self.quarantine_dir)
+
     def list_cached_games(self) -> list[Dict[str, str]]:
         """
         List all cached games.
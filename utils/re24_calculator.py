@@ -5,13 +5,15 @@ Calculates RE24 for batters and pitchers from Statcast pitch-by-pitch data.
 RE24 measures how much a player changed run expectancy during their plate appearances.
 
 Statcast provides delta_run_exp per pitch, so we sum those per PA to get RE24.
+Pitches are read from the local Statcast warehouse.
 """
 
 from typing import Dict, List, Optional, Any
-from datetime import date
+from datetime import date, datetime, timedelta
 import pandas as pd
-from pybaseball import statcast, statcast_batter
 from config.logging_config import get_logger
+from ingestion.season_schedule import SEASON_START
+from ingestion.statcast_warehouse import get_statcast_warehouse, settled_through
 from utils.api_cache import get_api_cache
 
 logger = get_logger(__name__)
@@ -39,7 +41,7 @@ def get_game_re24(
     logger.info(f"Fetching Statcast data for {game_date}")
 
     try:
-        df = statcast(game_date, game_date)
+        df = get_statcast_warehouse().date_pitches(game_date)
     except Exception as e:
         logger.error(f"Failed to fetch Statcast data: {e}")
         return {'games': [], 'by_batter': {}}
@@ -159,69 +161,110 @@ def get_batter_season_re24(
     if not end_date:
         end_date = f"{season}-10-01"
 
-    # Check cache first
-    cache_params = {'batter_id': batter_id, 'start_date': start_date, 'end_date': end_date}
-    cached = _cache.get('statcast', 're24_season', cache_params)
-    if cached is not None:
-        logger.debug(f"Cache hit for RE24 season data: batter {batter_id}")
-        return cached
-
-    logger.info(f"Fetching season RE24 for batter {batter_id} from {start_date} to {end_date}")
+    logger.info(f"Getting season RE24 for batter {batter_id} from {start_date} to {end_date}")
 
     try:
-        df = statcast_batter(start_date, end_date, batter_id)
+        game_rows = get_batter_game_re24(batter_id, season, end_date)
     except Exception as e:
         logger.error(f"Failed to fetch batter Statcast data: {e}")
         return {'total_re24': 0, 'pa': 0, 'games': []}
 
-    if df.empty:
+    game_rows = [g for g in game_rows if start_date <= g['game_date'] <= end_date]
+    if not game_rows:
         return {'total_re24': 0, 'pa': 0, 'games': []}
 
-    # Filter nulls
-    df = df[df['delta_run_exp'].notna()].copy()
-
-    # Group by game and PA
-    pa_re24 = df.groupby(['game_pk', 'game_date', 'at_bat_number']).agg({
-        'delta_run_exp': 'sum',
-        'events': 'last'
-    }).reset_index()
-    pa_re24.rename(columns={'delta_run_exp': 're24'}, inplace=True)
-
-    # Aggregate by game
-    game_re24 = pa_re24.groupby(['game_pk', 'game_date']).agg({
-        're24': 'sum',
-        'at_bat_number': 'count'
-    }).rename(columns={'at_bat_number': 'pa'}).reset_index()
-
-    # Sort by date and add game numbers
-    game_re24['game_date'] = pd.to_datetime(game_re24['game_date'])
-    game_re24 = game_re24.sort_values('game_date')
-    game_re24['game_number'] = range(1, len(game_re24) + 1)
-    game_re24['cumulative_re24'] = game_re24['re24'].cumsum()
-
-    # Format for output
-    game_re24['game_date'] = game_re24['game_date'].dt.strftime('%Y-%m-%d')
-
+    # Rows are in date order; add game numbers and the running total
     games = []
-    for _, row in game_re24.iterrows():
+    cumulative = 0.0
+    for game_number, game in enumerate(game_rows, start=1):
+        cumulative += game['re24']
         games.append({
-            'game_number': int(row['game_number']),
-            'game_date': row['game_date'],
-            're24': round(row['re24'], 3),
-            'cumulative_re24': round(row['cumulative_re24'], 3),
-            'pa': int(row['pa'])
+            'game_number': game_number,
+            'game_date': game['game_date'],
+            're24': round(game['re24'], 3),
+            'cumulative_re24': round(cumulative, 3),
+            'pa': game['pa']
         })
 
-    result = {
-        'total_re24': round(game_re24['re24'].sum(), 3),
-        'pa': int(game_re24['pa'].sum()),
+    return {
+        'total_re24': round(cumulative, 3),
+        'pa': sum(g['pa'] for g in games),
         'games': games
     }
 
-    # Cache the result
-    _cache.set('statcast', 're24_season', cache_params, result)
 
-    return result
+def _game_re24_rows(df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Per-game RE24 and PA from a batter's pitches, in date order."""
+    # Filter nulls (automatic balls/strikes)
+    df = df[df['delta_run_exp'].notna()]
+    if df.empty:
+        return []
+
+    # Sum per PA, then per game
+    pa_re24 = df.groupby(['game_pk', 'game_date', 'at_bat_number'])['delta_run_exp'].sum().reset_index()
+    game_re24 = pa_re24.groupby(['game_pk', 'game_date']).agg(
+        re24=('delta_run_exp', 'sum'),
+        pa=('at_bat_number', 'count')
+    ).reset_index().sort_values(['game_date', 'game_pk'])
+
+    return [
+        {'game_pk': int(game_pk), 'game_date': str(game_date)[:10], 're24': float(re24), 'pa': int(pa)}
+        for game_pk, game_date, re24, pa in game_re24[['game_pk', 'game_date', 're24', 'pa']].itertuples(index=False)
+    ]
+
+
+def get_batter_game_re24(batter_id: int, season: int, end_date: str) -> List[Dict[str, Any]]:
+    """
+    Get a batter's per-game RE24 for a season, through end_date.
+
+    The per-game rows are cached per batter and season together with the
+    last settled date they cover. A later request only scans the missing
+    tail (the days since) and appends it, so a new end date each day
+    costs a scan of a few days instead of a whole season. Games on the
+    warehouse's provisional days (see settled_through()) are returned but
+    not stored, so pitches posted late are picked up on a later scan.
+
+    Args:
+        batter_id: MLB player ID
+        season: Season year
+        end_date: Last date needed (YYYY-MM-DD)
+
+    Returns:
+        List of dicts with game_pk, game_date, re24 (unrounded) and pa,
+        in date order (may extend past end_date)
+
+    Raises:
+        Exception: If the Statcast data could not be read
+    """
+    # Days that aren't over yet can't be stored (see StatcastWarehouse)
+    last_complete = (date.today() - timedelta(days=1)).isoformat()
+    through_date = min(end_date, last_complete)
+
+    cache_params = {'batter_id': batter_id, 'season': season}
+    cached = _cache.get('statcast', 're24_games', cache_params)
+    if cached is not None and cached['through_date'] >= through_date:
+        logger.debug(f"Cache hit for RE24 games: batter {batter_id} through {cached['through_date']}")
+        return cached['games']
+
+    games = cached['games'] if cached else []
+    if cached:
+        start_date = (datetime.strptime(cached['through_date'], '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
+    else:
+        start_date = f"{season}-{SEASON_START}"
+    if start_date > through_date:
+        return games
+
+    df = get_statcast_warehouse().batter_pitches(batter_id, start_date, through_date)
+    new_games = _game_re24_rows(df) if not df.empty else []
+    logger.debug(f"RE24 for batter {batter_id}: {len(new_games)} new games from {start_date} to {through_date}")
+
+    # Only settled days are stored
+    settled_date = min(through_date, settled_through())
+    if settled_date >= start_date:
+        stored = games + [g for g in new_games if g['game_date'] <= settled_date]
+        _cache.set('statcast', 're24_games', cache_params, {'through_date': settled_date, 'games': stored})
+
+    return games + new_games
 
 
 def get_team_re24_data(
@@ -1,11 +1,14 @@
 """
 Fetch real MLB season data for division race charts.
+
+The cumulative records come from the incrementally updated race store,
+so a rebuild only fetches the days since the last one.
 """
 
 import pandas as pd
 from typing import Dict
-from datetime import datetime
-from ingestion.mlb_api_client import MLBStatsAPIClient
+from ingestion.race_store import get_race_store
+from utils.team_data import get_team_id
 from config.logging_config import get_logger
 
 logger = get_logger(__name__)
@@ -22,71 +25,20 @@ def fetch_division_race_data(team_abbr: str, season: int = 2025) -> pd.DataFrame
     Returns:
         DataFrame with columns: game_number, wins, losses, games_above_500, result
     """
-    client = MLBStatsAPIClient()
-
-    # Fetch full season schedule
-    start_date = f"{season}-03-01"
-    end_date = f"{season}-10-31"
-
     logger.info(f"Fetching {season} season data for {team_abbr}")
-    schedule = client.get_schedule(
-        team=team_abbr,
-        start_date=start_date,
-        end_date=end_date
-    )
-
-    if not schedule:
-        logger.warning(f"No schedule data found for {team_abbr} in {season}")
+    races = get_race_store().race_frame(season)
+
+    if races.empty:
+        logger.warning(f"No race data found for {team_abbr} in {season}")
         return pd.DataFrame()
 
-    # Process game results
-    games = []
-    wins = 0
-    losses = 0
-    game_number = 0
-
-    for game in schedule:
-        # Skip games that haven't been played yet
-        game_type = game.get('game_type', '')
-        if game_type not in ['R', 'F']:  # R = regular season, F = final game
-            continue
-
-        status = game.get('status', '')
-        if status != 'Final' and status != 'Completed Early':
-            continue
-
-        game_number += 1
-
-        # Determine if team won
-        away_score = game.get('away_score', 0)
-        home_score = game.get('home_score', 0)
-        is_home = game.get('home_name', '').startswith(team_abbr) or game.get('home_id') == client._get_team_id(team_abbr)
-
-        if is_home:
-            won = home_score > away_score
-        else:
-            won = away_score > home_score
-
-        if won:
-            wins += 1
-            result = 'W'
-        else:
-            losses += 1
-            result = 'L'
-
-        games_above_500 = wins - losses
-
-        games.append({
-            'game_number': game_number,
-            'wins': wins,
-            'losses': losses,
-            'games_above_500': games_above_500,
-            'result': result,
-            'date': game.get('game_date', '')
-        })
-
-    df = pd.DataFrame(games)
-    logger.info(f"{team_abbr}: {wins}-{losses} ({games_above_500:+d} games above .500)")
+    df = races[races['team_id'] == get_team_id(team_abbr)].drop(columns=['team_id', 'team']).reset_index(drop=True)
+    if df.empty:
+        logger.warning(f"No completed games found for {team_abbr} in {season}")
+        return df
+
+    last = df.iloc[-1]
+    logger.info(f"{team_abbr}: {last['wins']}-{last['losses']} ({last['games_above_500']:+d} games above .500)")
 
     return df
 
@@ -102,11 +54,16 @@ def fetch_division_teams_data(division_teams: list, season: int = 2025) -> Dict[
     Returns:
         Dict mapping team abbr -> DataFrame with game-by-game records
     """
+    # One race frame covers every team; each division team is a slice of it
+    races = get_race_store().race_frame(season)
+    if races.empty:
+        logger.warning(f"No race data found for {season}")
+        return {}
+
     team_data = {}
 
-    for team in division_teams:
-        df = fetch_division_race_data(team, season)
-        if not df.empty:
-            team_data[team] = df
+    for team, df in races[races['team'].isin(division_teams)].groupby('team', sort=False):
+        team_data[team] = df.drop(columns=['team_id', 'team']).reset_index(drop=True)
 
-    return team_data
+    # Keep the caller's team order
+    return {team: team_data[team] for team in division_teams if team in team_data}
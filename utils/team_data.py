@@ -1,7 +1,14 @@
 """
 Team data utilities - logos, full names, colors, etc.
+
+This is the single team registry: abbreviations, MLB team IDs, full and
+short names and divisions are defined here once, and the reverse
+indexes (ID -> abbr, name -> abbr, abbr -> division) are built at import
+so every lookup is a dict access.
 """
 
+from typing import List, Optional
+
 # MLB team full names
 TEAM_FULL_NAMES = {
     # AL East
@@ -57,6 +64,98 @@ TEAM_IDS = {
     'LAD': 119, 'SD': 135, 'SF': 137, 'COL': 115, 'ARI': 109,
 }
 
+# Short team names (as used in headers and charts)
+TEAM_SHORT_NAMES = {
+    'NYY': 'Yankees', 'BOS': 'Red Sox', 'TB': 'Rays', 'TOR': 'Blue Jays', 'BAL': 'Orioles',
+    'CLE': 'Guardians', 'MIN': 'Twins', 'CWS': 'White Sox', 'DET': 'Tigers', 'KC': 'Royals',
+    'HOU': 'Astros', 'TEX': 'Rangers', 'SEA': 'Mariners', 'LAA': 'Angels', 'OAK': 'Athletics',
+    'ATL': 'Braves', 'PHI': 'Phillies', 'NYM': 'Mets', 'MIA': 'Marlins', 'WSH': 'Nationals',
+    'MIL': 'Brewers', 'STL': 'Cardinals', 'CHC': 'Cubs', 'CIN': 'Reds', 'PIT': 'Pirates',
+    'LAD': 'Dodgers', 'SD': 'Padres', 'SF': 'Giants', 'COL': 'Rockies', 'ARI': 'Diamondbacks',
+}
+
+# Division membership
+DIVISION_TEAMS = {
+    'AL East': ['NYY', 'BOS', 'TB', 'TOR', 'BAL'],
+    'AL Central': ['CLE', 'MIN', 'CWS', 'DET', 'KC'],
+    'AL West': ['HOU', 'TEX', 'SEA', 'LAA', 'OAK'],
+    'NL East': ['ATL', 'PHI', 'NYM', 'MIA', 'WSH'],
+    'NL Central': ['MIL', 'STL', 'CHC', 'CIN', 'PIT'],
+    'NL West': ['LAD', 'SD', 'SF', 'COL', 'ARI'],
+}
+
+# Abbreviations other sources use for the same teams
+TEAM_ABBR_ALIASES = {
+    'CHW': 'CWS', 'KCR': 'KC', 'WSN': 'WSH', 'TBR': 'TB',
+    'SDP': 'SD', 'SFG': 'SF', 'AZ': 'ARI', 'ATH': 'OAK',
+}
+
+# Reverse indexes
+TEAM_ID_TO_ABBR = {team_id: abbr for abbr, team_id in TEAM_IDS.items()}
+TEAM_DIVISIONS = {abbr: division for division, teams in DIVISION_TEAMS.items() for abbr in teams}
+TEAM_NAME_TO_ABBR = {
+    **{name: abbr for abbr, name in TEAM_SHORT_NAMES.items()},
+    **{name: abbr for abbr, name in TEAM_FULL_NAMES.items()},
+}
+
+
+def normalize_team_abbr(abbr: Optional[str]) -> Optional[str]:
+    """
+    Normalize a team abbreviation to the one used in this registry.
+
+    Args:
+        abbr: Team abbreviation in any common form (e.g., 'chw', 'KCR')
+
+    Returns:
+        Registry abbreviation (e.g., 'CWS', 'KC'); a missing abbreviation
+        (None or '') is returned as is
+    """
+    if not abbr:
+        return abbr
+    abbr = abbr.upper()
+    return TEAM_ABBR_ALIASES.get(abbr, abbr)
+
+
+def get_team_abbr(team_id: int) -> Optional[str]:
+    """
+    Get team abbreviation from MLB team ID.
+
+    Args:
+        team_id: MLB team ID (e.g., 147)
+
+    Returns:
+        Team abbreviation (e.g., 'NYY') or None if unknown
+    """
+    return TEAM_ID_TO_ABBR.get(team_id)
+
+
+def get_team_abbr_by_name(name: str) -> Optional[str]:
+    """
+    Get team abbreviation from a full or short team name.
+
+    Args:
+        name: Team name (e.g., 'New York Yankees' or 'Yankees')
+
+    Returns:
+        Team abbreviation or None if unknown
+    """
+    return TEAM_NAME_TO_ABBR.get(name)
+
+
+def get_team_short_name(abbr: str) -> str:
+    """Get short team name (e.g., 'Yankees' instead of 'New York Yankees')."""
+    return TEAM_SHORT_NAMES.get(abbr, abbr)
+
+
+def get_team_division(abbr: str) -> str:
+    """Get division name for a team (e.g., 'AL East'), or 'Unknown'."""
+    return TEAM_DIVISIONS.get(abbr, 'Unknown')
+
+
+def get_division_teams(division: str) -> List[str]:
+    """Get all teams in a division."""
+    return list(DIVISION_TEAMS.get(division, []))
+
 
 def get_team_full_name(abbr: str) -> str:
     """
@@ -101,7 +200,7 @@ def get_player_headshot_url(player_id: int) -> str:
     return f"https://img.mlbstatic.com/mlb-photos/image/upload/d_people:generic:headshot:67:current.png/w_213,q_auto:best/v1/people/{player_id}/headshot/67/current"
 
 
-def get_team_id(abbr: str) -> int:
+def get_team_id(abbr: Optional[str]) -> int:
     """
     Get MLB team ID from abbreviation.
 
@@ -109,6 +208,8 @@ def get_team_id(abbr: str) -> int:
         abbr: Team abbreviation (e.g., 'NYY')
 
     Returns:
-        MLB team ID
+        MLB team ID (0 if unknown or missing)
     """
-    return TEAM_IDS.get(abbr, 0)
+    if not abbr:
+        return 0
+    return TEAM_IDS.get(normalize_team_abbr(abbr), 0)